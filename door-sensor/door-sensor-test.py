@@ -9,27 +9,81 @@ Features:
 - Real-time event logging
 - Pass/fail results
 - Configurable GPIO pin and timeout
+- Selectable gpiozero pin factory (pigpio uses its hardware glitch filter)
+- Bounce bursts coalesced into one state change (QMK sym_defer_g style)
 """
 
 from gpiozero import Button
-from datetime import datetime
-from time import sleep
 import argparse
+import os
+import sys
+import threading
+import time
+
+
+# Preformatted callback lines, written straight to fd 1 from the callbacks
+CLOSED_MSG = "[%s] 🔒 Door CLOSED (#%d)\n".encode("utf-8")
+OPEN_MSG = "[%s] 🚪 Door OPEN (#%d)\n".encode("utf-8")
+
+
+def make_pin_factory(name):
+    """
+    Create a gpiozero pin factory by name.
+
+    Returns None for 'default', which lets gpiozero pick (lgpio on a Pi 5,
+    or whatever GPIOZERO_PIN_FACTORY names). pigpio requires the pigpiod
+    daemon and is not supported on the Pi 5.
+    """
+    if name == 'pigpio':
+        from gpiozero.pins.pigpio import PiGPIOFactory
+        return PiGPIOFactory()
+    if name == 'lgpio':
+        from gpiozero.pins.lgpio import LGPIOFactory
+        return LGPIOFactory()
+    return None
 
 
 class DoorTester:
     """MC-38 door sensor testing class."""
     
-    def __init__(self, gpio_pin: int = 23):
+    def __init__(self, gpio_pin: int = 23, bounce_time: float = 0.02, pin_factory=None):
         """Initialize door sensor tester."""
         self.gpio_pin = gpio_pin
+        self.bounce_time = bounce_time
+        self.pin_factory = pin_factory
         self.door_state = None
         self.state_changes = 0
         self.test_results = []
         
+        # Log timestamps are seconds since start; wall time is shown in the summary
+        self._t0 = time.monotonic()
+        self._start_wall = time.time()
+        
+        # Set by the callbacks once the state the current test waits for is seen
+        self._expecting = None
+        self._done = threading.Event()
+        
+        # Edges only record a pending state and restart the settle timer; the
+        # state is committed once no further edge arrives for settle_time
+        self.settle_time = 0.010
+        self._pending_state = None
+        self._stable_timer = None
+        self._timer_lock = threading.Lock()
+        
         try:
             # MC-38: HIGH when closed (wires shorted), LOW when open (wires separated)
-            self.sensor = Button(gpio_pin, pull_up=True)
+            # bounce_time filters reed contact chatter before the callbacks run
+            glitch_filter = hasattr(getattr(pin_factory, 'connection', None), 'set_glitch_filter')
+            self.sensor = Button(
+                gpio_pin,
+                pull_up=True,
+                bounce_time=None if glitch_filter else bounce_time,
+                pin_factory=pin_factory
+            )
+            if glitch_filter:
+                # pigpiod drops edges shorter than the filter in its DMA sampler,
+                # so chatter never reaches Python
+                pin_factory.connection.set_glitch_filter(gpio_pin, int(bounce_time * 1_000_000))
             print(f"[{self._timestamp()}] GPIO Pin: {gpio_pin}")
         except Exception as e:
             print(f"❌ ERROR: Failed to initialize GPIO pin {gpio_pin}")
@@ -37,8 +91,8 @@ class DoorTester:
             raise
     
     def _timestamp(self):
-        """Get formatted timestamp."""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Get seconds since the tester started."""
+        return f"{time.monotonic() - self._t0:.3f}s"
     
     def setup_callbacks(self):
         """Setup door state detection callbacks."""
@@ -48,19 +102,48 @@ class DoorTester:
     
     def _on_closed(self):
         """Callback when door closes."""
-        self.state_changes += 1
-        self.door_state = "CLOSED"
-        print(f"[{self._timestamp()}] 🔒 Door CLOSED (#{self.state_changes})")
+        self._defer("CLOSED")
     
     def _on_open(self):
         """Callback when door opens."""
+        self._defer("OPEN")
+    
+    def _defer(self, state: str):
+        """Record an edge and restart the settle timer."""
+        with self._timer_lock:
+            self._pending_state = state
+            if self._stable_timer is not None:
+                self._stable_timer.cancel()
+            self._stable_timer = threading.Timer(self.settle_time, self._commit)
+            self._stable_timer.daemon = True
+            self._stable_timer.start()
+    
+    def _commit(self):
+        """Commit the settled state after a quiet settle_time."""
+        with self._timer_lock:
+            # An edge between this timer firing and taking the lock has
+            # armed a newer timer; leave the commit to that one
+            if self._stable_timer is not threading.current_thread():
+                return
+            state = self._pending_state
+            self._stable_timer = None
+        
+        # A burst that ends where it started is not a state change
+        if state is None or state == self.door_state:
+            return
+        
         self.state_changes += 1
-        self.door_state = "OPEN"
-        print(f"[{self._timestamp()}] 🚪 Door OPEN (#{self.state_changes})")
+        self.door_state = state
+        if self._expecting == state:
+            self._done.set()
+        msg = CLOSED_MSG if state == "CLOSED" else OPEN_MSG
+        os.write(1, msg % (self._timestamp().encode(), self.state_changes))
     
     def test_door_closed(self, duration: int = 10) -> bool:
         """Test 1: Verify door closed detection."""
         self.state_changes = 0
+        self._expecting = "CLOSED"
+        self._done.clear()
         self.setup_callbacks()
         
         print("\n" + "="*60)
@@ -69,8 +152,12 @@ class DoorTester:
         print(f"[{self._timestamp()}] ⏳ Waiting {duration}s...")
         print("👉 Keep door CLOSED (wires shorted)")
         print()
+        # Callback lines bypass sys.stdout, so flush what print() buffered
+        sys.stdout.flush()
         
-        sleep(duration)
+        # Returns as soon as the expected state is reported
+        self._done.wait(timeout=duration)
+        self._expecting = None
         
         passed = self.door_state == "CLOSED" or self.state_changes == 0
         status = "✅ PASS" if passed else "❌ FAIL"
@@ -81,6 +168,8 @@ class DoorTester:
     def test_door_open(self, duration: int = 10) -> bool:
         """Test 2: Verify door open detection."""
         self.state_changes = 0
+        self._expecting = "OPEN"
+        self._done.clear()
         self.setup_callbacks()
         
         print("\n" + "="*60)
@@ -89,8 +178,12 @@ class DoorTester:
         print(f"[{self._timestamp()}] ⏳ Waiting {duration}s...")
         print("👉 Keep door OPEN (wires separated)")
         print()
+        # Callback lines bypass sys.stdout, so flush what print() buffered
+        sys.stdout.flush()
         
-        sleep(duration)
+        # Returns as soon as the expected state is reported
+        self._done.wait(timeout=duration)
+        self._expecting = None
         
         passed = self.door_state == "OPEN" or self.state_changes > 0
         status = "✅ PASS" if passed else "❌ FAIL"
@@ -103,6 +196,9 @@ class DoorTester:
         print("\n" + "="*60)
         print("TEST SUMMARY")
         print("="*60)
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self._start_wall))
+        print(f"Started: {started} (log times are seconds since start)")
+        print()
         
         for test_name, passed in self.test_results:
             status = "✅ PASS" if passed else "❌ FAIL"
@@ -165,6 +261,10 @@ class DoorTester:
     
     def cleanup(self):
         """Cleanup GPIO resources."""
+        with self._timer_lock:
+            if self._stable_timer is not None:
+                self._stable_timer.cancel()
+                self._stable_timer = None
         try:
             if self.sensor:
                 self.sensor.close()
@@ -188,11 +288,18 @@ def main():
     parser.add_argument('--gpio', type=int, default=23, help='GPIO pin (default: 23)')
     parser.add_argument('--test', type=str, default='all', help='Test to run: closed, open, or all')
     parser.add_argument('--timeout', type=int, default=10, help='Timeout per test (default: 10s)')
+    parser.add_argument('--bounce', type=float, default=0.02, help='Debounce time in seconds (default: 0.02)')
+    parser.add_argument('--pin-factory', choices=['default', 'lgpio', 'pigpio'], default='default',
+                        help='gpiozero pin factory (pigpio needs pigpiod, not available on Pi 5)')
     
     args = parser.parse_args()
     
     try:
-        tester = DoorTester(gpio_pin=args.gpio)
+        tester = DoorTester(
+            gpio_pin=args.gpio,
+            bounce_time=args.bounce,
+            pin_factory=make_pin_factory(args.pin_factory)
+        )
         
         if args.test.lower() == 'all':
             tester.run_all_tests(args.timeout)
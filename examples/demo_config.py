@@ -0,0 +1,71 @@
+"""
+Demo Config Helpers.
+
+Shared YAML loading for the demo scripts. Files are parsed with
+libyaml's CSafeLoader when PyYAML was built with it, and the parsed
+result is cached as a pickle keyed on the file's path, mtime and size,
+so repeat invocations skip YAML parsing entirely until the file changes.
+
+Author: A.R. Ansari
+Email: ansarirahim1@gmail.com
+LinkedIn: https://www.linkedin.com/in/abdul-raheem-ansari-a6871320/
+Project: Raspberry Pi Smart Monitoring Kit
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+CACHE_DIR = Path('~/.cache/yoshi').expanduser()
+
+
+def _cache_file(path: Path) -> Path:
+    """Cache file for a config path."""
+    digest = hashlib.sha1(str(path).encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{path.stem}-{digest}.pkl"
+
+
+def load_yaml(config_path):
+    """
+    Load a YAML file through the parse cache.
+
+    The cache is best-effort: unreadable or stale entries are ignored and
+    failing to write one never affects the result.
+    """
+    path = Path(config_path).resolve()
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cache_file = _cache_file(path)
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except Exception:
+        pass
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+    return data
@@ -0,0 +1,176 @@
+"""
+Demo Display Helpers.
+
+Shared display plumbing for the detection demos. Frames are shown from a
+dedicated thread so cv2.imshow/cv2.waitKey never stall the capture and
+detection loop, and status text is rendered into a small overlay band
+that is composited onto the frame in a single pass.
+
+Author: A.R. Ansari
+Email: ansarirahim1@gmail.com
+LinkedIn: https://www.linkedin.com/in/abdul-raheem-ansari-a6871320/
+Project: Raspberry Pi Smart Monitoring Kit
+"""
+
+import queue
+import threading
+
+import cv2
+import numpy as np
+
+
+class TextCache:
+    """
+    Pre-rendered OSD text strips.
+
+    Each (text, color) pair is rasterized once into a small BGR strip
+    with a boolean mask; drawing it again is a masked copy into the
+    frame instead of another cv2.putText call. Text must not be black,
+    since black pixels are treated as transparent.
+    """
+
+    def __init__(self, font=cv2.FONT_HERSHEY_SIMPLEX, scale=0.7, thickness=2, max_entries=256):
+        self.font = font
+        self.scale = scale
+        self.thickness = thickness
+        self.max_entries = max_entries
+        self._cache = {}
+
+    def _render(self, text, color):
+        """Rasterize text into a padded strip and its mask."""
+        (w, h), baseline = cv2.getTextSize(text, self.font, self.scale, self.thickness)
+        pad = self.thickness
+        glyph = np.zeros((h + baseline + 2 * pad, w + 2 * pad, 3), dtype=np.uint8)
+        cv2.putText(glyph, text, (pad, h + pad), self.font, self.scale, color, self.thickness)
+        mask = glyph.any(axis=2)
+        # Offsets from the putText origin to the strip's top-left corner
+        return glyph, mask, pad, h + pad
+
+    def draw(self, frame, text, origin, color):
+        """Blit text onto frame with its baseline-left corner at origin."""
+        key = (text, color)
+        entry = self._cache.get(key)
+        if entry is None:
+            if len(self._cache) >= self.max_entries:
+                self._cache.clear()
+            entry = self._cache[key] = self._render(text, color)
+
+        glyph, mask, dx, dy = entry
+        x0 = origin[0] - dx
+        y0 = origin[1] - dy
+        x1 = min(x0 + glyph.shape[1], frame.shape[1])
+        y1 = min(y0 + glyph.shape[0], frame.shape[0])
+        gx = max(0, -x0)
+        gy = max(0, -y0)
+        x0 = max(0, x0)
+        y0 = max(0, y0)
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        m = mask[gy:gy + y1 - y0, gx:gx + x1 - x0]
+        frame[y0:y1, x0:x1][m] = glyph[gy:gy + y1 - y0, gx:gx + x1 - x0][m]
+
+
+class OSDBanner:
+    """
+    Status text band across the top of the frame.
+
+    Text is drawn into a preallocated slab that stays cache-resident, then
+    blended onto the frame's top rows in one cv2.addWeighted pass: the
+    background is dimmed by alpha and text keeps its full color.
+
+    Usage per frame: begin(frame), text(...) for each line, apply(frame).
+    """
+
+    def __init__(self, height: int = 100, alpha: float = 0.5, text_cache=None):
+        self.height = height
+        self.alpha = alpha
+        self.text_cache = text_cache or TextCache()
+        self._slab = None
+
+    def begin(self, frame):
+        """Clear the slab, resizing it to match frame if needed."""
+        shape = (min(self.height, frame.shape[0]), frame.shape[1], 3)
+        if self._slab is None or self._slab.shape != shape:
+            self._slab = np.empty(shape, dtype=np.uint8)
+        self._slab.fill(0)
+
+    def text(self, text, origin, color, cache: bool = True):
+        """
+        Draw text into the slab (origin is in frame coordinates).
+
+        Pass cache=False for text that changes every frame, so it is
+        rasterized directly instead of churning the text cache.
+        """
+        if cache:
+            self.text_cache.draw(self._slab, text, origin, color)
+        else:
+            tc = self.text_cache
+            cv2.putText(self._slab, text, origin, tc.font, tc.scale, color, tc.thickness)
+
+    def apply(self, frame):
+        """Composite the slab onto the top of frame in place."""
+        roi = frame[:self._slab.shape[0]]
+        cv2.addWeighted(roi, 1.0 - self.alpha, self._slab, 1.0, 0, dst=roi)
+
+
+class DisplayThread(threading.Thread):
+    """
+    Show frames and read keys on a background thread.
+
+    The main loop hands frames over with show(); only the newest frame is
+    kept, so a slow display drops frames instead of blocking detection.
+    Pressing 'q' sets stop_event; any other key is queued for keys().
+    All HighGUI calls happen on this thread.
+    """
+
+    def __init__(self, window_name: str):
+        super().__init__(name="DemoDisplay", daemon=True)
+        self.window_name = window_name
+        self.stop_event = threading.Event()
+        self._frames = queue.Queue(maxsize=1)
+        self._keys = queue.Queue()
+
+    def show(self, frame):
+        """Queue frame for display, replacing any frame not yet shown."""
+        try:
+            self._frames.put_nowait(frame)
+        except queue.Full:
+            try:
+                self._frames.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._frames.put_nowait(frame)
+            except queue.Full:
+                pass
+
+    def keys(self):
+        """Yield keys pressed since the last call."""
+        while True:
+            try:
+                yield self._keys.get_nowait()
+            except queue.Empty:
+                return
+
+    def run(self):
+        while not self.stop_event.is_set():
+            try:
+                frame = self._frames.get(timeout=0.05)
+                cv2.imshow(self.window_name, frame)
+            except queue.Empty:
+                pass
+
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord('q'):
+                self.stop_event.set()
+            elif key != 0xFF:
+                self._keys.put(key)
+
+        cv2.destroyAllWindows()
+
+    def stop(self, timeout: float = 1.0):
+        """Stop the thread and close the window."""
+        self.stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
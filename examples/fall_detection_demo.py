@@ -16,14 +16,28 @@ Usage:
 
 import cv2
 import argparse
+import functools
 import time
 from pathlib import Path
 import sys
 
+# Frames between FPS refreshes (power of two so the check is a mask)
+FPS_UPDATE_INTERVAL = 32
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.detection import FallDetector, PersonState, EventLogger
+from demo_capture import open_camera, read_latest
+from demo_display import DisplayThread, OSDBanner
+
+# OSD text and color per state, built once instead of every frame
+STATE_OSD = {
+    state: (f"State: {state.value.upper()}", (0, 255, 0))
+    for state in PersonState
+}
+STATE_OSD[PersonState.FALLEN] = ("State: FALLEN", (0, 0, 255))
+STATE_OSD[PersonState.LYING] = ("State: LYING", (0, 165, 255))
 
 
 def main():
@@ -53,6 +67,23 @@ def main():
         default=10.0,
         help="Inactivity timeout in seconds (default: 10.0)"
     )
+    parser.add_argument(
+        "--proc-width",
+        type=int,
+        default=320,
+        help="Width frames are downscaled to for detection, 0 = full size (default: 320)"
+    )
+    parser.add_argument(
+        "--gray",
+        action="store_true",
+        help="Model the background on luma only (faster, ignores color-only changes)"
+    )
+    parser.add_argument(
+        "--bg-method",
+        choices=["MOG2", "MEAN"],
+        default="MOG2",
+        help="Background model; MEAN is a cheap running average for static rooms (default: MOG2)"
+    )
     parser.add_argument(
         "--no-display",
         action="store_true",
@@ -70,9 +101,12 @@ def main():
     if args.video:
         print(f"Opening video file: {args.video}")
         cap = cv2.VideoCapture(args.video)
+        read_frame = cap.read
     else:
         print("Opening webcam...")
-        cap = cv2.VideoCapture(0)
+        cap = open_camera(0)
+        # Skip frames queued while the detector was busy
+        read_frame = functools.partial(read_latest, cap)
     
     if not cap.isOpened():
         print("Error: Could not open video source")
@@ -102,22 +136,34 @@ def main():
         aspect_ratio_threshold=args.aspect_ratio,
         fall_velocity_threshold=args.velocity,
         inactivity_timeout=args.timeout,
-        fall_callback=fall_callback if args.save_events else None
+        fall_callback=fall_callback if args.save_events else None,
+        proc_width=args.proc_width or None,
+        gray=args.gray,
+        bg_method=args.bg_method
     )
     
     # Statistics
     frame_count = 0
     fall_count = 0
-    start_time = time.time()
+    falls_text = "Falls: 0"
+    start_ns = last_fps_ns = time.monotonic_ns()
+    last_fps_count = 0
     fps = 0
+
+    osd = OSDBanner()
     
     print("Starting fall detection... Press 'q' to quit")
     print("Press 's' to show statistics")
     print("Press 'r' to reset detector")
     
+    display = None
+    if not args.no_display:
+        display = DisplayThread("Fall Detection Demo")
+        display.start()
+
     try:
         while True:
-            ret, frame = cap.read()
+            ret, frame = read_frame()
             if not ret:
                 if args.video:
                     # Loop video
@@ -134,77 +180,56 @@ def main():
             
             if fall_detected:
                 fall_count += 1
+                falls_text = f"Falls: {fall_count}"
             
-            # Calculate FPS
-            elapsed = time.time() - start_time
-            if elapsed > 0:
-                fps = frame_count / elapsed
+            # Calculate FPS over the last FPS_UPDATE_INTERVAL frames
+            if frame_count & (FPS_UPDATE_INTERVAL - 1) == 0:
+                now_ns = time.monotonic_ns()
+                if now_ns > last_fps_ns:
+                    fps = (frame_count - last_fps_count) * 1e9 / (now_ns - last_fps_ns)
+                last_fps_ns, last_fps_count = now_ns, frame_count
             
             # Display
             if not args.no_display:
-                # Draw fall detection
-                display_frame = detector.draw_detection(frame, bbox, person_state)
+                # Draw fall detection onto the freshly captured frame
+                display_frame = detector.draw_detection(frame, bbox, person_state, inplace=True)
                 
-                # Draw statistics
-                cv2.putText(
-                    display_frame,
-                    f"FPS: {fps:.1f}",
-                    (10, 30),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.7,
-                    (0, 255, 0),
-                    2
-                )
-                cv2.putText(
-                    display_frame,
-                    f"Falls: {fall_count}",
-                    (10, 60),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.7,
-                    (0, 255, 0),
-                    2
-                )
+                # Draw statistics (FPS rounded so the text cache hits)
+                osd.begin(display_frame)
+                osd.text(f"FPS: {fps:.0f}", (10, 30), (0, 255, 0))
+                osd.text(falls_text, (10, 60), (0, 255, 0))
 
                 # Show state
-                state_text = f"State: {person_state.value.upper()}"
-                state_color = (0, 255, 0)
-                if person_state == PersonState.FALLEN:
-                    state_color = (0, 0, 255)
-                elif person_state == PersonState.LYING:
-                    state_color = (0, 165, 255)
-
-                cv2.putText(
-                    display_frame,
-                    state_text,
-                    (10, 90),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.7,
-                    state_color,
-                    2
-                )
-
-                cv2.imshow("Fall Detection Demo", display_frame)
-
-            # Handle keyboard input
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
+                state_text, state_color = STATE_OSD[person_state]
+                osd.text(state_text, (10, 90), state_color)
+                osd.apply(display_frame)
+
+                display.show(display_frame)
+
+            # Handle keyboard input from the display thread
+            if display is None:
+                continue
+            if display.stop_event.is_set():
                 break
-            elif key == ord('s'):
-                stats = detector.get_stats()
-                print("\n--- Statistics ---")
-                print(f"Total frames: {stats['total_frames']}")
-                print(f"Fall events: {stats['fall_count']}")
-                print(f"Current state: {stats['current_state']}")
-                print(f"FPS: {fps:.1f}")
-                if stats['fall_time']:
-                    print(f"Last fall: {time.time() - stats['fall_time']:.1f}s ago")
-                print("------------------\n")
-            elif key == ord('r'):
-                detector.reset()
-                frame_count = 0
-                fall_count = 0
-                start_time = time.time()
-                print("Detector reset")
+            for key in display.keys():
+                if key == ord('s'):
+                    stats = detector.get_stats()
+                    print("\n--- Statistics ---")
+                    print(f"Total frames: {stats['total_frames']}")
+                    print(f"Fall events: {stats['fall_count']}")
+                    print(f"Current state: {stats['current_state']}")
+                    print(f"FPS: {fps:.1f}")
+                    if stats['fall_time']:
+                        print(f"Last fall: {time.time() - stats['fall_time']:.1f}s ago")
+                    print("------------------\n")
+                elif key == ord('r'):
+                    detector.reset()
+                    frame_count = 0
+                    fall_count = 0
+                    falls_text = "Falls: 0"
+                    start_ns = last_fps_ns = time.monotonic_ns()
+                    last_fps_count = 0
+                    print("Detector reset")
 
     except KeyboardInterrupt:
         print("\nInterrupted by user")
@@ -212,14 +237,18 @@ def main():
     finally:
         # Cleanup
         cap.release()
-        cv2.destroyAllWindows()
+        if display is not None:
+            display.stop()
 
         # Final statistics
         print("\n=== Final Statistics ===")
         print(f"Total frames processed: {frame_count}")
         print(f"Fall events detected: {fall_count}")
-        print(f"Average FPS: {fps:.1f}")
+        elapsed = (time.monotonic_ns() - start_ns) / 1e9
+        average_fps = frame_count / elapsed if elapsed > 0 else 0
+        print(f"Average FPS: {average_fps:.1f}")
         if event_logger:
+            event_logger.close()
             print(f"Events logged: {event_logger.get_event_count()}")
         print("========================\n")
 
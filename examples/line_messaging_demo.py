@@ -107,7 +107,7 @@ def main():
     else:
         print("✗ Failed to send motion alert")
 
-    time.sleep(2)
+    wait_if_rate_limited(messenger)
 
     # Test 2: Alert with metadata
     print("\nTest 2: Sending fall alert with metadata...")
@@ -120,7 +120,7 @@ def main():
     else:
         print("✗ Failed to send fall alert")
 
-    time.sleep(2)
+    wait_if_rate_limited(messenger)
 
     # Test 3: Alert with snapshot (if enabled)
     if args.with_snapshot:
@@ -153,6 +153,8 @@ def main():
         else:
             print("✗ Failed to send alert with snapshot")
 
+        wait_if_rate_limited(messenger)
+
     # Test 4: Plain text message
     print("\nTest 4: Sending plain text message...")
     success = messenger.send_text("Demo completed successfully!")
@@ -174,7 +176,31 @@ def main():
     print("\nDemo complete!")
 
 
+def wait_if_rate_limited(messenger):
+    """Back off only when the LINE API reported rate limiting."""
+    if messenger.rate_limited:
+        print(f"Rate limited, waiting {messenger.retry_after:.1f}s...")
+        time.sleep(messenger.retry_after)
+
+
+# Built on first use; the test image never changes
+_TEST_IMAGE = None
+
+
 def create_test_image():
+    """
+    Return the shared test image.
+
+    The image is read-only; copy it before drawing on it.
+    """
+    global _TEST_IMAGE
+    if _TEST_IMAGE is None:
+        _TEST_IMAGE = _build_test_image()
+        _TEST_IMAGE.setflags(write=False)
+    return _TEST_IMAGE
+
+
+def _build_test_image():
     """Create a test image with text."""
     import numpy as np
 
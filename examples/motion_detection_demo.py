@@ -15,15 +15,39 @@ Usage:
 """
 
 import cv2
+import numpy as np
 import argparse
+import functools
 import time
 from pathlib import Path
 import sys
 
+# Frames between FPS refreshes (power of two so the check is a mask)
+FPS_UPDATE_INTERVAL = 32
+
+# Identical frames skip detection once motion has been quiet this long
+STATIC_SKIP_SECONDS = 0.5
+
+# Pixel stride of the frame signature grid
+SIGNATURE_STRIDE = 32
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.detection import MotionDetector, EventLogger
+from demo_capture import open_camera, read_latest
+from demo_display import DisplayThread, OSDBanner
+
+
+def frame_signature(frame: np.ndarray) -> int:
+    """
+    Cheap fingerprint of a frame.
+
+    Hashes the green channel on a coarse grid (~1/1000 of the pixels), so
+    a repeated or frozen frame can be recognized without running the
+    background subtractor.
+    """
+    return hash(frame[::SIGNATURE_STRIDE, ::SIGNATURE_STRIDE, 1].tobytes())
 
 
 def main():
@@ -41,6 +65,23 @@ def main():
         default=500,
         help="Minimum motion area in pixels (default: 500)"
     )
+    parser.add_argument(
+        "--proc-width",
+        type=int,
+        default=320,
+        help="Width frames are downscaled to for detection, 0 = full size (default: 320)"
+    )
+    parser.add_argument(
+        "--gray",
+        action="store_true",
+        help="Model the background on luma only (faster, ignores color-only changes)"
+    )
+    parser.add_argument(
+        "--gate-pixels",
+        type=int,
+        default=0,
+        help="Skip detection while at most this many pixels change per frame, 0 = off (default: 0)"
+    )
     parser.add_argument(
         "--no-display",
         action="store_true",
@@ -58,9 +99,12 @@ def main():
     if args.video:
         print(f"Opening video file: {args.video}")
         cap = cv2.VideoCapture(args.video)
+        read_frame = cap.read
     else:
         print("Opening webcam...")
-        cap = cv2.VideoCapture(0)
+        cap = open_camera(0)
+        # Skip frames queued while the detector was busy
+        read_frame = functools.partial(read_latest, cap)
     
     if not cap.isOpened():
         print("Error: Could not open video source")
@@ -81,22 +125,36 @@ def main():
     
     detector = MotionDetector(
         min_area=args.min_area,
-        motion_callback=motion_callback if args.save_events else None
+        motion_callback=motion_callback if args.save_events else None,
+        proc_width=args.proc_width or None,
+        gray=args.gray,
+        gate_pixels=args.gate_pixels or None
     )
     
     # Statistics
     frame_count = 0
     motion_count = 0
-    start_time = time.time()
+    start_ns = last_fps_ns = time.monotonic_ns()
+    last_fps_count = 0
     fps = 0
+
+    osd = OSDBanner()
+
+    last_signature = None
+    last_motion_at = 0.0
     
     print("Starting motion detection... Press 'q' to quit")
     print("Press 's' to show statistics")
     print("Press 'r' to reset detector")
     
+    display = None
+    if not args.no_display:
+        display = DisplayThread("Motion Detection Demo")
+        display.start()
+
     try:
         while True:
-            ret, frame = cap.read()
+            ret, frame = read_frame()
             if not ret:
                 if args.video:
                     # Loop video
@@ -108,92 +166,91 @@ def main():
             
             frame_count += 1
             
-            # Detect motion
-            motion_detected, bounding_boxes = detector.detect(frame)
+            # Detect motion, skipping unchanged frames in an idle scene
+            signature = frame_signature(frame)
+            if (signature == last_signature
+                    and time.monotonic() - last_motion_at > STATIC_SKIP_SECONDS):
+                motion_detected, bounding_boxes = False, []
+            else:
+                motion_detected, bounding_boxes = detector.detect(frame)
+            last_signature = signature
             
             if motion_detected:
                 motion_count += 1
+                last_motion_at = time.monotonic()
             
-            # Calculate FPS
-            elapsed = time.time() - start_time
-            if elapsed > 0:
-                fps = frame_count / elapsed
+            # Calculate FPS over the last FPS_UPDATE_INTERVAL frames
+            if frame_count & (FPS_UPDATE_INTERVAL - 1) == 0:
+                now_ns = time.monotonic_ns()
+                if now_ns > last_fps_ns:
+                    fps = (frame_count - last_fps_count) * 1e9 / (now_ns - last_fps_ns)
+                last_fps_ns, last_fps_count = now_ns, frame_count
             
             # Display
             if not args.no_display:
-                # Draw motion boxes
+                # Draw motion boxes. VideoCapture.read() hands back a fresh
+                # buffer each call, so frames are annotated in place.
+                display_frame = frame
                 if motion_detected:
-                    display_frame = detector.draw_motion(frame, bounding_boxes)
-                else:
-                    display_frame = frame.copy()
-                
-                # Draw statistics
-                cv2.putText(
-                    display_frame,
-                    f"FPS: {fps:.1f}",
-                    (10, 30),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.7,
-                    (0, 255, 0),
-                    2
-                )
-                cv2.putText(
-                    display_frame,
-                    f"Motion: {motion_count}/{frame_count}",
-                    (10, 60),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.7,
-                    (0, 255, 0),
-                    2
-                )
+                    detector.draw_motion(frame, bounding_boxes, inplace=True)
                 
+                # Draw statistics (FPS rounded so the text cache hits)
+                osd.begin(display_frame)
+                osd.text(f"FPS: {fps:.0f}", (10, 30), (0, 255, 0))
+                osd.text(f"Motion: {motion_count}/{frame_count}", (10, 60), (0, 255, 0), cache=False)
+
                 if motion_detected:
-                    cv2.putText(
-                        display_frame,
+                    osd.text(
                         f"MOTION DETECTED ({len(bounding_boxes)} objects)",
                         (10, 90),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.7,
-                        (0, 0, 255),
-                        2
+                        (0, 0, 255)
                     )
-                
-                cv2.imshow("Motion Detection Demo", display_frame)
+
+                osd.apply(display_frame)
+
+                display.show(display_frame)
             
-            # Handle keyboard input
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
+            # Handle keyboard input from the display thread
+            if display is None:
+                continue
+            if display.stop_event.is_set():
                 break
-            elif key == ord('s'):
-                stats = detector.get_stats()
-                print("\n--- Statistics ---")
-                print(f"Total frames: {stats['total_frames']}")
-                print(f"Motion events: {stats['motion_count']}")
-                print(f"FPS: {fps:.1f}")
-                if stats['last_motion_time']:
-                    print(f"Last motion: {time.time() - stats['last_motion_time']:.1f}s ago")
-                print("------------------\n")
-            elif key == ord('r'):
-                detector.reset()
-                frame_count = 0
-                motion_count = 0
-                start_time = time.time()
-                print("Detector reset")
-    
+            for key in display.keys():
+                if key == ord('s'):
+                    stats = detector.get_stats()
+                    print("\n--- Statistics ---")
+                    print(f"Total frames: {stats['total_frames']}")
+                    print(f"Motion events: {stats['motion_count']}")
+                    print(f"FPS: {fps:.1f}")
+                    if stats['last_motion_time']:
+                        print(f"Last motion: {time.time() - stats['last_motion_time']:.1f}s ago")
+                    print("------------------\n")
+                elif key == ord('r'):
+                    detector.reset()
+                    frame_count = 0
+                    motion_count = 0
+                    start_ns = last_fps_ns = time.monotonic_ns()
+                    last_fps_count = 0
+                    print("Detector reset")
+
     except KeyboardInterrupt:
         print("\nInterrupted by user")
     
     finally:
         # Cleanup
         cap.release()
-        cv2.destroyAllWindows()
+        if display is not None:
+            display.stop()
         
         # Final statistics
         print("\n=== Final Statistics ===")
         print(f"Total frames processed: {frame_count}")
         print(f"Motion events detected: {motion_count}")
-        print(f"Average FPS: {fps:.1f}")
+        elapsed = (time.monotonic_ns() - start_ns) / 1e9
+        average_fps = frame_count / elapsed if elapsed > 0 else 0
+        print(f"Average FPS: {average_fps:.1f}")
         if event_logger:
+            event_logger.close()
             print(f"Events logged: {event_logger.get_event_count()}")
         print("========================\n")
 
@@ -11,6 +11,7 @@ Project: Raspberry Pi Smart Monitoring Kit
 
 Usage:
     python examples/ota_demo.py --check
+    python examples/ota_demo.py check --force
     python examples/ota_demo.py --update
     python examples/ota_demo.py --status
     python examples/ota_demo.py --version
@@ -18,14 +19,24 @@ Usage:
 
 import sys
 import os
+import select
 import argparse
-import yaml
 import logging
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.ota import OTAUpdater, VersionManager  # noqa: E402
+# src.ota (and requests) and the YAML loader are imported by the command handlers
+# that need them, so --help and argument errors return immediately
+
+SEPARATOR = "=" * 50
+
+# Seconds to wait for an answer to the update prompt
+CONFIRM_TIMEOUT = 30
+
+# Shared across commands so one process uses a single config and updater
+_config = None
+_updater = None
 
 
 def setup_logging():
@@ -38,43 +49,94 @@ def setup_logging():
 
 def load_config():
     """Load OTA configuration."""
+    global _config
+
+    if _config is not None:
+        return _config
+
     config_path = Path('config/ota_config.yaml')
 
     if not config_path.exists():
         print(f"Error: Configuration file not found: {config_path}")
         sys.exit(1)
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    from demo_config import load_yaml
+
+    config = load_yaml(config_path)
 
     github_repo = os.getenv('GITHUB_REPO')
     if github_repo:
         config['github_repo'] = github_repo
 
+    _config = config
     return config
 
 
+def get_updater():
+    """Get the OTAUpdater shared by all commands."""
+    global _updater
+
+    if _updater is None:
+        from src.ota import OTAUpdater
+        _updater = OTAUpdater(load_config())
+    return _updater
+
+
+def write_report(lines):
+    """Write report lines to stdout in a single write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _confirm(prompt, timeout=CONFIRM_TIMEOUT):
+    """
+    Ask for yes/no confirmation on stdin.
+
+    Waits at most timeout seconds for an answer, so a headless run (no
+    TTY, or nobody at the keyboard) declines instead of hanging.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+
+    try:
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    except (OSError, ValueError):
+        return False
+
+    if not ready:
+        print("\nNo response, assuming 'no'")
+        return False
+
+    return sys.stdin.readline().strip().lower() in ('yes', 'y')
+
+
 def check_version(args):
     """Display current version."""
+    from src.ota import VersionManager
+
     try:
         vm = VersionManager()
         current = vm.get_current_version()
 
-        print("\n" + "=" * 50)
-        print("VERSION INFORMATION")
-        print("=" * 50)
-        print(f"Current Version: {current}")
-
         major, minor, patch = vm.parse_version(current)
-        print(f"  Major: {major}")
-        print(f"  Minor: {minor}")
-        print(f"  Patch: {patch}")
-
-        print("\nNext Versions:")
-        print(f"  Next Patch: {vm.get_next_version(current, 'patch')}")
-        print(f"  Next Minor: {vm.get_next_version(current, 'minor')}")
-        print(f"  Next Major: {vm.get_next_version(current, 'major')}")
-        print("=" * 50 + "\n")
+
+        write_report([
+            "",
+            SEPARATOR,
+            "VERSION INFORMATION",
+            SEPARATOR,
+            f"Current Version: {current}",
+            f"  Major: {major}",
+            f"  Minor: {minor}",
+            f"  Patch: {patch}",
+            "",
+            "Next Versions:",
+            f"  Next Patch: {vm.get_next_version(current, 'patch')}",
+            f"  Next Minor: {vm.get_next_version(current, 'minor')}",
+            f"  Next Major: {vm.get_next_version(current, 'major')}",
+            SEPARATOR,
+            "",
+        ])
 
     except Exception as e:
         print(f"Error: {e}")
@@ -85,36 +147,45 @@ def check_updates(args):
     """Check for available updates."""
     try:
         config = load_config()
-        updater = OTAUpdater(config)
-
-        print("\n" + "=" * 50)
-        print("CHECKING FOR UPDATES")
-        print("=" * 50)
-        print(f"Repository: {config['github_repo']}")
+        updater = get_updater()
 
-        vm = VersionManager()
+        vm = updater.version_manager
         current = vm.get_current_version()
-        print(f"Current Version: {current}")
-
-        print("\nChecking GitHub releases...")
-
-        if updater.check_for_updates():
-            print(f"\nUpdate Available: {updater._latest_version}")
-            print(f"Release Name: {updater._latest_release.get('name', 'N/A')}")
-            print(f"Published: {updater._latest_release.get('published_at', 'N/A')}")
-
-            body = updater._latest_release.get('body', '')
-            if body:
-                print("\nChangelog:")
-                print("-" * 50)
-                print(body[:500])
-                if len(body) > 500:
-                    print("...")
+
+        # Header goes out before the (possibly slow) network check
+        write_report([
+            "",
+            SEPARATOR,
+            "CHECKING FOR UPDATES",
+            SEPARATOR,
+            f"Repository: {config['github_repo']}",
+            f"Current Version: {current}",
+            "",
+            "Checking GitHub releases...",
+        ])
+
+        if updater.check_for_updates(force=args.force):
+            lines = [
+                "",
+                f"Update Available: {updater._latest_version}",
+                f"Release Name: {updater._latest_release.get('name', 'N/A')}",
+                f"Published: {updater._latest_release.get('published_at', 'N/A')}",
+            ]
+
+            notes, truncated = updater.get_release_notes(max_chars=500)
+            if notes:
+                lines += ["", "Changelog:", "-" * 50, notes]
+                if truncated:
+                    lines.append("...")
         else:
-            print("\nNo updates available")
-            print("You are running the latest version")
+            lines = [
+                "",
+                "No updates available",
+                "You are running the latest version",
+            ]
 
-        print("=" * 50 + "\n")
+        lines += [SEPARATOR, ""]
+        write_report(lines)
 
     except Exception as e:
         print(f"Error: {e}")
@@ -124,15 +195,15 @@ def check_updates(args):
 def apply_update(args):
     """Apply available update."""
     try:
-        config = load_config()
-        config['auto_update'] = False
-        updater = OTAUpdater(config)
+        updater = get_updater()
+        updater.auto_update = False
 
         print("\n" + "=" * 50)
         print("APPLYING UPDATE")
         print("=" * 50)
 
-        if not updater.check_for_updates():
+        # Reuse a release already found by check_updates in this process
+        if not updater._update_available and not updater.check_for_updates():
             print("No updates available")
             print("=" * 50 + "\n")
             return
@@ -140,8 +211,7 @@ def apply_update(args):
         print(f"Update Version: {updater._latest_version}")
 
         if not args.yes:
-            response = input("\nProceed with update? (yes/no): ")
-            if response.lower() not in ['yes', 'y']:
+            if not _confirm("\nProceed with update? (yes/no): "):
                 print("Update cancelled")
                 print("=" * 50 + "\n")
                 return
@@ -166,26 +236,31 @@ def show_status(args):
     """Show OTA system status."""
     try:
         config = load_config()
-        updater = OTAUpdater(config)
+        updater = get_updater()
 
         status = updater.get_status()
 
-        print("\n" + "=" * 50)
-        print("OTA SYSTEM STATUS")
-        print("=" * 50)
-        print(f"Current Version: {status['current_version']}")
-        print(f"Update Available: {status['update_available']}")
-        print(f"Latest Version: {status['latest_version'] or 'N/A'}")
-        print(f"Last Check: {status['last_check'] or 'Never'}")
-        print(f"Auto Update: {status['auto_update']}")
-        print(f"Running: {status['running']}")
-        print("\nConfiguration:")
-        print(f"  Repository: {config['github_repo']}")
-        print(f"  Check Interval: {config['check_interval']}s")
-        print(f"  Backup Enabled: {config['backup_enabled']}")
-        print(f"  Backup Path: {config['backup_path']}")
-        print(f"  Max Backups: {config['max_backups']}")
-        print("=" * 50 + "\n")
+        write_report([
+            "",
+            SEPARATOR,
+            "OTA SYSTEM STATUS",
+            SEPARATOR,
+            f"Current Version: {status['current_version']}",
+            f"Update Available: {status['update_available']}",
+            f"Latest Version: {status['latest_version'] or 'N/A'}",
+            f"Last Check: {status['last_check'] or 'Never'}",
+            f"Auto Update: {status['auto_update']}",
+            f"Running: {status['running']}",
+            "",
+            "Configuration:",
+            f"  Repository: {config['github_repo']}",
+            f"  Check Interval: {config['check_interval']}s",
+            f"  Backup Enabled: {config['backup_enabled']}",
+            f"  Backup Path: {config['backup_path']}",
+            f"  Max Backups: {config['max_backups']}",
+            SEPARATOR,
+            "",
+        ])
 
     except Exception as e:
         print(f"Error: {e}")
@@ -201,13 +276,20 @@ def main():
 
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
-    subparsers.add_parser('version', help='Show current version')
-    subparsers.add_parser('check', help='Check for updates')
+    version_parser = subparsers.add_parser('version', help='Show current version')
+    version_parser.set_defaults(func=check_version)
+
+    check_parser = subparsers.add_parser('check', help='Check for updates')
+    check_parser.add_argument('--force', action='store_true',
+                              help='Bypass the release cache')
+    check_parser.set_defaults(func=check_updates)
 
     update_parser = subparsers.add_parser('update', help='Apply update')
     update_parser.add_argument('-y', '--yes', action='store_true', help='Skip confirmation')
+    update_parser.set_defaults(func=apply_update)
 
-    subparsers.add_parser('status', help='Show OTA status')
+    status_parser = subparsers.add_parser('status', help='Show OTA status')
+    status_parser.set_defaults(func=show_status)
 
     args = parser.parse_args()
 
@@ -216,15 +298,7 @@ def main():
         sys.exit(1)
 
     setup_logging()
-
-    if args.command == 'version':
-        check_version(args)
-    elif args.command == 'check':
-        check_updates(args)
-    elif args.command == 'update':
-        apply_update(args)
-    elif args.command == 'status':
-        show_status(args)
+    args.func(args)
 
 
 if __name__ == '__main__':
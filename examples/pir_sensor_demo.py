@@ -18,8 +18,16 @@ Wiring:
 
 import sys
 import time
+import select
 import argparse
-from datetime import datetime
+import threading
+
+try:
+    import gpiod
+    from gpiod.line import Direction, Edge, Value
+    GPIOD_AVAILABLE = True
+except ImportError:
+    GPIOD_AVAILABLE = False
 
 # Add parent directory to path for imports
 sys.path.insert(0, '..')
@@ -31,6 +39,14 @@ from src.sensors.motion import (
     TriggerMode
 )
 
+# State change messages; only the timestamp is formatted per event
+STATE_MESSAGES = {
+    MotionState.MOTION_DETECTED: "🚨 Motion detected!",
+    MotionState.NO_MOTION: "✓  No motion",
+}
+
+GPIO_CHIP = "/dev/gpiochip0"
+
 
 def on_motion_detected(event: MotionEvent) -> None:
     """Callback function for motion events."""
@@ -41,14 +57,105 @@ def on_motion_detected(event: MotionEvent) -> None:
         print(f"✓  Motion ended at {event.timestamp.strftime('%H:%M:%S')}{duration}")
 
 
+def request_edge_line(gpio_pin: int):
+    """
+    Request a GPIO line with kernel edge detection (libgpiod v2).
+
+    Returns:
+        gpiod line request whose fd becomes readable on every edge, or
+        None if libgpiod is not installed or the line cannot be requested
+    """
+    if not GPIOD_AVAILABLE:
+        return None
+
+    settings = gpiod.LineSettings(direction=Direction.INPUT, edge_detection=Edge.BOTH)
+    try:
+        return gpiod.request_lines(GPIO_CHIP, consumer="pir-demo", config={gpio_pin: settings})
+    except OSError:
+        return None
+
+
+def to_motion_state(active: bool) -> MotionState:
+    """Map a PIR output level to a motion state."""
+    return MotionState.MOTION_DETECTED if active else MotionState.NO_MOTION
+
+
+def now_hms() -> str:
+    """Current local time as HH:MM:SS."""
+    return time.strftime('%H:%M:%S')
+
+
+def print_state_change(state: MotionState) -> None:
+    """Print a timestamped motion state line."""
+    print(f"[{now_hms()}] {STATE_MESSAGES[state]}")
+
+
 def demo_polling_mode(sensor: MotionSensor, duration: int = 30) -> None:
-    """Demonstrate polling-based motion detection."""
+    """
+    Demonstrate polling-based motion detection.
+
+    Blocks in epoll on a libgpiod line request, so the loop only wakes
+    for real level changes and for the once-per-second status dot. Falls
+    back to sampling the sensor every second if the line cannot be
+    requested through libgpiod.
+    """
     print("\n" + "=" * 60)
     print("POLLING MODE DEMO")
     print("=" * 60)
     print(f"Monitoring for {duration} seconds...")
     print("Move in front of the sensor to test detection.\n")
 
+    request = request_edge_line(sensor.gpio_pin)
+    if request is None:
+        print("(libgpiod edge detection unavailable, sampling once per second)")
+        _poll_with_sleep(sensor, duration)
+    else:
+        try:
+            _poll_with_epoll(request, sensor.gpio_pin, duration)
+        finally:
+            request.release()
+
+    print(f"\n\nPolling demo complete. Detected {len(sensor.get_event_history())} events.")
+
+
+def _poll_with_epoll(request, gpio_pin: int, duration: int) -> None:
+    """Wait for edges on a line request until duration has elapsed."""
+    ep = select.epoll()
+    ep.register(request.fd, select.EPOLLIN)
+    rising = gpiod.EdgeEvent.Type.RISING_EDGE
+
+    try:
+        last_state = to_motion_state(request.get_value(gpio_pin) == Value.ACTIVE)
+        if last_state != MotionState.NO_MOTION:
+            print_state_change(last_state)
+
+        start_time = time.monotonic()
+        deadline = start_time + duration
+        next_dot = start_time + 1
+
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+
+            if ep.poll(min(deadline, next_dot) - now):
+                for event in request.read_edge_events():
+                    current_state = to_motion_state(event.event_type == rising)
+                    if current_state != last_state:
+                        print_state_change(current_state)
+                        last_state = current_state
+
+            # Show status dot every second
+            if time.monotonic() >= next_dot:
+                sys.stdout.write(".")
+                sys.stdout.flush()
+                next_dot += 1
+    finally:
+        ep.close()
+
+
+def _poll_with_sleep(sensor: MotionSensor, duration: int) -> None:
+    """Sample the sensor once per second until duration has elapsed."""
     start_time = time.time()
     last_state = MotionState.NO_MOTION
 
@@ -56,10 +163,7 @@ def demo_polling_mode(sensor: MotionSensor, duration: int = 30) -> None:
         current_state = sensor.read()
 
         if current_state != last_state:
-            if current_state == MotionState.MOTION_DETECTED:
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] 🚨 Motion detected!")
-            else:
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] ✓  No motion")
+            print_state_change(current_state)
             last_state = current_state
 
         # Show status dot every second
@@ -67,25 +171,42 @@ def demo_polling_mode(sensor: MotionSensor, duration: int = 30) -> None:
         sys.stdout.flush()
         time.sleep(1)
 
-    print(f"\n\nPolling demo complete. Detected {len(sensor.get_event_history())} events.")
 
+def demo_interrupt_mode(sensor: MotionSensor, duration: int = 30, max_events: int = 0) -> None:
+    """
+    Demonstrate interrupt-driven motion detection.
 
-def demo_interrupt_mode(sensor: MotionSensor, duration: int = 30) -> None:
-    """Demonstrate interrupt-driven motion detection."""
+    Waits on an Event set from the GPIO callback, so the demo ends as soon
+    as max_events events have fired (0 = run for the full duration).
+    """
     print("\n" + "=" * 60)
     print("INTERRUPT MODE DEMO")
     print("=" * 60)
     print(f"Monitoring for {duration} seconds using GPIO interrupts...")
     print("Move in front of the sensor to test detection.\n")
 
+    done = threading.Event()
+    event_count = 0
+    user_callback = sensor.callback
+
+    def counting_callback(event: MotionEvent) -> None:
+        nonlocal event_count
+        if user_callback:
+            user_callback(event)
+        event_count += 1
+        if max_events and event_count >= max_events:
+            done.set()
+
+    sensor.callback = counting_callback
     sensor.start_monitoring(use_interrupt=True)
 
     try:
-        time.sleep(duration)
+        done.wait(duration)
     except KeyboardInterrupt:
         pass
-
-    sensor.stop_monitoring()
+    finally:
+        sensor.stop_monitoring()
+        sensor.callback = user_callback
 
     events = sensor.get_event_history()
     print(f"\n\nInterrupt demo complete. Captured {len(events)} events.")
@@ -121,6 +242,8 @@ Examples:
     python pir_sensor_demo.py --gpio 27          # Use GPIO27 instead
     python pir_sensor_demo.py --mode polling     # Polling mode only
     python pir_sensor_demo.py --mode interrupt   # Interrupt mode only
+    python pir_sensor_demo.py --mode interrupt --max-events 1
+                                                 # Stop after the first event
     python pir_sensor_demo.py --wiring           # Show wiring diagram
         """
     )
@@ -130,6 +253,8 @@ Examples:
                        default="all", help="Demo mode to run")
     parser.add_argument("--duration", type=int, default=30,
                        help="Duration for each demo in seconds")
+    parser.add_argument("--max-events", type=int, default=0,
+                       help="End interrupt demo after N events (0 = no limit)")
     parser.add_argument("--wiring", action="store_true",
                        help="Show wiring diagram and exit")
     args = parser.parse_args()
@@ -142,6 +267,7 @@ Examples:
     print("=" * 60)
     print("   HC-SR501 PIR Motion Sensor Demo")
     print("   Raspberry Pi Smart Monitoring Kit")
+    print("   (run with --wiring for the wiring diagram)")
     print("=" * 60)
 
     # Create sensor instance
@@ -152,9 +278,6 @@ Examples:
         callback=on_motion_detected
     )
 
-    # Show wiring diagram
-    print(sensor.get_wiring_diagram())
-
     # Initialize sensor
     print(f"\nInitializing sensor on GPIO{args.gpio}...")
     if not sensor.initialize():
@@ -174,7 +297,7 @@ Examples:
             sensor.clear_history()
 
         if args.mode in ["interrupt", "all"]:
-            demo_interrupt_mode(sensor, args.duration)
+            demo_interrupt_mode(sensor, args.duration, args.max_events)
             sensor.clear_history()
 
         if args.mode in ["wait", "all"]:
@@ -17,7 +17,6 @@ Usage:
 import sys
 import os
 import argparse
-import yaml
 import logging
 import time
 from pathlib import Path
@@ -25,6 +24,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.voice import VoiceAlertPlayer  # noqa: E402
+from demo_config import load_yaml  # noqa: E402
 
 
 def setup_logging():
@@ -47,9 +47,8 @@ def load_config(config_file: str = 'config/voice_config.yaml'):
             'trigger_on_motion': False
         }
 
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
-        return config.get('voice', {})
+    config = load_yaml(config_file)
+    return config.get('voice', {})
 
 
 def test_audio(player: VoiceAlertPlayer):
@@ -73,8 +72,7 @@ def test_audio(player: VoiceAlertPlayer):
     if result:
         print("Alert played successfully!")
 
-        while player.is_playing():
-            time.sleep(0.1)
+        player.wait_playback_done(timeout=30)
 
         print("Playback complete.")
     else:
@@ -95,8 +93,7 @@ def play_alert(player: VoiceAlertPlayer, event_type: str):
     if result:
         print(f"{event_type.capitalize()} alert triggered!")
 
-        while player.is_playing():
-            time.sleep(0.1)
+        player.wait_playback_done(timeout=30)
 
         print("Playback complete.")
     else:
@@ -110,10 +107,8 @@ def set_volume(player: VoiceAlertPlayer, level: float):
         print(f"Volume set to {level}")
 
         print("\nPlaying test alert at new volume...")
-        player.play_alert('fall')
-
-        while player.is_playing():
-            time.sleep(0.1)
+        if player.play_alert('fall'):
+            player.wait_playback_done(timeout=30)
 
     except ValueError as e:
         print(f"Error: {e}")
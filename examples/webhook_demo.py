@@ -11,7 +11,8 @@ Project: Raspberry Pi Smart Monitoring Kit
 
 import os
 import sys
-import time
+import signal
+import threading
 from dotenv import load_dotenv
 
 # Add parent directory to path
@@ -79,7 +80,7 @@ def main():
 
     # Start server
     logger.info("Starting webhook server on http://0.0.0.0:5000")
-    webhook.start()
+    webhook.start_async()
 
     logger.info("=" * 60)
     logger.info("Webhook server is running!")
@@ -100,14 +101,15 @@ def main():
     logger.info("Press Ctrl+C to stop")
     logger.info("=" * 60)
 
-    # Keep running
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("\nShutting down...")
-        webhook.stop()
-        logger.info("Webhook server stopped")
+    # Sleep until SIGINT/SIGTERM instead of waking every second
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    stop.wait()
+
+    logger.info("\nShutting down...")
+    webhook.stop()
+    logger.info("Webhook server stopped")
 
 
 if __name__ == "__main__":
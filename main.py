@@ -13,10 +13,13 @@ Client: Yoshinori Ueda
 Project: Raspberry Pi Smart Monitoring Kit
 """
 
+import os
 import sys
+import queue
+import importlib
 import signal
-import time
 import logging
+import threading
 from pathlib import Path
 
 # Add src to path
@@ -34,9 +37,11 @@ class MonitoringSystem:
         self.logger = setup_logger("MonitoringSystem")
         self.config = ConfigLoader(config_path)
         self.running = False
+        self._stop = threading.Event()
         
         # Components (will be initialized in setup)
         self.rtsp_handler = None
+        self.frame_q = None
         self.motion_detector = None
         self.fall_detector = None
         self.line_messenger = None
@@ -53,60 +58,80 @@ class MonitoringSystem:
         self.logger.info("Setting up monitoring system...")
         
         try:
-            # Import components
+            # Core components are always needed
             from rtsp import RTSPStreamHandler
-            from detection import MotionDetector, FallDetector
-            from line_api import LINEMessenger, WebhookServer
-            from ota import OTAUpdater
-            from voice import VoiceAlertPlayer
-            from pan_tilt import PanTiltController, AutoTracker
+            from line_api import LINEMessenger
             
             # Initialize RTSP handler
             self.logger.info("Initializing RTSP stream handler...")
-            self.rtsp_handler = RTSPStreamHandler(self.config.get("camera"))
+            self.rtsp_handler = RTSPStreamHandler(self.config.section("camera"))
+            self.frame_q = self.rtsp_handler.frame_queue
             
-            # Initialize detectors
-            if self.config.get("motion_detection.enabled"):
+            # Optional components are imported only when enabled, so their
+            # dependencies (cv2 models, pygame, GPIO) are not loaded otherwise
+            motion_cfg = self.config.section("motion_detection")
+            if motion_cfg.get("enabled"):
                 self.logger.info("Initializing motion detector...")
-                self.motion_detector = MotionDetector(self.config.get("motion_detection"))
+                MotionDetector = self._import_optional("detection", "MotionDetector")
+                if MotionDetector:
+                    self.motion_detector = MotionDetector(motion_cfg)
             
-            if self.config.get("fall_detection.enabled"):
+            fall_cfg = self.config.section("fall_detection")
+            if fall_cfg.get("enabled"):
                 self.logger.info("Initializing fall detector...")
-                self.fall_detector = FallDetector(self.config.get("fall_detection"))
+                FallDetector = self._import_optional("detection", "FallDetector")
+                if FallDetector:
+                    self.fall_detector = FallDetector(fall_cfg)
             
             # Initialize LINE messenger
             self.logger.info("Initializing LINE messenger...")
-            self.line_messenger = LINEMessenger(self.config.get("line"))
+            self.line_messenger = LINEMessenger(self.config.section("line"))
             
             # Initialize webhook server
-            if self.config.get("webhook.enabled"):
+            webhook_cfg = self.config.section("webhook")
+            if webhook_cfg.get("enabled"):
                 self.logger.info("Initializing webhook server...")
-                self.webhook_server = WebhookServer(
-                    self.config.get("webhook"),
-                    self.on_webhook_command
-                )
+                WebhookServer = self._import_optional("line_api", "WebhookServer")
+                if WebhookServer:
+                    self.webhook_server = WebhookServer(
+                        webhook_cfg,
+                        self.on_webhook_command,
+                        cpu_affinity=self._affinity("webhook")
+                    )
             
             # Initialize OTA updater
-            if self.config.get("ota.enabled"):
+            ota_cfg = self.config.section("ota")
+            if ota_cfg.get("enabled"):
                 self.logger.info("Initializing OTA updater...")
-                self.ota_updater = OTAUpdater(self.config.get("ota"))
+                OTAUpdater = self._import_optional("ota", "OTAUpdater")
+                if OTAUpdater:
+                    self.ota_updater = OTAUpdater(ota_cfg)
             
             # Initialize voice player
-            if self.config.get("voice.enabled"):
+            voice_cfg = self.config.section("voice")
+            if voice_cfg.get("enabled"):
                 self.logger.info("Initializing voice alert player...")
-                self.voice_player = VoiceAlertPlayer(self.config.get("voice"))
+                VoiceAlertPlayer = self._import_optional("voice", "VoiceAlertPlayer")
+                if VoiceAlertPlayer:
+                    self.voice_player = VoiceAlertPlayer(voice_cfg)
             
             # Initialize pan-tilt controller
-            if self.config.get("pan_tilt.enabled"):
+            pan_tilt_cfg = self.config.section("pan_tilt")
+            if pan_tilt_cfg.get("enabled"):
                 self.logger.info("Initializing pan-tilt controller...")
-                self.pan_tilt_controller = PanTiltController(self.config.get("pan_tilt"))
+                PanTiltController = self._import_optional("pan_tilt", "PanTiltController")
+                if PanTiltController:
+                    self.pan_tilt_controller = PanTiltController(pan_tilt_cfg)
                 
-                if self.config.get("auto_tracking.enabled"):
+                tracking_cfg = self.config.section("auto_tracking")
+                if self.pan_tilt_controller and tracking_cfg.get("enabled"):
                     self.logger.info("Initializing auto tracker...")
-                    self.auto_tracker = AutoTracker(
-                        self.config.get("auto_tracking"),
-                        self.pan_tilt_controller
-                    )
+                    AutoTracker = self._import_optional("pan_tilt", "AutoTracker")
+                    if AutoTracker:
+                        self.auto_tracker = AutoTracker(
+                            tracking_cfg,
+                            self.pan_tilt_controller
+                        )
             
             self.logger.info("All components initialized successfully")
             
@@ -114,6 +139,36 @@ class MonitoringSystem:
             self.logger.error(f"Failed to setup components: {e}", exc_info=True)
             raise
     
+    def _affinity(self, role: str):
+        """Get the configured CPU set for a role, or None"""
+        cpus = (self.config.get("system.cpu_affinity") or {}).get(role)
+        return set(cpus) if cpus else None
+    
+    def _pin_frame_loop(self):
+        """Pin the main frame loop to its CPUs and raise its priority"""
+        cpus = self._affinity("frame_loop")
+        if cpus:
+            try:
+                os.sched_setaffinity(0, cpus)
+                self.logger.info(f"Frame loop pinned to CPUs {sorted(cpus)}")
+            except (AttributeError, OSError) as e:
+                self.logger.warning(f"Could not set frame loop CPU affinity: {e}")
+        
+        nice = self.config.get("system.frame_loop_nice")
+        if nice:
+            try:
+                os.nice(int(nice))
+            except (AttributeError, OSError) as e:
+                self.logger.warning(f"Could not change frame loop priority: {e}")
+    
+    def _import_optional(self, module: str, name: str):
+        """Import an optional component, returning None if unavailable"""
+        try:
+            return getattr(importlib.import_module(module), name)
+        except (ImportError, AttributeError) as e:
+            self.logger.warning(f"{name} unavailable, skipping: {e}")
+            return None
+    
     def on_webhook_command(self, command: str):
         """Handle webhook commands from LINE"""
         self.logger.info(f"Received webhook command: {command}")
@@ -146,25 +201,32 @@ class MonitoringSystem:
         self.logger.info("Starting monitoring system...")
         self.running = True
         
+        # Threads started below inherit this placement unless they set their own
+        self._pin_frame_loop()
+        
         try:
             # Start webhook server in background
             if self.webhook_server:
-                self.webhook_server.start()
+                self.webhook_server.start_async()
+            
+            # Decode frames on the stream thread
+            self.rtsp_handler.start()
             
             # Main processing loop
-            while self.running:
-                # Get frame from RTSP stream
-                frame = self.rtsp_handler.get_frame()
+            while self.running and not self._stop.is_set():
+                # Block until the stream thread delivers a frame
+                try:
+                    frame = self.frame_q.get(timeout=1.0)
+                except queue.Empty:
+                    continue
                 
+                # None is pushed when the stream stops
                 if frame is None:
-                    time.sleep(0.1)
                     continue
                 
                 # Process frame through detectors
                 # (Actual implementation will be in milestone branches)
                 
-                time.sleep(0.01)  # Small delay to prevent CPU overload
-                
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt")
         except Exception as e:
@@ -177,26 +239,39 @@ class MonitoringSystem:
         self.logger.info("Shutting down monitoring system...")
         self.running = False
         
+        if self.rtsp_handler:
+            self.rtsp_handler.stop()
+        
         # Cleanup components
         # (Implementation in milestone branches)
         
         self.logger.info("Shutdown complete")
 
 
-def signal_handler(signum, frame):
-    """Handle system signals"""
-    print("\nReceived signal to terminate. Shutting down...")
-    sys.exit(0)
+    def stop(self):
+        """Request the main loop to exit (safe to call from a signal handler)"""
+        self._stop.set()
+
+
+def make_signal_handler(system: MonitoringSystem):
+    """Create a handler that stops the system on SIGINT/SIGTERM"""
+    def signal_handler(signum, frame):
+        """Handle system signals"""
+        print("\nReceived signal to terminate. Shutting down...")
+        system.stop()
+    return signal_handler
 
 
 def main():
     """Main entry point"""
-    # Setup signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
-    # Create and run monitoring system
+    # Create monitoring system
     system = MonitoringSystem()
+    
+    # Setup signal handlers; run() returns and shuts down cleanly on signal
+    handler = make_signal_handler(system)
+    signal.signal(signal.SIGINT, handler)
+    signal.signal(signal.SIGTERM, handler)
+    
     system.setup()
     system.run()
 
@@ -16,15 +16,23 @@ Usage:
     python pir_test.py --test idle
     python pir_test.py --test motion
     python pir_test.py --test all
+    python pir_test.py --pin-factory pigpio
+    python pir_test.py --backend libgpiod
+    python pir_test.py --backend sysfs
 
 Requires:
     pip install gpiozero
+    libgpiod backend only: pip install gpiod (libgpiod v2 bindings)
+    pigpio pin factory only: sudo pigpiod (not available on Pi 5)
 """
 
+import os
 import sys
 import time
+import select
 import argparse
-from datetime import datetime
+import functools
+import threading
 from signal import signal, SIGINT
 
 try:
@@ -34,29 +42,305 @@ except ImportError:
     print("Install with: pip install gpiozero")
     sys.exit(1)
 
+try:
+    import gpiod
+    from gpiod.line import Direction, Edge
+    GPIOD_AVAILABLE = True
+except ImportError:
+    GPIOD_AVAILABLE = False
+
+GPIO_CHIP = "/dev/gpiochip0"
+
+# Labels of the header GPIO controller: RP1 on the Pi 5, BCM283x/2711 before
+SYSFS_GPIO_LABELS = ("pinctrl-rp1", "pinctrl-bcm")
+
+
+def sysfs_gpio_base():
+    """
+    Return the sysfs number of BCM GPIO 0 on the header controller.
+
+    Pi 5 kernels register RP1 with a dynamic base (512 and up), so the
+    sysfs number of a pin is base + BCM number rather than the BCM number.
+    Returns 0 if no matching gpiochip is listed.
+    """
+    root = "/sys/class/gpio"
+    for name in sorted(os.listdir(root)):
+        if not name.startswith("gpiochip"):
+            continue
+        try:
+            with open(f"{root}/{name}/label") as f:
+                label = f.read().strip()
+            if label.startswith(SYSFS_GPIO_LABELS):
+                with open(f"{root}/{name}/base") as f:
+                    return int(f.read())
+        except (OSError, ValueError):
+            continue
+    return 0
+
+
+class EdgeMotionSensor:
+    """
+    Base for PIR inputs whose edges arrive on a pollable file descriptor.
+
+    Drop-in for the parts of gpiozero's MotionSensor that PIRTester uses
+    (when_motion, when_no_motion, close). A single thread sleeps in epoll
+    on the fd and only wakes for real transitions, instead of sampling
+    the pin. Subclasses open the fd and implement _dispatch() and
+    _release().
+    """
+
+    def __init__(self):
+        self.when_motion = None
+        self.when_no_motion = None
+
+    def _start(self, fd, eventmask):
+        """Start the event thread polling fd for eventmask."""
+        # Writing to the pipe wakes the event thread for close()
+        self._wake_r, self._wake_w = os.pipe()
+        self._epoll = select.epoll()
+        self._epoll.register(fd, eventmask)
+        self._epoll.register(self._wake_r, select.EPOLLIN)
+
+        self._thread = threading.Thread(target=self._event_loop, name="PIREdges", daemon=True)
+        self._thread.start()
+
+    def _event_loop(self):
+        """Dispatch edges to the callbacks until close()."""
+        while True:
+            for fd, _ in self._epoll.poll():
+                if fd == self._wake_r:
+                    return
+                self._dispatch()
+
+    def _fire(self, motion):
+        """Invoke the callback for a rising (motion) or falling edge."""
+        callback = self.when_motion if motion else self.when_no_motion
+        if callback is not None:
+            callback()
+
+    def _dispatch(self):
+        raise NotImplementedError
+
+    def _release(self):
+        raise NotImplementedError
+
+    def close(self):
+        """Stop the event thread and release the input."""
+        os.write(self._wake_w, b"x")
+        self._thread.join(timeout=1.0)
+        self._epoll.close()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+        self._release()
+
+
+class GpiodMotionSensor(EdgeMotionSensor):
+    """
+    PIR input read through a libgpiod v2 line request.
+
+    The kernel timestamps and queues edges on the request fd, which is
+    polled edge-triggered.
+    """
+
+    def __init__(self, gpio_pin, chip=GPIO_CHIP):
+        if not GPIOD_AVAILABLE:
+            raise RuntimeError("gpiod not installed (pip install gpiod)")
+        super().__init__()
+
+        settings = gpiod.LineSettings(direction=Direction.INPUT, edge_detection=Edge.BOTH)
+        self._request = gpiod.request_lines(chip, consumer="pir-test", config={gpio_pin: settings})
+        self._rising = gpiod.EdgeEvent.Type.RISING_EDGE
+        self._start(self._request.fd, select.EPOLLIN | select.EPOLLET)
+
+    def _dispatch(self):
+        # Edge-triggered: drain everything queued before polling again
+        while self._request.wait_edge_events(0):
+            for event in self._request.read_edge_events():
+                self._fire(event.event_type == self._rising)
+
+    def _release(self):
+        self._request.release()
+
+
+class SysfsMotionSensor(EdgeMotionSensor):
+    """
+    PIR input read through the legacy /sys/class/gpio interface.
+
+    For images without libgpiod bindings or pigpiod. The value file is
+    opened once and re-read with lseek + read; the kernel raises
+    EPOLLPRI on it for every edge once edge is set to "both". A pin
+    exported here is unexported again on close.
+    """
+
+    def __init__(self, gpio_pin):
+        super().__init__()
+        self._exported = None
+
+        try:
+            sysfs_pin = sysfs_gpio_base() + gpio_pin
+            gpio_dir = f"/sys/class/gpio/gpio{sysfs_pin}"
+            if not os.path.isdir(gpio_dir):
+                with open("/sys/class/gpio/export", "w") as f:
+                    f.write(str(sysfs_pin))
+                self._exported = sysfs_pin
+            with open(f"{gpio_dir}/edge", "w") as f:
+                f.write("both")
+            self._fd = os.open(f"{gpio_dir}/value", os.O_RDONLY | os.O_NONBLOCK)
+        except OSError as e:
+            self._unexport()
+            raise RuntimeError(f"sysfs GPIO {gpio_pin} not available: {e}") from e
+
+        # Reading the value clears the pending notification
+        self._level = self._read()
+        self._start(self._fd, select.EPOLLPRI | select.EPOLLERR)
+
+    def _read(self):
+        """Return True if the pin is high."""
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        return os.read(self._fd, 2)[:1] == b"1"
+
+    def _dispatch(self):
+        level = self._read()
+        if level != self._level:
+            self._level = level
+            self._fire(level)
+
+    def _release(self):
+        os.close(self._fd)
+        self._unexport()
+
+    def _unexport(self):
+        """Unexport the pin if __init__ exported it."""
+        if self._exported is None:
+            return
+        try:
+            with open("/sys/class/gpio/unexport", "w") as f:
+                f.write(str(self._exported))
+        except OSError:
+            pass
+        self._exported = None
+
+
+def pir_test(name):
+    """
+    Register a PIRTester test method under name.
+
+    Skips the test once a stop was requested, opens the sensor, times
+    the test with perf_counter_ns and records (name, passed, duration_ns)
+    in test_results unless the test was interrupted.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if self.stop_requested:
+                return False
+            self.pir  # Open the sensor outside the timed section
+            t0 = time.perf_counter_ns()
+            passed = fn(self, *args, **kwargs)
+            if not self.stop_requested:
+                self.test_results.append((name, passed, time.perf_counter_ns() - t0))
+            return passed
+        return wrapper
+    return decorator
+
+
+def make_pin_factory(name):
+    """
+    Create a gpiozero pin factory by name.
+
+    Returns None for 'default', which lets gpiozero pick (lgpio on a Pi 5,
+    or whatever GPIOZERO_PIN_FACTORY names). pigpio samples pins with
+    pigpiod's DMA engine and delivers edges from its alert thread; it
+    requires the daemon and is not supported on the Pi 5.
+    """
+    if name == "pigpio":
+        from gpiozero.pins.pigpio import PiGPIOFactory
+        return PiGPIOFactory()
+    if name == "lgpio":
+        from gpiozero.pins.lgpio import LGPIOFactory
+        return LGPIOFactory()
+    return None
+
 
 class PIRTester:
     """Comprehensive PIR motion sensor test suite."""
 
-    def __init__(self, gpio_pin=17):
+    # Section separators, built once
+    _EQ = "=" * 70
+    _DASH = "-" * 70
+    _EQ_END = _EQ + "\n"
+    _DASH_END = _DASH + "\n"
+
+    def __init__(self, gpio_pin=17, pin_factory=None, backend="gpiozero"):
         self.gpio_pin = gpio_pin
-        self.pir = MotionSensor(gpio_pin)
+        self.pin_factory = pin_factory
+        self.backend = backend
         self.motion_count = 0
         self.idle_count = 0
         self.test_results = []
         self.start_time = None
-        self.stop_requested = False
 
-    def log(self, message, level="INFO"):
+        # Set from the motion callback, so tests block until the sensor fires
+        # instead of polling motion_count once a second
+        self._motion_event = threading.Event()
+        self._stop_event = threading.Event()
+
+        # Periodic progress lines come from a re-arming timer
+        self._progress_timer = None
+        self._progress_deadline = None
+        self._timer_lock = threading.Lock()
+
+    @functools.cached_property
+    def pir(self):
+        """
+        The motion sensor, opened on first use with callbacks attached.
+
+        Deferring this keeps GPIO setup (and gpiozero's sampling thread)
+        out of runs that never reach a test.
+        """
+        if self.backend == "libgpiod":
+            sensor = GpiodMotionSensor(self.gpio_pin)
+        elif self.backend == "sysfs":
+            sensor = SysfsMotionSensor(self.gpio_pin)
+        else:
+            # queue_len=1: the HC-SR501 output is already a clean digital level,
+            # so every sample is reported instead of averaged over a queue
+            sensor = MotionSensor(self.gpio_pin, queue_len=1, pin_factory=self.pin_factory)
+        sensor.when_motion = self.motion_detected
+        sensor.when_no_motion = self.motion_stopped
+        return sensor
+
+    @property
+    def stop_requested(self):
+        """True once request_stop() has been called."""
+        return self._stop_event.is_set()
+
+    def request_stop(self):
+        """
+        Stop the running test and wake any wait in progress.
+
+        Only sets events, so it is safe to call from a signal handler;
+        the interrupted test returns and main() does the cleanup.
+        """
+        self._stop_event.set()
+        self._motion_event.set()
+
+    def log(self, message="", level="INFO"):
         """Log message with timestamp."""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        ts = time.strftime("%Y-%m-%d %H:%M:%S")
         level_str = f"[{level}]" if level != "INFO" else ""
         print(f"[{ts}] {level_str} {message}")
 
+    def log_lines(self, lines):
+        """Log several INFO lines under one timestamp with a single print."""
+        prefix = f"[{time.strftime('%Y-%m-%d %H:%M:%S')}]  "
+        print(prefix + ("\n" + prefix).join(lines))
+
     def motion_detected(self):
         """Callback: Motion detected."""
         self.motion_count += 1
         self.log(f"🚨 MOTION DETECTED (#{self.motion_count})", "DETECT")
+        self._motion_event.set()
 
     def motion_stopped(self):
         """Callback: Motion stopped."""
@@ -68,77 +352,113 @@ class PIRTester:
         self.pir.when_motion = self.motion_detected
         self.pir.when_no_motion = self.motion_stopped
 
+    def wait_for_motion(self, timeout):
+        """
+        Block until motion is detected, a stop is requested or timeout expires.
+
+        Returns True only if motion woke the wait.
+        """
+        self._motion_event.clear()
+        detected = self._motion_event.wait(timeout)
+        return detected and not self.stop_requested
+
+    def wait_or_stop(self, timeout):
+        """Sleep for timeout seconds; returns True if a stop was requested."""
+        return self._stop_event.wait(timeout)
+
+    def _start_progress(self, duration, interval, message):
+        """Log message(remaining) now and every interval seconds until duration ends."""
+        with self._timer_lock:
+            self._progress_deadline = time.monotonic() + duration
+        self._progress_tick(interval, message)
+
+    def _progress_tick(self, interval, message):
+        """Log one progress line and re-arm the timer."""
+        with self._timer_lock:
+            if self._progress_deadline is None:
+                return
+            remaining = self._progress_deadline - time.monotonic()
+            if remaining < 0.5:
+                return
+            self._progress_timer = threading.Timer(interval, self._progress_tick, (interval, message))
+            self._progress_timer.daemon = True
+            self._progress_timer.start()
+        self.log(message(round(remaining)))
+
+    def _stop_progress(self):
+        """Cancel the progress timer."""
+        with self._timer_lock:
+            self._progress_deadline = None
+            if self._progress_timer is not None:
+                self._progress_timer.cancel()
+                self._progress_timer = None
+
+    @pir_test("Idle State")
     def test_idle_state(self, duration=10):
         """Test 1: Sensor idle state (no motion)."""
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log("TEST 1: IDLE STATE CHECK", "TEST")
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log(f"⏳ Waiting {duration} seconds with NO motion...")
         self.log("👉 Please stand still / don't move near sensor\n")
 
         self.setup_callbacks()
         start_idle = self.idle_count
 
-        try:
-            time.sleep(duration)
-        except KeyboardInterrupt:
-            self.stop_requested = True
+        # Any motion fails the test, so there is no need to wait it out
+        self.wait_for_motion(duration)
+        if self.stop_requested:
             return False
 
         idle_events = self.idle_count - start_idle
         motion_events = self.motion_count
 
         passed = motion_events == 0
-        self.test_results.append(("Idle State", passed))
 
-        self.log("-" * 70)
+        self.log(self._DASH)
         if passed:
             self.log(f"✅ TEST 1 PASSED - No motion detected", "PASS")
         else:
             self.log(f"❌ TEST 1 FAILED - Detected {motion_events} motion events", "FAIL")
-        self.log("-" * 70 + "\n")
+        self.log(self._DASH_END)
 
         return passed
 
+    @pir_test("Motion Detection")
     def test_motion_detection(self, duration=10):
         """Test 2: Motion detection."""
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log("TEST 2: MOTION DETECTION", "TEST")
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log(f"⏳ Waiting {duration} seconds for motion detection...")
         self.log("👉 Wave your hand in front of sensor NOW!\n")
 
         motion_start = self.motion_count
+        deadline = time.monotonic() + duration
 
-        try:
-            for i in range(duration):
-                if self.stop_requested:
-                    return False
-                if self.motion_count > motion_start:
-                    self.log(f"✓ Motion detected at {duration - i}s remaining", "SUCCESS")
-                    break
-                time.sleep(1)
-        except KeyboardInterrupt:
-            self.stop_requested = True
+        if self.wait_for_motion(duration):
+            remaining = deadline - time.monotonic()
+            self.log(f"✓ Motion detected at {remaining:.1f}s remaining", "SUCCESS")
+        if self.stop_requested:
             return False
 
         passed = self.motion_count > motion_start
-        self.test_results.append(("Motion Detection", passed))
 
-        self.log("-" * 70)
+        self.log(self._DASH)
         if passed:
             self.log(f"✅ TEST 2 PASSED - Motion detected!", "PASS")
         else:
             self.log(f"❌ TEST 2 FAILED - No motion detected", "FAIL")
-        self.log("-" * 70 + "\n")
+        self.log(self._DASH_END)
 
         return passed
 
+    @pir_test("Signal Recovery")
     def test_signal_recovery(self, duration=15):
         """Test 3: Signal recovery (motion stops)."""
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log("TEST 3: SIGNAL RECOVERY", "TEST")
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log(f"⏳ Waiting {duration} seconds for recovery...")
         self.log("👉 First: Wave hand (create motion)")
         self.log("   Then: Stand still (let it recover)\n")
@@ -146,32 +466,29 @@ class PIRTester:
         idle_start = self.idle_count
         motion_detected_before = self.motion_count
 
-        try:
-            time.sleep(duration)
-        except KeyboardInterrupt:
-            self.stop_requested = True
+        if self.wait_or_stop(duration):
             return False
 
         motion_happened = self.motion_count > motion_detected_before
         recovery_happened = self.idle_count > idle_start
 
         passed = motion_happened and recovery_happened
-        self.test_results.append(("Signal Recovery", passed))
 
-        self.log("-" * 70)
+        self.log(self._DASH)
         if passed:
             self.log(f"✅ TEST 3 PASSED - Motion & recovery detected", "PASS")
         else:
             self.log(f"❌ TEST 3 FAILED - No recovery", "FAIL")
-        self.log("-" * 70 + "\n")
+        self.log(self._DASH_END)
 
         return passed
 
+    @pir_test("Repeated Motion")
     def test_repeated_motion(self, cycles=3, cycle_duration=5):
         """Test 4: Repeated motion detection."""
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log("TEST 4: REPEATED MOTION CYCLES", "TEST")
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log(f"⏳ Testing {cycles} cycles (on/off pattern)...")
         self.log(f"📋 Each cycle: {cycle_duration}s motion, {cycle_duration}s idle\n")
 
@@ -186,10 +503,9 @@ class PIRTester:
             self.log(f"  👉 Motion phase (wave hand)...")
             motion_before = self.motion_count
 
-            try:
-                time.sleep(cycle_duration)
-            except KeyboardInterrupt:
-                self.stop_requested = True
+            # The motion phase ends as soon as the sensor fires
+            self.wait_for_motion(cycle_duration)
+            if self.stop_requested:
                 return False
 
             if self.motion_count > motion_before:
@@ -201,10 +517,7 @@ class PIRTester:
             self.log(f"  ⏸ Idle phase (stand still)...")
             idle_before = self.idle_count
 
-            try:
-                time.sleep(cycle_duration)
-            except KeyboardInterrupt:
-                self.stop_requested = True
+            if self.wait_or_stop(cycle_duration):
                 return False
 
             if self.idle_count > idle_before:
@@ -216,9 +529,8 @@ class PIRTester:
             self.log()
 
         passed = motion_cycles == cycles and idle_cycles == cycles
-        self.test_results.append(("Repeated Motion", passed))
 
-        self.log("-" * 70)
+        self.log(self._DASH)
         if passed:
             self.log(
                 f"✅ TEST 4 PASSED - All {cycles} cycles detected",
@@ -229,107 +541,92 @@ class PIRTester:
                 f"❌ TEST 4 FAILED - {motion_cycles} motion, {idle_cycles} idle cycles",
                 "FAIL",
             )
-        self.log("-" * 70 + "\n")
+        self.log(self._DASH_END)
 
         return passed
 
+    @pir_test("Sensitivity")
     def test_sensitivity(self, duration=20):
         """Test 5: Sensor sensitivity (minimum motion detection)."""
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log("TEST 5: SENSITIVITY CHECK", "TEST")
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log(f"⏳ Testing sensor sensitivity for {duration} seconds...")
         self.log("👉 Make small movements at different distances\n")
 
         motion_start = self.motion_count
 
-        try:
-            for i in range(duration):
-                if self.stop_requested:
-                    return False
-                remaining = duration - i
-                if (i % 5) == 0:
-                    self.log(f"  ⏳ {remaining}s remaining... (current detections: {self.motion_count - motion_start})")
-                time.sleep(1)
-        except KeyboardInterrupt:
-            self.stop_requested = True
+        self._start_progress(
+            duration, 5,
+            lambda remaining: f"  ⏳ {remaining}s remaining... (current detections: {self.motion_count - motion_start})",
+        )
+        stopped = self.wait_or_stop(duration)
+        self._stop_progress()
+        if stopped:
             return False
 
         detections = self.motion_count - motion_start
         passed = detections > 0
-        self.test_results.append(("Sensitivity", passed))
 
-        self.log("-" * 70)
+        self.log(self._DASH)
         if passed:
             self.log(f"✅ TEST 5 PASSED - {detections} detections (sensitive)", "PASS")
         else:
             self.log(f"⚠️  TEST 5 WARNING - No detections (check positioning)", "WARN")
-        self.log("-" * 70 + "\n")
+        self.log(self._DASH_END)
 
         return passed
 
+    @pir_test("Detection Range")
     def test_range(self, duration=20):
         """Test 6: Detection range."""
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log("TEST 6: DETECTION RANGE", "TEST")
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log(f"⏳ Testing detection range for {duration} seconds...")
         self.log("👉 Move from close (1m) to far (5m) from sensor\n")
 
         motion_start = self.motion_count
 
-        try:
-            for i in range(duration):
-                if self.stop_requested:
-                    return False
-                remaining = duration - i
-                if (i % 5) == 0:
-                    self.log(f"  ⏳ {remaining}s remaining...")
-                time.sleep(1)
-        except KeyboardInterrupt:
-            self.stop_requested = True
+        self._start_progress(duration, 5, lambda remaining: f"  ⏳ {remaining}s remaining...")
+        stopped = self.wait_or_stop(duration)
+        self._stop_progress()
+        if stopped:
             return False
 
         detections = self.motion_count - motion_start
         passed = detections > 0
-        self.test_results.append(("Detection Range", passed))
 
-        self.log("-" * 70)
+        self.log(self._DASH)
         if passed:
             self.log(f"✅ TEST 6 PASSED - Detections at multiple distances", "PASS")
         else:
             self.log(f"❌ TEST 6 FAILED - No range detection", "FAIL")
-        self.log("-" * 70 + "\n")
+        self.log(self._DASH_END)
 
         return passed
 
+    @pir_test("False Positive")
     def test_false_positive(self, duration=30):
         """Test 7: False positive check (thermal drift, reflections)."""
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log("TEST 7: FALSE POSITIVE CHECK", "TEST")
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log(f"⏳ Monitoring for {duration}s with NO motion...")
         self.log("👉 Lights, fans, heat sources nearby? Don't move!\n")
 
         motion_start = self.motion_count
 
-        try:
-            for i in range(duration):
-                if self.stop_requested:
-                    return False
-                remaining = duration - i
-                if (i % 10) == 0:
-                    self.log(f"  ⏳ {remaining}s remaining...")
-                time.sleep(1)
-        except KeyboardInterrupt:
-            self.stop_requested = True
+        self._start_progress(duration, 10, lambda remaining: f"  ⏳ {remaining}s remaining...")
+        stopped = self.wait_or_stop(duration)
+        self._stop_progress()
+        if stopped:
             return False
 
         false_positives = self.motion_count - motion_start
         passed = false_positives == 0
-        self.test_results.append(("False Positive", passed))
 
-        self.log("-" * 70)
+        self.log(self._DASH)
         if passed:
             self.log(f"✅ TEST 7 PASSED - No false positives", "PASS")
         else:
@@ -337,24 +634,29 @@ class PIRTester:
                 f"⚠️  TEST 7 WARNING - {false_positives} false positives detected",
                 "WARN",
             )
-        self.log("-" * 70 + "\n")
+        self.log(self._DASH_END)
 
         return passed
 
     def print_summary(self):
         """Print test summary."""
-        self.log("=" * 70)
+        self.log(self._EQ)
         self.log("TEST SUMMARY", "SUMMARY")
-        self.log("=" * 70)
-
-        passed = sum(1 for _, result in self.test_results if result)
-        total = len(self.test_results)
-
-        for test_name, result in self.test_results:
+        self.log(self._EQ)
+
+        # One pass counts results and formats their lines
+        passed = 0
+        total = 0
+        lines = []
+        for test_name, result, duration_ns in self.test_results:
+            total += 1
+            passed += bool(result)
             status = "✅ PASS" if result else "❌ FAIL"
-            self.log(f"{test_name:<30} {status}")
+            lines.append(f"{test_name:<30} {status}  ({duration_ns / 1e9:.1f}s)")
+        if lines:
+            self.log_lines(lines)
 
-        self.log("-" * 70)
+        self.log(self._DASH)
         self.log(f"Total Events: {self.motion_count} motion, {self.idle_count} idle")
         self.log(f"Results: {passed}/{total} tests passed")
         if passed == total:
@@ -363,10 +665,13 @@ class PIRTester:
             self.log("⚠️  SOME TESTS FAILED", "WARNING")
         else:
             self.log("❌ MULTIPLE TEST FAILURES", "ERROR")
-        self.log("=" * 70 + "\n")
+        self.log(self._EQ_END)
 
     def cleanup(self):
         """Cleanup GPIO."""
+        self._stop_progress()
+        if "pir" not in self.__dict__:
+            return
         try:
             self.pir.close()
             self.log("GPIO cleanup complete", "INFO")
@@ -385,6 +690,9 @@ Examples:
   python pir_test.py --test idle        # Only idle test
   python pir_test.py --test motion      # Only motion test
   python pir_test.py --timeout 60       # Each test: 60 seconds
+  python pir_test.py --pin-factory pigpio   # pigpio DMA sampling (run 'sudo pigpiod' first)
+  python pir_test.py --backend libgpiod     # Kernel edge events, no gpiozero sampling
+  python pir_test.py --backend sysfs        # Legacy /sys/class/gpio edges, no extra packages
 
 Available Tests:
   all          - Run all tests (default)
@@ -424,21 +732,30 @@ Available Tests:
         default=10,
         help="Timeout for each test in seconds (default: 10)",
     )
+    parser.add_argument(
+        "--pin-factory",
+        default="default",
+        choices=["default", "lgpio", "pigpio"],
+        help="gpiozero pin factory (pigpio needs pigpiod, not available on Pi 5)",
+    )
+    parser.add_argument(
+        "--backend",
+        default="gpiozero",
+        choices=["gpiozero", "libgpiod", "sysfs"],
+        help="Sensor backend (default: gpiozero)",
+    )
 
     args = parser.parse_args()
 
-    tester = PIRTester(gpio_pin=args.gpio)
-
-    # Handle CTRL+C
-    def handle_sigint(signum, frame):
-        tester.stop_requested = True
-        print("\n")
-        tester.log("Test interrupted by user", "INFO")
-        tester.print_summary()
-        tester.cleanup()
-        sys.exit(0)
+    tester = PIRTester(
+        gpio_pin=args.gpio,
+        pin_factory=make_pin_factory(args.pin_factory),
+        backend=args.backend,
+    )
 
-    signal(SIGINT, handle_sigint)
+    # CTRL+C wakes the running test's Event.wait; summary and cleanup
+    # happen once in the finally block below
+    signal(SIGINT, lambda signum, frame: tester.request_stop())
 
     # Print header
     print("\n" + "=" * 70)
@@ -447,45 +764,31 @@ Available Tests:
     tester.log(f"GPIO Pin: {args.gpio}")
     tester.log(f"Test Mode: {args.test}")
     tester.log(f"Timeout: {args.timeout}s per test")
+    tester.log(f"Backend: {args.backend}")
+    if args.backend == "gpiozero":
+        tester.log(f"Pin Factory: {args.pin_factory}")
     print("=" * 70 + "\n")
 
     tester.start_time = time.time()
 
-    try:
-        if args.test in ["all", "idle"]:
-            if tester.stop_requested:
-                return
-            tester.test_idle_state(args.timeout)
-
-        if args.test in ["all", "motion"]:
-            if tester.stop_requested:
-                return
-            tester.test_motion_detection(args.timeout)
-
-        if args.test in ["all", "recovery"]:
-            if tester.stop_requested:
-                return
-            tester.test_signal_recovery(args.timeout)
-
-        if args.test in ["all", "repeated"]:
-            if tester.stop_requested:
-                return
-            tester.test_repeated_motion(cycles=3, cycle_duration=args.timeout // 6)
-
-        if args.test in ["all", "sensitivity"]:
-            if tester.stop_requested:
-                return
-            tester.test_sensitivity(args.timeout)
-
-        if args.test in ["all", "range"]:
-            if tester.stop_requested:
-                return
-            tester.test_range(args.timeout)
+    # Run order; --test picks one entry or all of them
+    tests = (
+        ("idle", tester.test_idle_state, (args.timeout,)),
+        ("motion", tester.test_motion_detection, (args.timeout,)),
+        ("recovery", tester.test_signal_recovery, (args.timeout,)),
+        ("repeated", tester.test_repeated_motion, (3, args.timeout // 6)),
+        ("sensitivity", tester.test_sensitivity, (args.timeout,)),
+        ("range", tester.test_range, (args.timeout,)),
+        ("false_pos", tester.test_false_positive, (args.timeout,)),
+    )
+    selected = {name for name, _, _ in tests} if args.test == "all" else {args.test}
 
-        if args.test in ["all", "false_pos"]:
+    try:
+        for name, test, test_args in tests:
             if tester.stop_requested:
-                return
-            tester.test_false_positive(args.timeout)
+                break
+            if name in selected:
+                test(*test_args)
 
     except Exception as e:
         tester.log(f"ERROR: {e}", "ERROR")
@@ -494,6 +797,9 @@ Available Tests:
         traceback.print_exc()
 
     finally:
+        if tester.stop_requested:
+            print("\n")
+            tester.log("Test interrupted by user", "INFO")
         tester.print_summary()
         tester.cleanup()
 
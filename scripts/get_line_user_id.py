@@ -11,11 +11,19 @@ Usage:
 Then ask Yoshi to send any message to the bot (@514otjkn).
 """
 
+import io
 import os
 import sys
+import json
 from flask import Flask, request, abort
 from dotenv import load_dotenv
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -33,32 +41,74 @@ print("=" * 60)
 print("\nWaiting for Yoshi to send a message to bot @514otjkn...")
 print("The User ID will appear below:\n")
 
+# Event fields shown alongside the captured User ID
+_DETAIL_PREFIXES = {
+    'events.item.type': 'type',
+    'events.item.message.type': 'message_type',
+    'events.item.message.text': 'text',
+}
+
+def find_user_id(body: bytes):
+    """
+    Return (user_id, details) for the first event that carries a userId.
+
+    With ijson the body is streamed and parsing stops at the first
+    events[].source.userId, so the rest of the payload is never built
+    into Python objects. details holds the event fields seen so far.
+    """
+    if not IJSON_AVAILABLE:
+        payload = json.loads(body)
+        if not isinstance(payload, dict):
+            return None, {}
+        for event in payload.get('events', []):
+            user_id = event.get('source', {}).get('userId')
+            if user_id:
+                message = event.get('message', {})
+                return user_id, {
+                    'type': event.get('type'),
+                    'message_type': message.get('type'),
+                    'text': message.get('text'),
+                }
+        return None, {}
+    
+    details = {}
+    try:
+        for prefix, kind, value in ijson.parse(io.BytesIO(body)):
+            if prefix == 'events.item.source.userId':
+                return value, details
+            if prefix in _DETAIL_PREFIXES:
+                details[_DETAIL_PREFIXES[prefix]] = value
+            elif prefix == 'events.item' and kind == 'end_map':
+                details = {}
+    except ijson.JSONError as e:
+        # ijson's parse errors do not derive from ValueError
+        raise ValueError(str(e)) from e
+    return None, {}
+
 @app.route("/webhook", methods=['POST'])
 def webhook():
     """Handle incoming LINE webhook events."""
-    body = request.get_json()
+    try:
+        user_id, details = find_user_id(request.get_data())
+    except ValueError:
+        # Malformed JSON body
+        abort(400)
     
-    if body and 'events' in body:
-        for event in body['events']:
-            if 'source' in event:
-                source = event['source']
-                user_id = source.get('userId', 'N/A')
-                
-                print("\n" + "=" * 60)
-                print("USER ID FOUND!")
-                print("=" * 60)
-                print(f"\nLINE_USER_ID={user_id}\n")
-                print("=" * 60)
-                print("\nCopy this User ID and add it to the .env file!")
-                print("Then restart the monitoring service.\n")
-                
-                # Also print event details
-                print(f"Event Type: {event.get('type', 'unknown')}")
-                if event.get('type') == 'message':
-                    message = event.get('message', {})
-                    print(f"Message Type: {message.get('type', 'unknown')}")
-                    if message.get('type') == 'text':
-                        print(f"Message Text: {message.get('text', '')}")
+    if user_id:
+        print("\n" + "=" * 60)
+        print("USER ID FOUND!")
+        print("=" * 60)
+        print(f"\nLINE_USER_ID={user_id}\n")
+        print("=" * 60)
+        print("\nCopy this User ID and add it to the .env file!")
+        print("Then restart the monitoring service.\n")
+        
+        # Also print event details
+        print(f"Event Type: {details.get('type') or 'unknown'}")
+        if details.get('type') == 'message':
+            print(f"Message Type: {details.get('message_type') or 'unknown'}")
+            if details.get('message_type') == 'text':
+                print(f"Message Text: {details.get('text') or ''}")
     
     return 'OK', 200
 
@@ -6,12 +6,19 @@ Captures User ID from incoming messages.
 
 import os
 import json
-import hashlib
 import hmac
 import base64
+import binascii
 from datetime import datetime
 from flask import Flask, request, abort
 from dotenv import load_dotenv
+from log_writer import start_log_writer
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 load_dotenv()
 
@@ -21,27 +28,39 @@ CHANNEL_SECRET = os.getenv('LINE_CHANNEL_SECRET', '')
 LOG_FILE = "/tmp/line_webhook.log"
 USER_ID_FILE = "/tmp/yoshi_user_id.txt"
 
+# Encoded once; verify_signature runs on every request
+_SECRET_BYTES = CHANNEL_SECRET.encode('utf-8') if CHANNEL_SECRET else b''
+
+# Length of a base64-encoded SHA-256 digest
+_SIGNATURE_LEN = 44
+
+# Log lines are appended by a writer thread so requests never wait on the disk
+_write_log = start_log_writer(LOG_FILE)
+
 def log(msg):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{timestamp}] {msg}"
     print(line, flush=True)
-    with open(LOG_FILE, "a") as f:
-        f.write(line + "\n")
+    _write_log(line)
 
 def verify_signature(body: bytes, signature: str) -> bool:
     """Verify LINE webhook signature."""
-    if not CHANNEL_SECRET:
+    if not _SECRET_BYTES:
         log("WARNING: No channel secret, skipping verification")
         return True
     
-    hash = hmac.new(
-        CHANNEL_SECRET.encode('utf-8'),
-        body,
-        hashlib.sha256
-    ).digest()
-    expected_signature = base64.b64encode(hash).decode('utf-8')
+    # Reject malformed headers before hashing the body
+    if len(signature) != _SIGNATURE_LEN:
+        return False
+    
+    # Compare raw digests: one b64decode of the header instead of
+    # b64encoding our digest, and hmac.digest() is OpenSSL's one-shot path
+    try:
+        received = base64.b64decode(signature, validate=True)
+    except binascii.Error:
+        return False
     
-    return hmac.compare_digest(signature, expected_signature)
+    return hmac.compare_digest(received, hmac.digest(_SECRET_BYTES, body, 'sha256'))
 
 log("=" * 60)
 log("LINE Webhook Server (with signature verification)")
@@ -69,8 +88,9 @@ def webhook():
         abort(400)
     
     # Parse JSON
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
     try:
-        data = json.loads(body)
+        data = orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
     except json.JSONDecodeError:
         log("ERROR: Invalid JSON")
         abort(400)
@@ -106,5 +126,5 @@ def index():
 
 if __name__ == '__main__':
     log("Starting server on port 5000...")
-    app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
+    app.run(host='0.0.0.0', port=5000, debug=False)
 
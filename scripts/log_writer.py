@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Background log file writer shared by the LINE webhook scripts.
+"""
+
+import atexit
+import queue
+import threading
+
+def start_log_writer(path):
+    """
+    Start a thread that appends lines to path and return its put function.
+
+    Requests never wait on the disk: callers only queue the line. The file
+    is opened once, line-buffered, for the life of the process, and the
+    queue is drained on exit.
+    """
+    lines = queue.SimpleQueue()
+
+    def writer():
+        with open(path, "a", buffering=1) as f:
+            while True:
+                line = lines.get()
+                if line is None:
+                    break
+                f.write(line + "\n")
+
+    thread = threading.Thread(target=writer, name="log-writer", daemon=True)
+    thread.start()
+
+    def stop():
+        lines.put(None)
+        thread.join(timeout=2.0)
+
+    atexit.register(stop)
+    return lines.put
@@ -6,43 +6,51 @@ This sends to ALL followers of the bot.
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
 
 TOKEN = os.getenv('LINE_CHANNEL_ACCESS_TOKEN', '')
 
-print("=" * 60)
-print("Sending Broadcast Message to ALL Followers")
-print("=" * 60)
+API_URL = 'https://api.line.me/v2/bot/message/broadcast'
 
-headers = {
+# One keep-alive connection to api.line.me, reused by every send()
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+SESSION.headers.update({
     'Authorization': f'Bearer {TOKEN}',
     'Content-Type': 'application/json'
-}
-
-# Broadcast message
-data = {
-    "messages": [
-        {
-            "type": "text",
-            "text": "🎉 Smart Monitoring System Connected!\n\nThis is a test message from your Raspberry Pi Smart Monitoring Kit.\n\nThe system is now configured and ready.\n\n- Motion Detection: ✅\n- Sound Detection: ✅\n- Door Sensor: ✅\n- Vibration Sensor: ✅\n- Temperature Monitor: ✅\n\nYou will receive alerts when sensors trigger.\n\nCommands:\n• status - Get sensor status\n• arm - Enable alerts\n• disarm - Disable alerts"
-        }
-    ]
-}
-
-response = requests.post(
-    'https://api.line.me/v2/bot/message/broadcast',
-    headers=headers,
-    json=data
-)
-
-print(f"Status: {response.status_code}")
-if response.status_code == 200:
-    print("✅ Broadcast sent successfully!")
-    print("Yoshi should receive this message now!")
-else:
-    print(f"Error: {response.text}")
-
-print("=" * 60)
+})
 
+
+def send(payload):
+    """POST a message payload over the shared session."""
+    return SESSION.post(API_URL, json=payload, timeout=5)
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("Sending Broadcast Message to ALL Followers")
+    print("=" * 60)
+
+    # Broadcast message
+    data = {
+        "messages": [
+            {
+                "type": "text",
+                "text": "🎉 Smart Monitoring System Connected!\n\nThis is a test message from your Raspberry Pi Smart Monitoring Kit.\n\nThe system is now configured and ready.\n\n- Motion Detection: ✅\n- Sound Detection: ✅\n- Door Sensor: ✅\n- Vibration Sensor: ✅\n- Temperature Monitor: ✅\n\nYou will receive alerts when sensors trigger.\n\nCommands:\n• status - Get sensor status\n• arm - Enable alerts\n• disarm - Disable alerts"
+            }
+        ]
+    }
+
+    response = send(data)
+
+    print(f"Status: {response.status_code}")
+    if response.status_code == 200:
+        print("✅ Broadcast sent successfully!")
+        print("Yoshi should receive this message now!")
+    else:
+        print(f"Error: {response.text}")
+
+    print("=" * 60)
@@ -6,6 +6,7 @@ This uses his personal User ID for direct messaging.
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,40 +14,47 @@ load_dotenv()
 TOKEN = os.getenv('LINE_CHANNEL_ACCESS_TOKEN', '')
 USER_ID = os.getenv('LINE_USER_ID', '')
 
-print("=" * 60)
-print("Sending PUSH Notification to Yoshi")
-print("=" * 60)
-print(f"User ID: {USER_ID[:10]}...{USER_ID[-5:]}")
-print()
+API_URL = 'https://api.line.me/v2/bot/message/push'
 
-headers = {
+# One keep-alive connection to api.line.me, reused by every send()
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+SESSION.headers.update({
     'Authorization': f'Bearer {TOKEN}',
     'Content-Type': 'application/json'
-}
-
-# Push message to specific user
-data = {
-    "to": USER_ID,
-    "messages": [
-        {
-            "type": "text",
-            "text": "🎉 Direct Push Notification Test!\n\nHi Yoshi!\n\nThis message was sent DIRECTLY to your LINE using your User ID.\n\n✅ Push notification is working!\n\nYour Smart Monitoring Kit will now send alerts directly to YOU when:\n• Motion is detected\n• Door opens/closes\n• Vibration detected\n• Sound detected\n• Temperature changes\n\nThank you for your patience!\n\n- A.R. Ansari"
-        }
-    ]
-}
-
-response = requests.post(
-    'https://api.line.me/v2/bot/message/push',
-    headers=headers,
-    json=data
-)
-
-print(f"Status: {response.status_code}")
-if response.status_code == 200:
-    print("✅ PUSH notification sent successfully!")
-    print("Yoshi should receive this message RIGHT NOW!")
-else:
-    print(f"Error: {response.text}")
-
-print("=" * 60)
-
+})
+
+
+def send(payload):
+    """POST a message payload over the shared session."""
+    return SESSION.post(API_URL, json=payload, timeout=5)
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("Sending PUSH Notification to Yoshi")
+    print("=" * 60)
+    print(f"User ID: {USER_ID[:10]}...{USER_ID[-5:]}")
+    print()
+
+    # Push message to specific user
+    data = {
+        "to": USER_ID,
+        "messages": [
+            {
+                "type": "text",
+                "text": "🎉 Direct Push Notification Test!\n\nHi Yoshi!\n\nThis message was sent DIRECTLY to your LINE using your User ID.\n\n✅ Push notification is working!\n\nYour Smart Monitoring Kit will now send alerts directly to YOU when:\n• Motion is detected\n• Door opens/closes\n• Vibration detected\n• Sound detected\n• Temperature changes\n\nThank you for your patience!\n\n- A.R. Ansari"
+            }
+        ]
+    }
+
+    response = send(data)
+
+    print(f"Status: {response.status_code}")
+    if response.status_code == 200:
+        print("✅ PUSH notification sent successfully!")
+        print("Yoshi should receive this message RIGHT NOW!")
+    else:
+        print(f"Error: {response.text}")
+
+    print("=" * 60)
@@ -15,13 +15,13 @@ print("=" * 60)
 print("LINE API Test")
 print("=" * 60)
 
+# Both calls share one keep-alive connection to api.line.me
+session = requests.Session()
+session.headers['Authorization'] = f'Bearer {TOKEN}'
+
 # Test 1: Get Bot Info
 print("\n1. Getting Bot Info...")
-headers = {
-    'Authorization': f'Bearer {TOKEN}'
-}
-
-response = requests.get('https://api.line.me/v2/bot/info', headers=headers)
+response = session.get('https://api.line.me/v2/bot/info', timeout=5)
 print(f"Status: {response.status_code}")
 if response.status_code == 200:
     bot_info = response.json()
@@ -33,7 +33,7 @@ else:
 
 # Test 2: Get Followers (if available)
 print("\n2. Getting Followers...")
-response = requests.get('https://api.line.me/v2/bot/followers/ids', headers=headers)
+response = session.get('https://api.line.me/v2/bot/followers/ids', timeout=5)
 print(f"Status: {response.status_code}")
 if response.status_code == 200:
     data = response.json()
@@ -44,5 +44,7 @@ if response.status_code == 200:
 else:
     print(f"Error: {response.text}")
 
+session.close()
+
 print("\n" + "=" * 60)
 
@@ -8,18 +8,27 @@ import json
 from datetime import datetime
 from flask import Flask, request
 from dotenv import load_dotenv
+from log_writer import start_log_writer
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 load_dotenv()
 
 app = Flask(__name__)
 LOG_FILE = "/tmp/line_webhook.log"
 
+# Log lines are appended by a writer thread so requests never wait on the disk
+_write_log = start_log_writer(LOG_FILE)
+
 def log(msg):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{timestamp}] {msg}"
     print(line)
-    with open(LOG_FILE, "a") as f:
-        f.write(line + "\n")
+    _write_log(line)
 
 log("=" * 60)
 log("LINE Webhook Server Started")
@@ -28,7 +37,11 @@ log("=" * 60)
 @app.route("/webhook", methods=['POST'])
 def webhook():
     body = request.get_json()
-    log(f"Received webhook: {json.dumps(body, indent=2)}")
+    if ORJSON_AVAILABLE:
+        pretty = orjson.dumps(body, option=orjson.OPT_INDENT_2).decode()
+    else:
+        pretty = json.dumps(body, indent=2)
+    log(f"Received webhook: {pretty}")
     
     if body and 'events' in body:
         for event in body['events']:
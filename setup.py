@@ -14,16 +14,17 @@ from pathlib import Path
 
 # Read README
 readme_file = Path(__file__).parent / "README.md"
-long_description = readme_file.read_text() if readme_file.exists() else ""
+long_description = readme_file.read_bytes().decode("utf-8") if readme_file.exists() else ""
 
-# Read requirements
+# Read requirements (filtered as raw bytes, decoding only the lines kept)
 requirements_file = Path(__file__).parent / "requirements.txt"
 requirements = []
 if requirements_file.exists():
+    stripped = (line.strip() for line in requirements_file.read_bytes().splitlines())
     requirements = [
-        line.strip() 
-        for line in requirements_file.read_text().splitlines() 
-        if line.strip() and not line.startswith("#")
+        line.decode("utf-8")
+        for line in stripped
+        if line and not line.startswith(b"#")
     ]
 
 setup(
@@ -2,19 +2,62 @@
 """
 LM393 Sound Sensor - Live Continuous Monitoring
 GPIO22 - Real-time sound detection with visual feedback
+
+Edges are delivered by the kernel through a gpiochip line request
+(libgpiod v2), so the loop sleeps in epoll on the request fd and wakes
+only when the sensor output actually changes. Event lines are handed
+to a logging queue and written by a listener thread, so terminal output
+never stalls the loop during a burst of edges.
 """
 
-import RPi.GPIO as GPIO
+import logging
+import logging.handlers
+import queue
+import select
+import sys
 import time
-from datetime import datetime
+
+import gpiod
+from gpiod.line import Bias, Direction, Edge
 
 # Configuration
+GPIO_CHIP = "/dev/gpiochip0"
 SOUND_PIN = 22
 TEST_DURATION = 30  # 30 seconds
 
+NS_PER_SEC = 1_000_000_000
+
+# Last formatted timestamp, keyed by the millisecond it was built for
+_TS_CACHE = [-1, ""]
+
 def timestamp():
-    """Get formatted timestamp."""
-    return datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    """Get formatted timestamp (reused within the same millisecond)."""
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _TS_CACHE[0]:
+        secs, ms = divmod(now_ms, 1000)
+        _TS_CACHE[0] = now_ms
+        _TS_CACHE[1] = f"{time.strftime('%H:%M:%S', time.localtime(secs))}.{ms:03d}"
+    return _TS_CACHE[1]
+
+def start_event_log():
+    """
+    Return a logger whose records are written by a background listener.
+
+    The listener's formatter stamps each line from the record's creation
+    time, so timestamp formatting also happens off the event loop.
+    """
+    records = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("[%(asctime)s.%(msecs)03d] %(message)s", "%H:%M:%S"))
+    listener = logging.handlers.QueueListener(records, handler)
+    
+    logger = logging.getLogger("sound_live_test")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    
+    listener.start()
+    return logger, listener
 
 def main():
     print("=" * 60)
@@ -23,36 +66,57 @@ def main():
     print(f"  Duration: {TEST_DURATION} seconds")
     print("=" * 60)
     
+    request = None
+    ep = None
+    listener = None
+    
     try:
-        # Setup GPIO
-        GPIO.setmode(GPIO.BCM)
-        GPIO.setwarnings(False)
-        GPIO.setup(SOUND_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+        # Request the line with kernel-side edge detection
+        settings = gpiod.LineSettings(
+            direction=Direction.INPUT,
+            edge_detection=Edge.BOTH,
+            bias=Bias.PULL_UP
+        )
+        request = gpiod.request_lines(
+            GPIO_CHIP,
+            consumer="sound-live-test",
+            config={SOUND_PIN: settings}
+        )
+        
+        ep = select.epoll()
+        ep.register(request.fd, select.EPOLLIN)
         
         print(f"\n[{timestamp()}] GPIO initialized successfully")
         print(f"[{timestamp()}] Monitoring sound on GPIO22...")
         print("\n👉 Make some noise: clap, snap, speak, whistle!\n")
         
-        last_state = None
         sound_count = 0
         silence_count = 0
-        start_time = time.time()
+        log, listener = start_event_log()
+        # Integer deadline on the monotonic clock, immune to wall-clock jumps
+        deadline_ns = time.monotonic_ns() + TEST_DURATION * NS_PER_SEC
         
-        while (time.time() - start_time) < TEST_DURATION:
-            current_state = GPIO.input(SOUND_PIN)
-            elapsed = time.time() - start_time
+        while True:
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
+                break
             
-            # Detect state changes
-            if current_state != last_state and last_state is not None:
-                if current_state == GPIO.HIGH:
+            # Sleep until the kernel queues an edge (or the test ends);
+            # epoll rounds the timeout up, so this never spins at the deadline
+            if not ep.poll(remaining_ns / NS_PER_SEC):
+                continue
+            
+            for event in request.read_edge_events():
+                if event.event_type == gpiod.EdgeEvent.Type.RISING_EDGE:
                     sound_count += 1
-                    print(f"[{timestamp()}] 🔊 SOUND DETECTED! (#{sound_count})")
+                    log.info("🔊 SOUND DETECTED! (#%d)", sound_count)
                 else:
                     silence_count += 1
-                    print(f"[{timestamp()}] ✓ Silence (#{silence_count})")
-            
-            last_state = current_state
-            time.sleep(0.01)  # 10ms polling
+                    log.info("✓ Silence (#%d)", silence_count)
+        
+        # Drain queued event lines before printing the summary
+        listener.stop()
+        listener = None
         
         # Summary
         print("\n" + "=" * 60)
@@ -77,7 +141,12 @@ def main():
         print(f"\n❌ ERROR: {e}")
     
     finally:
-        GPIO.cleanup()
+        if listener is not None:
+            listener.stop()
+        if ep is not None:
+            ep.close()
+        if request is not None:
+            request.release()
         print(f"\n[{timestamp()}] GPIO cleanup done")
 
 if __name__ == "__main__":
@@ -2,55 +2,124 @@
 """
 LM393 Sound Sensor - Simple Test Suite
 
-Basic testing for the LM393 sound sensor using gpiozero.
+Basic testing for the LM393 sound sensor using libgpiod and asyncio.
 
 Features:
 - 2 simple test cases (silent & non-silent)
 - Real-time event logging
 - Pass/fail results
 - Configurable GPIO pin and timeout
+- Edges read on the asyncio loop (no polling or sampling thread)
 """
 
-from gpiozero import Button
-from datetime import datetime
-from time import sleep
+from datetime import timedelta
 import argparse
+import asyncio
+import time
+
+import gpiod
+from gpiod.line import Bias, Direction, Edge
+
+GPIO_CHIP = "/dev/gpiochip0"
+
+
+class AsyncSoundSensor:
+    """
+    LM393 output read through a libgpiod v2 line request on an asyncio loop.
+
+    The request fd is watched with loop.add_reader(), so edges are put on
+    an asyncio.Queue as the kernel reports them and tests simply await it.
+    Several sensors can share one loop and one thread this way. Must be
+    created from a running event loop.
+    """
+    
+    def __init__(self, gpio_pin: int, chip: str = GPIO_CHIP, bounce_time: float = 0.1):
+        # LM393 DO pulls the line LOW while sound is above the threshold;
+        # the kernel debounces the line before queuing edges
+        settings = gpiod.LineSettings(
+            direction=Direction.INPUT,
+            edge_detection=Edge.FALLING,
+            bias=Bias.PULL_UP,
+            debounce_period=timedelta(seconds=bounce_time)
+        )
+        self._request = gpiod.request_lines(chip, consumer="sound-test", config={gpio_pin: settings})
+        self.events = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self._request.fd, self._on_readable)
+    
+    def _on_readable(self):
+        """Move queued edge events from the kernel onto the asyncio queue."""
+        for event in self._request.read_edge_events():
+            self.events.put_nowait(event)
+    
+    def clear(self):
+        """Drop edges queued before now."""
+        while not self.events.empty():
+            self.events.get_nowait()
+    
+    def close(self):
+        """Stop watching the fd and release the line."""
+        self._loop.remove_reader(self._request.fd)
+        self._request.release()
 
 
 class SoundTester:
     """LM393 sound sensor testing class."""
     
     def __init__(self, gpio_pin: int = 22):
-        """Initialize sound sensor tester."""
+        """Initialize sound sensor tester (the GPIO line is opened by the run methods)."""
         self.gpio_pin = gpio_pin
         self.sound_count = 0
         self.test_results = []
-        
+        self.sensor = None
+        self._test_start_ns = 0
+        self._sound_elapsed = 0.0
+        self._ts_second = -1
+        self._ts_text = ""
+    
+    def _open_sensor(self):
+        """Request the GPIO line on the running event loop."""
         try:
-            self.sensor = Button(gpio_pin, pull_up=True, bounce_time=0.1)
-            print(f"[{self._timestamp()}] GPIO Pin: {gpio_pin}")
+            self.sensor = AsyncSoundSensor(self.gpio_pin)
+            print(f"[{self._timestamp()}] GPIO Pin: {self.gpio_pin}")
         except Exception as e:
-            print(f"❌ ERROR: Failed to initialize GPIO pin {gpio_pin}")
+            print(f"❌ ERROR: Failed to initialize GPIO pin {self.gpio_pin}")
             print(f"   {str(e)}")
             raise
     
     def _timestamp(self):
-        """Get formatted timestamp."""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Get formatted timestamp (formatted once per second)."""
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        return self._ts_text
     
     def setup_callbacks(self):
-        """Setup sound detection callbacks."""
+        """Reset the count and discard edges from before the test."""
         self.sound_count = 0
-        self.sensor.when_pressed = self._on_sound
+        self.sensor.clear()
+        # Edge timestamps use CLOCK_MONOTONIC, same as time.monotonic_ns()
+        self._test_start_ns = time.monotonic_ns()
     
-    def _on_sound(self):
-        """Callback when sound detected."""
+    def _on_sound(self, event):
+        """Record a detected sound, timed by the kernel's edge timestamp."""
         self.sound_count += 1
-        print(f"[{self._timestamp()}] 🔊 Sound detected (#{self.sound_count})")
+        elapsed = (event.timestamp_ns - self._test_start_ns) / 1e9
+        self._sound_elapsed = elapsed
+        print(f"[{self._timestamp()}] 🔊 Sound detected (#{self.sound_count}) at +{elapsed:.3f}s")
+    
+    async def _wait_for_sound(self, duration: float) -> bool:
+        """Wait up to duration for a sound; returns True if one was heard."""
+        try:
+            event = await asyncio.wait_for(self.sensor.events.get(), duration)
+        except asyncio.TimeoutError:
+            return False
+        self._on_sound(event)
+        return True
     
-    def test_silent(self, duration: int = 10) -> bool:
+    async def test_silent(self, duration: int = 10) -> bool:
         """Test 1: Verify no sound (silent)."""
-        self.sound_count = 0
         self.setup_callbacks()
         
         print("\n" + "="*60)
@@ -59,17 +128,15 @@ class SoundTester:
         print(f"[{self._timestamp()}] ⏳ Waiting {duration}s... keep quiet")
         print()
         
-        sleep(duration)
-        
-        passed = self.sound_count == 0
+        # Fails as soon as anything is heard
+        passed = not await self._wait_for_sound(duration)
         status = "✅ PASS" if passed else "❌ FAIL"
         print(f"[{self._timestamp()}] {status}")
         self.test_results.append(("Silent", passed))
         return passed
     
-    def test_non_silent(self, duration: int = 10) -> bool:
+    async def test_non_silent(self, duration: int = 10) -> bool:
         """Test 2: Verify sound detection (non-silent)."""
-        self.sound_count = 0
         self.setup_callbacks()
         
         print("\n" + "="*60)
@@ -79,11 +146,12 @@ class SoundTester:
         print("👉 Clap, snap, or speak!")
         print()
         
-        sleep(duration)
-        
-        passed = self.sound_count > 0
-        status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"[{self._timestamp()}] {status} - {self.sound_count} sounds detected")
+        # Passes as soon as the first sound is heard
+        passed = await self._wait_for_sound(duration)
+        if passed:
+            print(f"[{self._timestamp()}] ✅ PASS - first sound at +{self._sound_elapsed:.3f}s")
+        else:
+            print(f"[{self._timestamp()}] ❌ FAIL - no sound detected")
         self.test_results.append(("Non-Silent", passed))
         return passed
     
@@ -106,7 +174,7 @@ class SoundTester:
             print("🎉 ALL TESTS PASSED!")
         print("="*60)
     
-    def run_all_tests(self, timeout: int = 10):
+    async def run_all_tests(self, timeout: int = 10):
         """Run all tests."""
         print("\n" + "="*60)
         print("LM393 SOUND SENSOR - TEST SUITE")
@@ -116,16 +184,17 @@ class SoundTester:
         print()
         
         try:
-            self.test_silent(timeout)
-            self.test_non_silent(timeout)
+            self._open_sensor()
+            await self.test_silent(timeout)
+            await self.test_non_silent(timeout)
             self.print_summary()
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print("\n⚠️  Interrupted by user")
             self.print_summary()
         finally:
             self.cleanup()
     
-    def run_specific_test(self, test_name: str, timeout: int = 10):
+    async def run_specific_test(self, test_name: str, timeout: int = 10):
         """Run a specific test."""
         tests = {
             'silent': self.test_silent,
@@ -144,9 +213,10 @@ class SoundTester:
         print()
         
         try:
-            tests[test_name](timeout)
+            self._open_sensor()
+            await tests[test_name](timeout)
             self.print_summary()
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print("\n⚠️  Interrupted")
             self.print_summary()
         finally:
@@ -184,10 +254,12 @@ def main():
         tester = SoundTester(gpio_pin=args.gpio)
         
         if args.test.lower() == 'all':
-            tester.run_all_tests(args.timeout)
+            asyncio.run(tester.run_all_tests(args.timeout))
         else:
-            tester.run_specific_test(args.test.lower(), args.timeout)
+            asyncio.run(tester.run_specific_test(args.test.lower(), args.timeout))
     
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         print(f"❌ ERROR: {str(e)}")
 
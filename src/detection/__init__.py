@@ -20,16 +20,49 @@ Detection Module.
 @copyright  (c) 2024 A.R. Ansari. All rights reserved.
 """
 
-from .background_subtractor import BackgroundSubtractor
-from .motion_detector import MotionDetector
-from .event_logger import EventLogger
-from .fall_detector import FallDetector, PersonState
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .background_subtractor import BackgroundSubtractor, RunningAverageSubtractor
+    from .motion_detector import MotionDetector
+    from .event_logger import EventLogger
+    from .fall_detector import FallDetector, PersonState
+    from .pipeline import PipelinedDetector, detect_many
+
+# Submodules are imported on first attribute access (PEP 562), so
+# importing the package does not pull in cv2/numpy until a class is used
+_LAZY = {
+    'BackgroundSubtractor': '.background_subtractor',
+    'RunningAverageSubtractor': '.background_subtractor',
+    'MotionDetector': '.motion_detector',
+    'EventLogger': '.event_logger',
+    'FallDetector': '.fall_detector',
+    'PersonState': '.fall_detector',
+    'PipelinedDetector': '.pipeline',
+    'detect_many': '.pipeline'
+}
 
 __all__ = [
     'BackgroundSubtractor',
+    'RunningAverageSubtractor',
     'MotionDetector',
     'EventLogger',
     'FallDetector',
-    'PersonState'
+    'PersonState',
+    'PipelinedDetector',
+    'detect_many'
 ]
 
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        obj = getattr(module, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -21,31 +21,82 @@ Event Logging Module.
 
 @dependencies
     - opencv-python >= 4.5.0
+    - PyTurboJPEG (optional, faster snapshot encoding)
 """
 
 import os
 import cv2
 import json
 import time
+import queue
+import threading
+import itertools
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import Optional, List, Dict
 import numpy as np
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    # ijson's parse errors do not derive from ValueError
+    _LEGACY_LOAD_ERRORS = (ValueError, IOError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    _LEGACY_LOAD_ERRORS = (ValueError, IOError)
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJSAMP_420
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+# Shared libjpeg-turbo handle, created by the first snapshot writer
+_turbojpeg = None
+
+
+def _get_turbojpeg():
+    """Return the shared TurboJPEG instance, or None if unavailable."""
+    global _turbojpeg, TURBOJPEG_AVAILABLE
+    if _turbojpeg is None and TURBOJPEG_AVAILABLE:
+        try:
+            _turbojpeg = TurboJPEG()
+        except (OSError, RuntimeError):
+            # Python wrapper installed but libturbojpeg not found
+            TURBOJPEG_AVAILABLE = False
+    return _turbojpeg
+
 
 class EventLogger:
     """
     Log motion detection events with snapshots.
     
-    Maintains a JSON log of all events and optionally saves
-    frame snapshots for each event.
+    Maintains a JSON-Lines log of all events (one line appended per
+    event) and optionally saves frame snapshots for each event.
+    Snapshots are encoded and written by a background thread, so
+    log_event() does not block the caller on JPEG encoding or disk I/O.
+    
+    Log lines are batched in memory and written with one write() once
+    LOG_BUFFER_SIZE bytes are pending or LOG_FLUSH_INTERVAL seconds
+    after the first pending line; close() writes the rest and fsyncs.
     """
     
+    LOG_BUFFER_SIZE = 4096
+    LOG_FLUSH_INTERVAL = 1.0
+    
     def __init__(
         self,
         log_dir: str = "logs/events",
         snapshot_dir: str = "logs/snapshots",
         save_snapshots: bool = True,
-        max_events: int = 1000
+        max_events: int = 1000,
+        jpeg_quality: int = 80
     ):
         """
         Initialize event logger.
@@ -55,6 +106,7 @@ class EventLogger:
             snapshot_dir: Directory for snapshots
             save_snapshots: Whether to save frame snapshots
             max_events: Maximum events to keep in memory
+            jpeg_quality: JPEG quality for snapshots (0-100)
             
         Note:
             Directories are created automatically if they don't exist
@@ -63,17 +115,43 @@ class EventLogger:
         self.snapshot_dir = snapshot_dir
         self.save_snapshots = save_snapshots
         self.max_events = max_events
+        self.jpeg_quality = jpeg_quality
         
         # Create directories
         os.makedirs(log_dir, exist_ok=True)
         if save_snapshots:
             os.makedirs(snapshot_dir, exist_ok=True)
         
-        self.log_file = os.path.join(log_dir, "motion_events.json")
+        self.log_file = os.path.join(log_dir, "motion_events.jsonl")
         self.events = []
         
+        # Lines in the log file; it is compacted once this reaches
+        # twice max_events
+        self._file_events = 0
+        
         # Load existing events
         self._load_events()
+        
+        # Events are kept oldest-first in a bounded deque, with a
+        # per-type index so queries walk back from the newest event
+        self._set_events(self.events)
+        
+        # Pending log lines, written by _write_log_buffer()
+        self._log_buf = bytearray()
+        self._log_lock = threading.Lock()
+        self._log_timer = None
+        self._log_fd = self._open_log()
+        
+        # Snapshot writer
+        self._io_queue = queue.Queue(maxsize=256)
+        self._io_thread = None
+        if save_snapshots:
+            self._io_thread = threading.Thread(
+                target=self._io_loop,
+                name="EventLoggerIO",
+                daemon=True
+            )
+            self._io_thread.start()
     
     def log_event(
         self,
@@ -93,7 +171,9 @@ class EventLogger:
             Event ID (unique identifier)
             
         Note:
-            Events are automatically saved to disk
+            Events are automatically saved to disk, batched for up to
+            LOG_FLUSH_INTERVAL seconds. Snapshots are written in the
+            background; call flush() to wait for both.
         """
         timestamp = time.time()
         event_id = f"{event_type}_{int(timestamp * 1000)}"
@@ -112,18 +192,23 @@ class EventLogger:
                 self.snapshot_dir,
                 f"{event_id}.jpg"
             )
-            cv2.imwrite(snapshot_path, frame)
-            event["snapshot"] = snapshot_path
+            try:
+                # Copy: the caller is free to reuse or draw on frame
+                self._io_queue.put_nowait((snapshot_path, frame.copy()))
+                event["snapshot"] = snapshot_path
+            except queue.Full:
+                print(f"Snapshot queue full, dropping snapshot for {event_id}")
         
-        # Add to events list
+        # Add to events; the deque drops the oldest once full, so drop
+        # it from its type index too
+        if len(self.events) == self.max_events:
+            oldest = self.events[0]
+            self._by_type[oldest["event_type"]].popleft()
         self.events.append(event)
+        self._by_type[event_type].append(event)
         
-        # Trim old events if exceeding max
-        if len(self.events) > self.max_events:
-            self.events = self.events[-self.max_events:]
-        
-        # Save to file
-        self._save_events()
+        # Append to file
+        self._append_event(event)
         
         return event_id
     
@@ -146,24 +231,22 @@ class EventLogger:
         Returns:
             List of events matching criteria (newest first)
         """
-        filtered = self.events.copy()
-        
         if event_type:
-            filtered = [e for e in filtered if e["event_type"] == event_type]
-        
-        if start_time:
-            filtered = [e for e in filtered if e["timestamp"] >= start_time]
+            source = self._by_type.get(event_type, ())
+        else:
+            source = self.events
         
+        # Events are stored in time order, so walking back from the newest
+        # yields them newest first and can stop at start_time
+        matches = reversed(source)
         if end_time:
-            filtered = [e for e in filtered if e["timestamp"] <= end_time]
-        
-        # Sort by timestamp (newest first)
-        filtered.sort(key=lambda x: x["timestamp"], reverse=True)
-        
+            matches = itertools.dropwhile(lambda e: e["timestamp"] > end_time, matches)
+        if start_time:
+            matches = itertools.takewhile(lambda e: e["timestamp"] >= start_time, matches)
         if limit:
-            filtered = filtered[:limit]
+            matches = itertools.islice(matches, limit)
         
-        return filtered
+        return list(matches)
 
     def get_event_count(self, event_type: Optional[str] = None) -> int:
         """
@@ -176,7 +259,7 @@ class EventLogger:
             Number of events
         """
         if event_type:
-            return len([e for e in self.events if e["event_type"] == event_type])
+            return len(self._by_type.get(event_type, ()))
         return len(self.events)
 
     def clear_events(self, event_type: Optional[str] = None):
@@ -187,26 +270,204 @@ class EventLogger:
             event_type: Clear only events of this type (None = clear all)
         """
         if event_type:
-            self.events = [e for e in self.events if e["event_type"] != event_type]
+            self._set_events([e for e in self.events if e["event_type"] != event_type])
         else:
-            self.events = []
+            self._set_events([])
+
+        self._rewrite_events()
+
+    def _set_events(self, events):
+        """Replace the in-memory events and rebuild the type index."""
+        self.events = deque(events, maxlen=self.max_events)
+        self._by_type = defaultdict(deque)
+        for event in self.events:
+            self._by_type[event["event_type"]].append(event)
+
+    def flush(self):
+        """Write pending log lines and block until queued snapshots are written."""
+        with self._log_lock:
+            self._write_log_buffer()
+        if self._io_thread is not None:
+            self._io_queue.join()
 
-        self._save_events()
+    def close(self):
+        """Write pending snapshots, stop the snapshot writer and close the log."""
+        if self._io_thread is not None:
+            self._io_queue.put(None)
+            self._io_thread.join()
+            self._io_thread = None
+        with self._log_lock:
+            if self._log_fd is None:
+                return
+            self._write_log_buffer()
+            try:
+                os.fsync(self._log_fd)
+            except OSError as e:
+                print(f"Error saving events: {e}")
+            os.close(self._log_fd)
+            self._log_fd = None
+
+    def _io_loop(self):
+        """Encode and write queued snapshots until close()."""
+        while True:
+            item = self._io_queue.get()
+            try:
+                if item is None:
+                    return
+                self._write_snapshot(*item)
+            except (cv2.error, OSError) as e:
+                print(f"Error saving snapshot: {e}")
+            finally:
+                self._io_queue.task_done()
+
+    def _write_snapshot(self, snapshot_path: str, frame: np.ndarray):
+        """
+        Encode frame as JPEG at jpeg_quality and write it to snapshot_path.
+
+        Uses libjpeg-turbo (NEON on the Pi 5) for BGR frames when
+        PyTurboJPEG is installed, otherwise falls back to cv2.imwrite.
+        """
+        encoder = _get_turbojpeg()
+        if encoder is not None and frame.ndim == 3:
+            data = encoder.encode(
+                frame,
+                quality=self.jpeg_quality,
+                pixel_format=TJPF_BGR,
+                jpeg_subsample=TJSAMP_420
+            )
+            with open(snapshot_path, 'wb') as f:
+                f.write(data)
+            return
+
+        if not cv2.imwrite(snapshot_path, frame, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]):
+            print(f"Error saving snapshot: {snapshot_path}")
 
     def _load_events(self):
-        """Load events from JSON file."""
-        if os.path.exists(self.log_file):
+        """Load events from the JSON-Lines file, skipping damaged lines."""
+        if not os.path.exists(self.log_file):
+            self._load_legacy_events()
+            return
+        
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        try:
+            # Only the numbered tail is held in memory, never the whole file
+            with open(self.log_file, 'rb') as f:
+                tail = deque(zip(itertools.count(1), f), maxlen=self.max_events)
+                size = f.tell()
+            
+            # A write cut short by power loss leaves a partial last line;
+            # drop it so the next append starts on a fresh line
+            if tail and not tail[-1][1].endswith(b"\n"):
+                os.truncate(self.log_file, size - len(tail.pop()[1]))
+        except IOError:
+            return
+        
+        if tail:
+            self._file_events = tail[-1][0]
+        for _, line in tail:
             try:
-                with open(self.log_file, 'r') as f:
-                    self.events = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self.events = []
+                self.events.append(loads(line))
+            except ValueError:
+                # e.g. a line damaged on disk
+                continue
+
+    def _load_legacy_events(self):
+        """Import events from the old single-document motion_events.json."""
+        legacy_file = os.path.join(self.log_dir, "motion_events.json")
+        if not os.path.exists(legacy_file):
+            return
+        
+        try:
+            if IJSON_AVAILABLE:
+                # Stream the array, keeping only the newest max_events
+                with open(legacy_file, 'rb') as f:
+                    items = ijson.items(f, 'item', use_float=True)
+                    self.events = list(deque(items, maxlen=self.max_events))
+            else:
+                with open(legacy_file, 'r') as f:
+                    self.events = json.load(f)[-self.max_events:]
+        except _LEGACY_LOAD_ERRORS:
+            self.events = []
+            return
+        
+        self._write_lines(self.log_file, self.events)
+        self._file_events = len(self.events)
 
-    def _save_events(self):
-        """Save events to JSON file."""
+    @staticmethod
+    def _dumps(event: Dict) -> bytes:
+        """Serialize one event as a compact JSON line."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(event) + b"\n"
+        return json.dumps(event, separators=(',', ':')).encode() + b"\n"
+
+    def _write_lines(self, path: str, events: List[Dict]):
+        """Write events to path as JSON Lines, replacing it atomically."""
+        tmp_file = path + ".tmp"
         try:
-            with open(self.log_file, 'w') as f:
-                json.dump(self.events, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.writelines(self._dumps(e) for e in events)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, path)
         except IOError as e:
             print(f"Error saving events: {e}")
 
+    def _open_log(self) -> int:
+        """Open the log file for appending whole lines."""
+        return os.open(self.log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+    def _append_event(self, event: Dict):
+        """Queue one event line for the log file."""
+        line = self._dumps(event)
+        with self._log_lock:
+            if self._log_fd is None:
+                print("Error saving events: log is closed")
+                return
+            self._log_buf += line
+            if len(self._log_buf) >= self.LOG_BUFFER_SIZE:
+                self._write_log_buffer()
+            elif self._log_timer is None:
+                self._log_timer = threading.Timer(self.LOG_FLUSH_INTERVAL, self._flush_log)
+                self._log_timer.daemon = True
+                self._log_timer.start()
+        
+        self._file_events += 1
+        if self._file_events >= 2 * self.max_events:
+            self._rewrite_events()
+
+    def _flush_log(self):
+        """Timer callback: write pending log lines."""
+        with self._log_lock:
+            self._write_log_buffer()
+
+    def _write_log_buffer(self):
+        """Write pending log lines with one write(); caller holds _log_lock."""
+        if self._log_timer is not None:
+            self._log_timer.cancel()
+            self._log_timer = None
+        if not self._log_buf or self._log_fd is None:
+            return
+        
+        data = bytes(self._log_buf)
+        self._log_buf.clear()
+        try:
+            written = 0
+            while written < len(data):
+                written += os.write(self._log_fd, data[written:])
+        except OSError as e:
+            print(f"Error saving events: {e}")
+
+    def _rewrite_events(self):
+        """Rewrite the log file to hold exactly the in-memory events."""
+        with self._log_lock:
+            # Pending lines are all in self.events, so just drop them
+            if self._log_timer is not None:
+                self._log_timer.cancel()
+                self._log_timer = None
+            self._log_buf.clear()
+            
+            if self._log_fd is not None:
+                os.close(self._log_fd)
+            self._write_lines(self.log_file, self.events)
+            self._file_events = len(self.events)
+            self._log_fd = self._open_log()
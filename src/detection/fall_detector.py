@@ -28,6 +28,7 @@ import numpy as np
 import time
 from typing import Optional, Tuple, Dict, Callable
 from enum import Enum
+from .background_subtractor import RunningAverageSubtractor
 
 
 class PersonState(Enum):
@@ -39,6 +40,24 @@ class PersonState(Enum):
     UNKNOWN = "unknown"
 
 
+# Per-state box color (BGR) and label used by FallDetector.draw_detection
+_STATE_COLORS = {
+    PersonState.FALLEN: (0, 0, 255),      # Red for fall
+    PersonState.LYING: (0, 165, 255),     # Orange for lying
+    PersonState.STANDING: (0, 255, 0),    # Green for standing
+    PersonState.SITTING: (255, 255, 0),   # Cyan for sitting/unknown
+    PersonState.UNKNOWN: (255, 255, 0),
+}
+_STATE_LABELS = {state: state.value.upper() for state in PersonState}
+_STATE_LABELS[PersonState.FALLEN] = "FALL DETECTED!"
+
+# The label set is fixed, so each label's (width, height) is measured once
+_LABEL_SIZES = {
+    label: cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
+    for label in _STATE_LABELS.values()
+}
+
+
 class FallDetector:
     """
     Fall detection using aspect ratio analysis and motion patterns.
@@ -50,13 +69,19 @@ class FallDetector:
     - Prolonged inactivity in horizontal position
     """
 
+    # One 13x13 square dilation equals three passes of a 5x5 square
+    _DILATE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (13, 13))
+
     def __init__(
         self,
         aspect_ratio_threshold: float = 1.5,
         fall_velocity_threshold: float = 0.3,
         inactivity_timeout: float = 10.0,
         min_person_area: int = 2000,
-        fall_callback: Optional[Callable] = None
+        fall_callback: Optional[Callable] = None,
+        proc_width: Optional[int] = None,
+        gray: bool = False,
+        bg_method: str = "MOG2"
     ):
         """
         Initialize fall detector.
@@ -68,6 +93,16 @@ class FallDetector:
             inactivity_timeout: Seconds of inactivity to confirm fall
             min_person_area: Minimum contour area to consider as person
             fall_callback: Callback function when fall detected
+            proc_width: Width to downscale frames to before detection
+                        (None = full resolution). min_person_area and
+                        returned boxes stay in full-frame pixels.
+            gray: Model the background on luma only. Cheaper, but a
+                  person who only differs from the room in color is
+                  not seen.
+            bg_method: Background model, "MOG2" or "MEAN". MEAN is a
+                       running average on luma, much cheaper but only
+                       for static scenes; someone lying still fades
+                       into it within a few seconds.
         """
         if aspect_ratio_threshold <= 0:
             raise ValueError("aspect_ratio_threshold must be positive")
@@ -77,12 +112,19 @@ class FallDetector:
             raise ValueError("inactivity_timeout must be positive")
         if min_person_area <= 0:
             raise ValueError("min_person_area must be positive")
+        if proc_width is not None and proc_width <= 0:
+            raise ValueError("proc_width must be positive")
+        if bg_method not in ("MOG2", "MEAN"):
+            raise ValueError(f"Unknown bg_method: {bg_method}. Use 'MOG2' or 'MEAN'")
 
         self.aspect_ratio_threshold = aspect_ratio_threshold
         self.fall_velocity_threshold = fall_velocity_threshold
         self.inactivity_timeout = inactivity_timeout
         self.min_person_area = min_person_area
         self.fall_callback = fall_callback
+        self.proc_width = proc_width
+        self.gray = gray
+        self.bg_method = bg_method
 
         # State tracking
         self.previous_state = PersonState.UNKNOWN
@@ -100,11 +142,17 @@ class FallDetector:
         self.paused = False
 
         # Background subtractor for person detection
-        self.bg_subtractor = cv2.createBackgroundSubtractorMOG2(
-            history=500,
-            varThreshold=16,
-            detectShadows=True
-        )
+        self.bg_subtractor = self._create_bg_subtractor()
+
+        # (scale, blur size, dilation kernel) for the last proc_width scale
+        self._scaled_clean = None
+
+        # Per-frame scratch images, reused while the frame size is
+        # unchanged. Each is only touched by one detect() stage, so they
+        # are also safe under PipelinedDetector
+        self._small = None
+        self._gray = None
+        self._labels = None
 
     def detect(
         self,
@@ -123,63 +171,97 @@ class FallDetector:
         if frame is None or frame.size == 0:
             raise ValueError("Invalid frame: frame is None or empty")
 
+        fg_mask, scale = self._foreground(frame)
+        if fg_mask is not None:
+            self._clean(fg_mask, scale)
+        return self._analyze(frame, fg_mask, scale)
+
+    # detect() is split into the stages below so PipelinedDetector can
+    # run them on separate threads; each stage sees frames in order
+
+    def _foreground(self, frame: np.ndarray) -> Tuple[Optional[np.ndarray], float]:
+        """Stage 1: foreground mask and scale, or (None, 1.0) if paused."""
         # If paused, return no fall
         if self.paused:
-            return False, PersonState.UNKNOWN, None
+            return None, 1.0
 
         self.total_frames += 1
 
+        # Run the mask pipeline on a reduced copy if proc_width is set;
+        # centroids stay in reduced pixels, which the velocity check
+        # normalizes away
+        small, scale = self._shrink(frame)
+
+        if self.gray:
+            small = self._to_gray(small)
+
         # Apply background subtraction
-        fg_mask = self.bg_subtractor.apply(frame)
+        return self.bg_subtractor.apply(small), scale
 
-        # Remove shadows
-        fg_mask[fg_mask == 127] = 0
+    def _clean(self, fg_mask: np.ndarray, scale: float):
+        """Stage 2: denoise and fill the foreground mask in place."""
+        ksize, kernel = self._clean_params_for(scale)
 
-        # Noise reduction
-        blurred = cv2.GaussianBlur(fg_mask, (21, 21), 0)
-        _, thresh = cv2.threshold(blurred, 25, 255, cv2.THRESH_BINARY)
+        # Noise reduction; three 7x7 box passes approximate a 21x21
+        # Gaussian (sigma 3.5) at a third of the cost
+        for _ in range(3):
+            cv2.blur(fg_mask, (ksize, ksize), dst=fg_mask)
+        cv2.threshold(fg_mask, 25, 255, cv2.THRESH_BINARY, dst=fg_mask)
 
         # Morphological operations
-        kernel = np.ones((5, 5), np.uint8)
-        dilated = cv2.dilate(thresh, kernel, iterations=3)
-
-        # Find contours
-        contours, _ = cv2.findContours(
-            dilated,
-            cv2.RETR_EXTERNAL,
-            cv2.CHAIN_APPROX_SIMPLE
-        )
+        cv2.dilate(fg_mask, kernel, dst=fg_mask)
+
+    def _clean_params_for(self, scale: float) -> Tuple[int, np.ndarray]:
+        """Blur size and dilation kernel covering the same full-frame extent at scale."""
+        if scale == 1.0:
+            return 7, self._DILATE_KERNEL
+        if self._scaled_clean is None or self._scaled_clean[0] != scale:
+            ksize = max(3, int(7 * scale) | 1)
+            size = 2 * round(6 * scale) + 1
+            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (size, size))
+            self._scaled_clean = (scale, ksize, kernel)
+        return self._scaled_clean[1], self._scaled_clean[2]
+
+    def _analyze(
+        self,
+        frame: np.ndarray,
+        mask: Optional[np.ndarray],
+        scale: float
+    ) -> Tuple[bool, PersonState, Optional[Tuple[int, int, int, int]]]:
+        """Stage 3: find the person in the cleaned mask and update fall state."""
+        if mask is None:
+            return False, PersonState.UNKNOWN, None
 
-        # Find largest contour (assume it's the person)
-        person_contour = None
-        max_area = 0
+        min_area = self.min_person_area * scale * scale
 
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area > max_area and area >= self.min_person_area:
-                max_area = area
-                person_contour = contour
+        # Label foreground objects; stats rows are (x, y, w, h, area),
+        # with row 0 being the background
+        _, _, stats, centroids = cv2.connectedComponentsWithStats(
+            mask, labels=self._label_buffer(mask), connectivity=8, ltype=cv2.CV_32S
+        )
+        areas = stats[1:, cv2.CC_STAT_AREA]
 
-        if person_contour is None:
+        if areas.size == 0 or areas.max() < min_area:
             # No person detected
             self.current_state = PersonState.UNKNOWN
             return False, PersonState.UNKNOWN, None
 
+        # Largest object is assumed to be the person
+        person = int(np.argmax(areas)) + 1
+
         # Get bounding box
-        x, y, w, h = cv2.boundingRect(person_contour)
-        bbox = (x, y, w, h)
+        x, y, w, h = stats[person, :4].tolist()
+        if scale == 1.0:
+            bbox = (x, y, w, h)
+        else:
+            bbox = (round(x / scale), round(y / scale), round(w / scale), round(h / scale))
 
         # Calculate aspect ratio
         aspect_ratio = h / w if w > 0 else 0
 
-        # Calculate centroid
-        M = cv2.moments(person_contour)
-        if M["m00"] > 0:
-            cx = int(M["m10"] / M["m00"])
-            cy = int(M["m01"] / M["m00"])
-            current_centroid = (cx, cy)
-        else:
-            current_centroid = (x + w // 2, y + h // 2)
+        # Centroid of the person's pixels, from the same labelling pass
+        cx, cy = centroids[person]
+        current_centroid = (int(cx), int(cy))
 
         # Determine person state based on aspect ratio
         if aspect_ratio >= self.aspect_ratio_threshold:
@@ -189,8 +271,9 @@ class FallDetector:
         else:
             new_state = PersonState.SITTING
 
-        # Detect fall transition
+        # Detect fall transition; one clock read serves the whole update
         fall_detected = False
+        now = time.time()
 
         if self.previous_state != new_state:
             # State changed
@@ -199,13 +282,13 @@ class FallDetector:
                 if self.previous_centroid is not None:
                     # Calculate vertical velocity
                     dy = current_centroid[1] - self.previous_centroid[1]
-                    vertical_velocity = abs(dy) / frame.shape[0]
+                    vertical_velocity = abs(dy) / mask.shape[0]
 
                     if vertical_velocity >= self.fall_velocity_threshold:
                         # Fast vertical movement detected
                         fall_detected = True
                         self.fall_detected = True
-                        self.fall_time = time.time()
+                        self.fall_time = now
                         self.fall_count += 1
                         self.current_state = PersonState.FALLEN
 
@@ -213,18 +296,18 @@ class FallDetector:
                             self.fall_callback(frame, bbox, vertical_velocity)
 
             self.previous_state = new_state
-            self.state_start_time = time.time()
+            self.state_start_time = now
 
         # Check for prolonged inactivity in lying position
         if new_state == PersonState.LYING and not fall_detected:
             if self.state_start_time is not None:
-                time_in_state = time.time() - self.state_start_time
+                time_in_state = now - self.state_start_time
                 if time_in_state >= self.inactivity_timeout:
                     # Person lying down for too long
                     if not self.fall_detected:
                         fall_detected = True
                         self.fall_detected = True
-                        self.fall_time = time.time()
+                        self.fall_time = now
                         self.fall_count += 1
                         self.current_state = PersonState.FALLEN
 
@@ -239,13 +322,41 @@ class FallDetector:
 
         return fall_detected, self.current_state, bbox
 
+    def _label_buffer(self, mask: np.ndarray) -> np.ndarray:
+        """Reused int32 label image for connectedComponentsWithStats."""
+        if self._labels is None or self._labels.shape != mask.shape:
+            self._labels = np.empty(mask.shape, dtype=np.int32)
+        return self._labels
+
+    def _shrink(self, frame: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Return frame resized to proc_width and the scale applied."""
+        if not self.proc_width or frame.shape[1] <= self.proc_width:
+            return frame, 1.0
+        scale = self.proc_width / frame.shape[1]
+        height = max(1, round(frame.shape[0] * scale))
+        shape = (height, self.proc_width) + frame.shape[2:]
+        if self._small is None or self._small.shape != shape or self._small.dtype != frame.dtype:
+            self._small = np.empty(shape, dtype=frame.dtype)
+        cv2.resize(frame, (self.proc_width, height), dst=self._small, interpolation=cv2.INTER_AREA)
+        return self._small, scale
+
+    def _to_gray(self, frame: np.ndarray) -> np.ndarray:
+        """Return frame converted to single-channel gray."""
+        if frame.ndim == 2:
+            return frame
+        if self._gray is None or self._gray.shape != frame.shape[:2]:
+            self._gray = np.empty(frame.shape[:2], dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        return self._gray
+
     def draw_detection(
         self,
         frame: np.ndarray,
         bbox: Optional[Tuple[int, int, int, int]],
         state: PersonState,
         color: Optional[Tuple[int, int, int]] = None,
-        thickness: int = 2
+        thickness: int = 2,
+        inplace: bool = False
     ) -> np.ndarray:
         """
         Draw fall detection visualization on frame.
@@ -256,11 +367,12 @@ class FallDetector:
             state: Person state
             color: Box color (BGR), auto-selected if None
             thickness: Line thickness
+            inplace: Draw directly onto frame instead of a copy
 
         Returns:
             Annotated frame
         """
-        output = frame.copy()
+        output = frame if inplace else frame.copy()
 
         if bbox is None:
             return output
@@ -269,24 +381,15 @@ class FallDetector:
 
         # Auto-select color based on state
         if color is None:
-            if state == PersonState.FALLEN:
-                color = (0, 0, 255)  # Red for fall
-            elif state == PersonState.LYING:
-                color = (0, 165, 255)  # Orange for lying
-            elif state == PersonState.STANDING:
-                color = (0, 255, 0)  # Green for standing
-            else:
-                color = (255, 255, 0)  # Cyan for sitting/unknown
+            color = _STATE_COLORS[state]
 
         # Draw bounding box
         cv2.rectangle(output, (x, y), (x + w, y + h), color, thickness)
 
         # Draw state label
-        label = f"{state.value.upper()}"
-        if state == PersonState.FALLEN:
-            label = "FALL DETECTED!"
+        label = _STATE_LABELS[state]
 
-        label_size, _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)
+        label_size = _LABEL_SIZES[label]
         cv2.rectangle(
             output,
             (x, y - label_size[1] - 10),
@@ -343,11 +446,25 @@ class FallDetector:
         self.fall_time = None
         self.total_frames = 0
         self.fall_count = 0
-        self.bg_subtractor = cv2.createBackgroundSubtractorMOG2(
+        self.bg_subtractor = self._create_bg_subtractor()
+
+    def _create_bg_subtractor(self):
+        """
+        Create the background model selected by bg_method.
+
+        MOG2 shadows are still classified but written to the mask as
+        background, so no separate pass is needed to strip them.
+        """
+        if self.bg_method == "MEAN":
+            return RunningAverageSubtractor(alpha=0.02, threshold=25)
+
+        subtractor = cv2.createBackgroundSubtractorMOG2(
             history=500,
             varThreshold=16,
             detectShadows=True
         )
+        subtractor.setShadowValue(0)
+        return subtractor
 
     def pause(self):
         """
@@ -24,12 +24,24 @@ Motion Detection Module.
 """
 
 import cv2
+import math
 import numpy as np
 import time
 from typing import List, Tuple, Optional, Callable
 from .background_subtractor import BackgroundSubtractor
 
 
+def _box_size(ksize: int) -> int:
+    """
+    Box width whose three passes approximate GaussianBlur(ksize).
+
+    Uses OpenCV's default sigma for ksize; three box passes of width w
+    have variance (w^2 - 1) / 4.
+    """
+    sigma = 0.3 * ((ksize - 1) * 0.5 - 1) + 0.8
+    return int(round(math.sqrt(4 * sigma * sigma + 1))) | 1
+
+
 class MotionDetector:
     """
     Motion detection using background subtraction and contour analysis.
@@ -38,23 +50,41 @@ class MotionDetector:
     caused by lighting changes, shadows, and noise.
     """
 
+    # Per-pixel luma change between consecutive frames counted by the
+    # gate_pixels quick-reject check
+    GATE_THRESHOLD = 20
+
     def __init__(
         self,
         min_area: int = 500,
         blur_size: int = 21,
         threshold: int = 25,
         dilate_iterations: int = 2,
-        motion_callback: Optional[Callable] = None
+        motion_callback: Optional[Callable] = None,
+        proc_width: Optional[int] = None,
+        gray: bool = False,
+        gate_pixels: Optional[int] = None
     ):
         """
         Initialize motion detector.
 
         Args:
             min_area: Minimum contour area to consider as motion (pixels)
-            blur_size: Gaussian blur kernel size (must be odd)
+            blur_size: Gaussian blur kernel size (must be odd); the blur
+                       is approximated by three box filter passes
             threshold: Binary threshold value (0-255)
             dilate_iterations: Morphological dilation iterations
             motion_callback: Callback function(frame, boxes) when motion detected
+            proc_width: Width to downscale frames to before detection
+                        (None = full resolution). min_area, blur_size,
+                        the dilation and returned boxes stay in
+                        full-frame pixels.
+            gray: Model the background on luma only. Cheaper, but motion
+                  that only changes color is not seen.
+            gate_pixels: Skip the background model on frames where no
+                         more than this many pixels (full-frame) changed
+                         since the previous frame (None = never skip).
+                         Motion slower than the gate can see is missed.
 
         Raises:
             ValueError: If blur_size is not odd or parameters are invalid
@@ -65,14 +95,44 @@ class MotionDetector:
             raise ValueError("threshold must be between 0 and 255")
         if min_area < 0:
             raise ValueError("min_area must be positive")
+        if proc_width is not None and proc_width <= 0:
+            raise ValueError("proc_width must be positive")
+        if gate_pixels is not None and gate_pixels < 0:
+            raise ValueError("gate_pixels must not be negative")
 
         self.min_area = min_area
         self.blur_size = blur_size
         self.threshold = threshold
         self.dilate_iterations = dilate_iterations
         self.motion_callback = motion_callback
-
-        self.bg_subtractor = BackgroundSubtractor(method="MOG2")
+        self.proc_width = proc_width
+        self.gray = gray
+        self.gate_pixels = gate_pixels
+
+        # Dilation kernel, built once: n passes of a 5x5 square equal one
+        # pass of a (4n+1)x(4n+1) square, which OpenCV runs as separable
+        # row/column max filters
+        size = 4 * dilate_iterations + 1
+        self._dilate_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (size, size))
+
+        # Kernel shrunk for the current proc_width scale, as (scale, kernel)
+        self._scaled_dilate = None
+
+        # Per-frame scratch images, reused while the frame size is
+        # unchanged. Each is only touched by one detect() stage, so they
+        # are also safe under PipelinedDetector
+        self._small = None
+        self._labels = None
+
+        # Luma of the previous and current frame plus their difference,
+        # for the gate_pixels check
+        self._gate_prev = None
+        self._gate_cur = None
+        self._gate_diff = None
+
+        # Shadows are still classified by MOG2 but written to the mask as
+        # background, so no separate pass is needed to strip them
+        self.bg_subtractor = BackgroundSubtractor(method="MOG2", shadow_value=0, gray=gray)
         self.motion_detected = False
         self.last_motion_time = None
         self.motion_count = 0
@@ -96,42 +156,93 @@ class MotionDetector:
         if frame is None or frame.size == 0:
             raise ValueError("Invalid frame: frame is None or empty")
 
+        fg_mask, scale = self._foreground(frame)
+        if fg_mask is not None:
+            self._clean(fg_mask, scale)
+        return self._analyze(frame, fg_mask, scale)
+
+    # detect() is split into the stages below so PipelinedDetector can
+    # run them on separate threads; each stage sees frames in order
+
+    def _foreground(self, frame: np.ndarray) -> Tuple[Optional[np.ndarray], float]:
+        """Stage 1: foreground mask and scale, or no mask if paused or idle."""
         # If paused, return no motion
         if self.paused:
-            return False, []
+            return None, 1.0
 
         self.total_frames += 1
 
-        # Apply background subtraction
-        fg_mask = self.bg_subtractor.apply(frame)
+        # Run the mask pipeline on a reduced copy if proc_width is set;
+        # the later stages shrink the blur kernel and area limit with it
+        small, scale = self._shrink(frame)
 
-        # Remove shadows (value 127) - set to background (0)
-        fg_mask[fg_mask == 127] = 0
+        # Quick reject: leave the background model alone while the scene
+        # is not changing from frame to frame
+        if self.gate_pixels is not None and self._is_idle(small, scale):
+            return None, scale
 
-        # Apply Gaussian blur to reduce noise
-        blurred = cv2.GaussianBlur(fg_mask, (self.blur_size, self.blur_size), 0)
+        # Apply background subtraction
+        return self.bg_subtractor.apply(small), scale
+
+    def _clean(self, fg_mask: np.ndarray, scale: float):
+        """Stage 2: denoise and fill the foreground mask in place."""
+        if scale == 1.0:
+            blur_size = self.blur_size
+        else:
+            blur_size = max(3, int(self.blur_size * scale) | 1)
 
-        # Apply binary threshold
-        _, thresh = cv2.threshold(blurred, self.threshold, 255, cv2.THRESH_BINARY)
+        # Blur, threshold and dilate in place on the mask, so no
+        # intermediate images are allocated or streamed through memory.
+        # Three box passes approximate the Gaussian at a cost that does
+        # not grow with the kernel size
+        box = (_box_size(blur_size),) * 2
+        for _ in range(3):
+            cv2.blur(fg_mask, box, dst=fg_mask)
+        cv2.threshold(fg_mask, self.threshold, 255, cv2.THRESH_BINARY, dst=fg_mask)
 
         # Dilate to fill holes in detected objects
-        kernel = np.ones((5, 5), np.uint8)
-        dilated = cv2.dilate(thresh, kernel, iterations=self.dilate_iterations)
-
-        # Find contours of moving objects
-        contours, _ = cv2.findContours(
-            dilated,
-            cv2.RETR_EXTERNAL,
-            cv2.CHAIN_APPROX_SIMPLE
+        if self.dilate_iterations > 0:
+            cv2.dilate(fg_mask, self._dilate_kernel_for(scale), dst=fg_mask)
+
+    def _dilate_kernel_for(self, scale: float) -> np.ndarray:
+        """Dilation kernel covering the same full-frame radius at scale."""
+        if scale == 1.0:
+            return self._dilate_kernel
+        if self._scaled_dilate is None or self._scaled_dilate[0] != scale:
+            radius = round(2 * self.dilate_iterations * scale)
+            size = 2 * radius + 1
+            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (size, size))
+            self._scaled_dilate = (scale, kernel)
+        return self._scaled_dilate[1]
+
+    def _analyze(
+        self,
+        frame: np.ndarray,
+        mask: Optional[np.ndarray],
+        scale: float
+    ) -> Tuple[bool, List[Tuple[int, int, int, int]]]:
+        """Stage 3: find moving objects in the cleaned mask and update status."""
+        if mask is None:
+            self.motion_detected = False
+            return False, []
+
+        min_area = self.min_area * scale * scale
+
+        # Label moving objects; stats rows are (x, y, w, h, area), with
+        # row 0 being the background
+        _, _, stats, _ = cv2.connectedComponentsWithStats(
+            mask, labels=self._label_buffer(mask), connectivity=8, ltype=cv2.CV_32S
         )
+        stats = stats[1:]
+
+        # Filter objects by minimum area
+        boxes = stats[stats[:, cv2.CC_STAT_AREA] >= min_area, :4]
 
-        # Filter contours by minimum area
-        bounding_boxes = []
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area >= self.min_area:
-                x, y, w, h = cv2.boundingRect(contour)
-                bounding_boxes.append((x, y, w, h))
+        # Back to full-frame coordinates
+        if scale != 1.0:
+            boxes = np.rint(boxes / scale).astype(int)
+
+        bounding_boxes = [tuple(box) for box in boxes.tolist()]
 
         # Update motion status
         motion_detected = len(bounding_boxes) > 0
@@ -148,12 +259,54 @@ class MotionDetector:
 
         return motion_detected, bounding_boxes
 
+    def _is_idle(self, frame: np.ndarray, scale: float) -> bool:
+        """Check if at most gate_pixels changed since the previous frame."""
+        shape = frame.shape[:2]
+        first = self._gate_prev is None or self._gate_prev.shape != shape
+        if first:
+            self._gate_prev = np.empty(shape, dtype=np.uint8)
+            self._gate_cur = np.empty(shape, dtype=np.uint8)
+            self._gate_diff = np.empty(shape, dtype=np.uint8)
+
+        if frame.ndim == 3:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gate_cur)
+        else:
+            np.copyto(self._gate_cur, frame)
+        self._gate_prev, self._gate_cur = self._gate_cur, self._gate_prev
+
+        # Nothing to compare the first frame against, so let it through
+        if first:
+            return False
+
+        cv2.absdiff(self._gate_prev, self._gate_cur, dst=self._gate_diff)
+        cv2.threshold(self._gate_diff, self.GATE_THRESHOLD, 255, cv2.THRESH_BINARY, dst=self._gate_diff)
+        return cv2.countNonZero(self._gate_diff) <= self.gate_pixels * scale * scale
+
+    def _label_buffer(self, mask: np.ndarray) -> np.ndarray:
+        """Reused int32 label image for connectedComponentsWithStats."""
+        if self._labels is None or self._labels.shape != mask.shape:
+            self._labels = np.empty(mask.shape, dtype=np.int32)
+        return self._labels
+
+    def _shrink(self, frame: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Return frame resized to proc_width and the scale applied."""
+        if not self.proc_width or frame.shape[1] <= self.proc_width:
+            return frame, 1.0
+        scale = self.proc_width / frame.shape[1]
+        height = max(1, round(frame.shape[0] * scale))
+        shape = (height, self.proc_width) + frame.shape[2:]
+        if self._small is None or self._small.shape != shape or self._small.dtype != frame.dtype:
+            self._small = np.empty(shape, dtype=frame.dtype)
+        cv2.resize(frame, (self.proc_width, height), dst=self._small, interpolation=cv2.INTER_AREA)
+        return self._small, scale
+
     def draw_motion(
         self,
         frame: np.ndarray,
         bounding_boxes: List[Tuple[int, int, int, int]],
         color: Tuple[int, int, int] = (0, 255, 0),
-        thickness: int = 2
+        thickness: int = 2,
+        inplace: bool = False
     ) -> np.ndarray:
         """
         Draw bounding boxes on frame.
@@ -163,16 +316,26 @@ class MotionDetector:
             bounding_boxes: List of (x, y, w, h) tuples
             color: Box color in BGR format
             thickness: Box line thickness
+            inplace: Draw directly onto frame instead of a copy
 
         Returns:
             Frame with bounding boxes and labels drawn
         """
-        output = frame.copy()
+        output = frame if inplace else frame.copy()
 
-        for (x, y, w, h) in bounding_boxes:
-            # Draw rectangle
-            cv2.rectangle(output, (x, y), (x + w, y + h), color, thickness)
+        if not bounding_boxes:
+            return output
 
+        # Draw every rectangle in one call as closed 4-point polylines,
+        # which is exactly how cv2.rectangle rasterizes its outline
+        x, y, w, h = np.asarray(bounding_boxes, dtype=np.int32).T
+        corners = np.stack(
+            [np.stack(c, axis=1) for c in ((x, y), (x + w, y), (x + w, y + h), (x, y + h))],
+            axis=1
+        )
+        cv2.polylines(output, corners, True, color, thickness)
+
+        for (x, y, w, h) in bounding_boxes:
             # Draw label
             label = f"Motion {w}x{h}"
             cv2.putText(
@@ -215,6 +378,7 @@ class MotionDetector:
         self.last_motion_time = None
         self.motion_count = 0
         self.total_frames = 0
+        self._gate_prev = None
         self.bg_subtractor.reset()
 
     def pause(self):
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pipelined Detection Module.
+
+@file       pipeline.py
+@brief      Runs detector work on separate threads.
+@details    Splits MotionDetector/FallDetector processing into background
+            subtraction, mask cleanup and analysis stages connected by
+            bounded queues, so consecutive frames overlap across cores,
+            and runs independent per-camera detectors concurrently.
+
+@author     A.R. Ansari
+@email      ansarirahim1@gmail.com
+@phone      +91 9024304881
+@linkedin   https://www.linkedin.com/in/abdul-raheem-ansari-a6871320/
+
+@project    Raspberry Pi Smart Monitoring Kit
+@client     Yoshinori Ueda
+@version    1.0.0
+@date       2024-12-04
+@copyright  (c) 2024 A.R. Ansari. All rights reserved.
+
+@dependencies
+    - opencv-python >= 4.5.0
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Shared pool for detect_many(), created on first use
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared detection thread pool (one worker per CPU)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                thread_name_prefix="Detect"
+            )
+    return _executor
+
+
+def detect_many(detectors: Sequence, frames: Sequence[np.ndarray]) -> List[Any]:
+    """
+    Run each detector on its own frame concurrently.
+
+    Intended for one detector per camera: detectors[i].detect(frames[i])
+    runs on the shared pool and OpenCV releases the GIL inside it, so N
+    cameras use up to N cores. A detector must not appear twice, since
+    its background model and state are not safe to update concurrently.
+
+    Returns:
+        Results in the same order as detectors
+
+    Raises:
+        ValueError: If the lengths differ or a detector is repeated
+    """
+    if len(detectors) != len(frames):
+        raise ValueError("detectors and frames must have the same length")
+    if len({id(d) for d in detectors}) != len(detectors):
+        raise ValueError("each detector may only appear once")
+
+    if len(detectors) == 1:
+        return [detectors[0].detect(frames[0])]
+
+    executor = _get_executor()
+    futures = [executor.submit(d.detect, f) for d, f in zip(detectors, frames)]
+    return [future.result() for future in futures]
+
+
+class _StageError(NamedTuple):
+    """A frame whose processing raised; passed through to get()."""
+    frame_id: int
+    frame: np.ndarray
+    error: Exception
+
+
+class PipelinedDetector:
+    """
+    Run a detector's stages on three threads.
+
+    Stage 1 applies background subtraction, stage 2 cleans the mask and
+    stage 3 finds objects and updates detector state (including
+    callbacks). OpenCV releases the GIL inside each stage, so while
+    frame n is analyzed, frame n+1 is cleaned and frame n+2 subtracted.
+    Throughput approaches that of the slowest stage.
+
+    Each stage is a single thread reading a FIFO queue, so every stage
+    (and the stateful background model and fall state machine) sees
+    frames in submission order. Frames must not be modified after
+    submit().
+
+    Usage:
+        with PipelinedDetector(MotionDetector()) as pipeline:
+            pipeline.submit(frame)
+            frame_id, frame, (motion, boxes) = pipeline.get()
+    """
+
+    def __init__(
+        self,
+        detector,
+        queue_size: int = 2,
+        cpus: Optional[Sequence[int]] = None
+    ):
+        """
+        Initialize and start the pipeline.
+
+        Args:
+            detector: MotionDetector or FallDetector to run
+            queue_size: Frames buffered between consecutive stages
+            cpus: Optional CPU per stage to pin the stage threads to
+
+        Raises:
+            ValueError: If queue_size < 1 or cpus does not list 3 CPUs
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        if cpus is not None and len(cpus) != 3:
+            raise ValueError("cpus must list one CPU per stage (3)")
+
+        self.detector = detector
+        self._next_id = 0
+
+        # submit() -> stage 1 -> stage 2 -> stage 3 -> get(); results are
+        # unbounded so a caller that submits ahead never deadlocks
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in range(3)]
+        self._results = queue.Queue()
+
+        stages = (self._subtract_stage, self._clean_stage, self._analyze_stage)
+        self._threads = []
+        for index, target in enumerate(stages):
+            cpu = cpus[index] if cpus is not None else None
+            thread = threading.Thread(
+                target=self._run_stage,
+                args=(target, self._queues[index], self._output(index), cpu),
+                name=f"DetectorStage{index + 1}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, frame: np.ndarray) -> int:
+        """
+        Queue frame for detection, blocking while stage 1 is full.
+
+        Returns:
+            Frame ID, matching the ID returned with its result by get()
+
+        Raises:
+            ValueError: If frame is None or empty
+        """
+        if frame is None or frame.size == 0:
+            raise ValueError("Invalid frame: frame is None or empty")
+
+        frame_id = self._next_id
+        self._next_id += 1
+        self._queues[0].put((frame_id, frame, None, 1.0))
+        return frame_id
+
+    def get(self, timeout: Optional[float] = None) -> Tuple[int, np.ndarray, Any]:
+        """
+        Return the next (frame_id, frame, result) in submission order.
+
+        result is what detector.detect(frame) would have returned. After
+        close() has drained the pipeline, returns None.
+
+        Raises:
+            queue.Empty: If no result is ready within timeout
+            Exception: Whatever a stage (e.g. a detector callback) raised
+                while processing this frame
+        """
+        result = self._results.get(timeout=timeout)
+        if isinstance(result, _StageError):
+            raise result.error
+        return result
+
+    def close(self):
+        """Finish queued frames and stop the stage threads."""
+        if not self._threads:
+            return
+        self._queues[0].put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _output(self, index: int) -> queue.Queue:
+        """Queue that stage index writes to."""
+        return self._queues[index + 1] if index < 2 else self._results
+
+    @staticmethod
+    def _run_stage(target, inbox: queue.Queue, outbox: queue.Queue, cpu: Optional[int]):
+        """
+        Apply target to each item until the None sentinel, then pass it on.
+
+        Failed frames continue down the pipeline as _StageError, so
+        results keep their order and the stage thread keeps running.
+        """
+        if cpu is not None:
+            try:
+                # On Linux, pid 0 is the calling thread
+                os.sched_setaffinity(0, {cpu})
+            except (AttributeError, OSError) as e:
+                print(f"Could not pin detector stage to CPU {cpu}: {e}")
+
+        while True:
+            item = inbox.get()
+            if item is None:
+                outbox.put(None)
+                return
+            if isinstance(item, _StageError):
+                outbox.put(item)
+                continue
+            try:
+                outbox.put(target(item))
+            except Exception as e:
+                outbox.put(_StageError(item[0], item[1], e))
+
+    def _subtract_stage(self, item):
+        frame_id, frame, _, _ = item
+        mask, scale = self.detector._foreground(frame)
+        return frame_id, frame, mask, scale
+
+    def _clean_stage(self, item):
+        _, _, mask, scale = item
+        if mask is not None:
+            self.detector._clean(mask, scale)
+        return item
+
+    def _analyze_stage(self, item):
+        frame_id, frame, mask, scale = item
+        return frame_id, frame, self.detector._analyze(frame, mask, scale)
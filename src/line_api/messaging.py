@@ -96,6 +96,10 @@ class LINEMessenger:
         self._error_count = 0
         self._last_message_time = None
 
+        # Set when the API answers 429; retry_after is the suggested wait in seconds
+        self.rate_limited = False
+        self.retry_after = 0.0
+
     def send_alert(
         self,
         event_type: str,
@@ -171,18 +175,34 @@ class LINEMessenger:
                     messages=[TextMessage(text=text)]
                 )
                 self.messaging_api.push_message(push_message_request)
+                self.rate_limited = False
+                self.retry_after = 0.0
                 return True
 
             except Exception as e:
                 self._error_count += 1
+                delay = self.retry_delay
+                if getattr(e, "status", None) == 429:
+                    self.rate_limited = True
+                    self.retry_after = self._parse_retry_after(e)
+                    delay = max(delay, self.retry_after)
                 if attempt < self.max_retries:
-                    time.sleep(self.retry_delay)
+                    time.sleep(delay)
                 else:
                     print(f"Failed to send text message after {self.max_retries} retries: {e}")
                     return False
 
         return False
 
+    def _parse_retry_after(self, error: Exception) -> float:
+        """Return the Retry-After delay from an API error, or retry_delay."""
+        headers = getattr(error, "headers", None) or {}
+        value = headers.get("Retry-After") if hasattr(headers, "get") else None
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return self.retry_delay
+
     def _send_image_message(self, frame: np.ndarray) -> bool:
         """
         Send image message with retry logic.
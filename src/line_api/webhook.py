@@ -22,10 +22,13 @@ LINE Webhook Server Module.
 @dependencies
     - line-bot-sdk >= 3.0.0
     - flask >= 2.0.0
+    - aiohttp >= 3.8.0 (optional, for start_async)
 """
 
+import asyncio
+import os
 import threading
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterable
 from flask import Flask, request, abort
 from linebot.v3 import WebhookHandler
 from linebot.v3.exceptions import InvalidSignatureError
@@ -39,6 +42,13 @@ from linebot.v3.messaging import (
 from linebot.v3.webhooks import MessageEvent, TextMessageContent
 from src.utils.logger import setup_logger
 
+try:
+    from aiohttp import web
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    web = None
+    AIOHTTP_AVAILABLE = False
+
 
 class WebhookServer:
     """
@@ -53,6 +63,7 @@ class WebhookServer:
         command_callback: Callback function(command: str) for processing commands
         host: Server host address
         port: Server port number
+        cpu_affinity: CPUs the server thread is pinned to (optional)
 
     Example:
         def handle_command(command):
@@ -75,7 +86,8 @@ class WebhookServer:
         channel_secret: str,
         command_callback: Optional[Callable[[str], None]] = None,
         host: str = "0.0.0.0",
-        port: int = 5000
+        port: int = 5000,
+        cpu_affinity: Optional[Iterable[int]] = None
     ):
         """Initialize webhook server."""
         if not channel_access_token:
@@ -88,6 +100,7 @@ class WebhookServer:
         self.command_callback = command_callback
         self.host = host
         self.port = port
+        self.cpu_affinity = set(cpu_affinity) if cpu_affinity else None
 
         self.logger = setup_logger("WebhookServer")
 
@@ -105,6 +118,8 @@ class WebhookServer:
         # Server state
         self.running = False
         self.server_thread = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner = None
 
         # Setup routes and handlers
         self._setup_routes()
@@ -204,13 +219,129 @@ class WebhookServer:
         self.server_thread.start()
         self.logger.info(f"Webhook server started on {self.host}:{self.port}")
 
+    def _pin_thread(self):
+        """Pin the calling server thread to cpu_affinity, if configured."""
+        if not self.cpu_affinity:
+            return
+
+        try:
+            # pid 0 targets the calling thread on Linux
+            os.sched_setaffinity(0, self.cpu_affinity)
+            self.logger.info(f"Webhook server pinned to CPUs {sorted(self.cpu_affinity)}")
+        except (AttributeError, OSError) as e:
+            self.logger.warning(f"Could not set webhook CPU affinity: {e}")
+
     def _run_server(self):
         """Run Flask server."""
+        self._pin_thread()
         self.app.run(host=self.host, port=self.port, debug=False)
 
+    def start_async(self):
+        """
+        Start webhook server on an asyncio event loop in a background thread.
+
+        Requests are accepted concurrently by aiohttp; signature checks and
+        command dispatch run in the loop's thread pool because the command
+        callback and reply API are synchronous. Falls back to the Flask
+        server from start() if aiohttp is not installed.
+        """
+        if not AIOHTTP_AVAILABLE:
+            self.logger.warning("aiohttp not available, using Flask server")
+            self.start()
+            return
+
+        if self.running:
+            self.logger.warning("Server already running")
+            return
+
+        self.running = True
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        self.server_thread = threading.Thread(
+            target=self._run_async_server,
+            args=(started,),
+            daemon=True
+        )
+        self.server_thread.start()
+        started.wait(timeout=5)
+
+        if not self.running:
+            # Startup failed (e.g. port in use); the thread has cleaned up
+            self.server_thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+            self.logger.error(f"Async webhook server did not start on {self.host}:{self.port}")
+            return
+
+        self.logger.info(f"Async webhook server started on {self.host}:{self.port}")
+
+    def _create_async_app(self):
+        """Create aiohttp application with the webhook routes."""
+        app = web.Application()
+        app.router.add_post("/webhook", self._async_webhook)
+        app.router.add_get("/health", self._async_health)
+        return app
+
+    def _run_async_server(self, started: threading.Event):
+        """Run aiohttp server until the event loop is stopped."""
+        self._pin_thread()
+        asyncio.set_event_loop(self._loop)
+
+        try:
+            self._runner = web.AppRunner(self._create_async_app())
+            self._loop.run_until_complete(self._runner.setup())
+            site = web.TCPSite(self._runner, self.host, self.port)
+            self._loop.run_until_complete(site.start())
+        except Exception as e:
+            self.logger.error(f"Failed to start async webhook server: {e}")
+            if self._runner is not None:
+                self._loop.run_until_complete(self._runner.cleanup())
+                self._runner = None
+            self.running = False
+            started.set()
+            return
+
+        started.set()
+        self._loop.run_forever()
+
+        self._loop.run_until_complete(self._runner.cleanup())
+        self._loop.close()
+
+    async def _async_webhook(self, req):
+        """Handle webhook POST requests (aiohttp)."""
+        signature = req.headers.get("X-Line-Signature")
+        if not signature:
+            self.logger.warning("Missing X-Line-Signature header")
+            raise web.HTTPBadRequest()
+
+        body = await req.text()
+        self.logger.debug(f"Webhook received: {body}")
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.handler.handle, body, signature
+            )
+        except InvalidSignatureError:
+            self.logger.error("Invalid signature")
+            raise web.HTTPBadRequest()
+
+        return web.Response(text="OK")
+
+    async def _async_health(self, req):
+        """Health check endpoint (aiohttp)."""
+        return web.json_response({"status": "ok", "running": self.running})
+
     def stop(self):
         """Stop webhook server."""
         self.running = False
+
+        if self._loop and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self.server_thread:
+                self.server_thread.join(timeout=5)
+        self._loop = None
+
         self.logger.info("Webhook server stopped")
 
     def is_running(self) -> bool:
@@ -24,18 +24,42 @@ OTA Updater for GitHub-based updates.
 """
 
 import os
+import json
 import shutil
+import hashlib
 import tarfile
 import logging
 import requests
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .version_manager import VersionManager
 
+# Downloads smaller than this are fetched over a single connection
+MIN_PARALLEL_DOWNLOAD_SIZE = 1024 * 1024
+
+# Back off until the rate limit window resets below this many calls
+RATE_LIMIT_LOW_WATERMARK = 10
+
+# Keep-alive session shared by all GitHub requests; transient 5xx and
+# 429 responses are retried with backoff (honouring Retry-After)
+_RETRY = Retry(
+    total=3,
+    backoff_factor=1.0,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=('GET', 'HEAD')
+)
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=_RETRY))
+
 
 class OTAUpdater:
     """
@@ -77,6 +101,10 @@ class OTAUpdater:
         self.backup_enabled = config.get('backup_enabled', True)
         self.backup_path = Path(config.get('backup_path', '/tmp/monitoring_backup'))
         self.max_backups = config.get('max_backups', 3)
+        self.max_download_threads = config.get('max_download_threads', 7)
+        self.release_cache_dir = Path(
+            config.get('release_cache_dir', '~/.cache/yoshi-ota')
+        ).expanduser()
 
         self._running = False
         self._check_thread = None
@@ -84,6 +112,7 @@ class OTAUpdater:
         self._update_available = False
         self._latest_version = None
         self._latest_release = None
+        self._rate_limit_reset = 0.0
 
     def start(self) -> None:
         """Start background update checker."""
@@ -118,12 +147,16 @@ class OTAUpdater:
             except Exception as e:
                 self.logger.error(f"Error in update check loop: {e}")
 
-            time.sleep(self.check_interval)
+            # Wait out an exhausted rate limit window if it ends later
+            time.sleep(max(self.check_interval, self._rate_limit_reset - time.time()))
 
-    def check_for_updates(self) -> bool:
+    def check_for_updates(self, force: bool = False) -> bool:
         """
         Check for available updates from GitHub.
 
+        Args:
+            force: Bypass the release cache and query GitHub
+
         Returns:
             True if update is available, False otherwise
         """
@@ -131,7 +164,7 @@ class OTAUpdater:
             current_version = self.version_manager.get_current_version()
             self.logger.info(f"Checking for updates (current: {current_version})")
 
-            release = self._get_latest_release()
+            release = self._get_cached_release(force)
 
             if not release:
                 self.logger.warning("No releases found")
@@ -157,10 +190,78 @@ class OTAUpdater:
             self.logger.error(f"Error checking for updates: {e}")
             return False
 
-    def _get_latest_release(self) -> Optional[Dict[str, Any]]:
+    def _release_cache_file(self) -> Path:
+        """Get the release cache file for the configured repository."""
+        return self.release_cache_dir / f"{self.github_repo}.json"
+
+    def _load_release_cache(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the cached latest release entry.
+
+        Returns:
+            Cache entry with etag, last_modified, payload and fetched_at,
+            or None if missing or unreadable
+        """
+        try:
+            with open(self._release_cache_file()) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or 'payload' not in entry:
+            return None
+        return entry
+
+    def _save_release_cache(self, entry: Dict[str, Any]) -> None:
+        """
+        Write a release cache entry to disk.
+
+        Args:
+            entry: Cache entry to store
+        """
+        cache_file = self._release_cache_file()
+        tmp_file = cache_file.with_suffix('.tmp')
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not write release cache: {e}")
+
+    def _get_cached_release(self, force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get latest release, served from the on-disk cache when fresh.
+
+        Entries younger than check_interval are returned without any
+        network I/O. Older entries are revalidated with a conditional
+        request, which costs no API quota when the release is unchanged.
+
+        Args:
+            force: Ignore the cache and fetch the release unconditionally
+
+        Returns:
+            Release data dictionary or None if error
+        """
+        cached = None if force else self._load_release_cache()
+
+        if cached and time.time() - cached.get('fetched_at', 0) < self.check_interval:
+            self.logger.debug("Using cached release data")
+            return cached['payload']
+
+        return self._get_latest_release(cached)
+
+    def _get_latest_release(
+        self,
+        cached: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Get latest release from GitHub API.
 
+        Args:
+            cached: Previous cache entry used for a conditional request
+
         Returns:
             Release data dictionary or None if error
         """
@@ -170,18 +271,64 @@ class OTAUpdater:
         if self.github_token:
             headers['Authorization'] = f"token {self.github_token}"
 
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _SESSION.get(url, headers=headers, timeout=10)
+            self._track_rate_limit(response)
+
+            if cached and response.status_code == 304:
+                self.logger.debug("Release unchanged, refreshing cache")
+                cached['fetched_at'] = time.time()
+                self._save_release_cache(cached)
+                return cached['payload']
+
             response.raise_for_status()
-            return response.json()
+            release = response.json()
+
+            self._save_release_cache({
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'payload': release,
+                'fetched_at': time.time()
+            })
+            return release
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error fetching latest release: {e}")
             return None
 
+    def _track_rate_limit(self, response: requests.Response) -> None:
+        """
+        Record when to resume if the GitHub API rate limit is nearly spent.
+
+        Args:
+            response: GitHub API response
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+
+        if not (isinstance(remaining, str) and remaining.isdigit()):
+            return
+
+        if int(remaining) < RATE_LIMIT_LOW_WATERMARK and isinstance(reset, str) and reset.isdigit():
+            self._rate_limit_reset = float(reset)
+            self.logger.warning(
+                f"GitHub rate limit low ({remaining} left), "
+                f"deferring checks until {datetime.fromtimestamp(self._rate_limit_reset)}"
+            )
+
     def download_update(self) -> Optional[Path]:
         """
         Download update tarball from GitHub.
 
+        Large downloads served with byte-range support are split into
+        max_download_threads ranges fetched in parallel; anything else is
+        streamed over a single connection.
+
         Returns:
             Path to downloaded tarball or None if error
         """
@@ -204,12 +351,21 @@ class OTAUpdater:
             if self.github_token:
                 headers['Authorization'] = f"token {self.github_token}"
 
-            response = requests.get(tarball_url, headers=headers, stream=True, timeout=30)
-            response.raise_for_status()
+            url, size = self._probe_download(tarball_url, headers)
 
-            with open(download_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            if (size and self.max_download_threads > 1
+                    and size >= MIN_PARALLEL_DOWNLOAD_SIZE):
+                if urlsplit(url).netloc != urlsplit(tarball_url).netloc:
+                    # Redirected off the API host; don't forward the token
+                    headers = {}
+                self._download_ranges(url, headers, size, download_path)
+            else:
+                response = _SESSION.get(tarball_url, headers=headers, stream=True, timeout=30)
+                response.raise_for_status()
+
+                with open(download_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
 
             self.logger.info(f"Downloaded update to {download_path}")
             return download_path
@@ -218,6 +374,133 @@ class OTAUpdater:
             self.logger.error(f"Error downloading update: {e}")
             return None
 
+    def _probe_download(
+        self,
+        url: str,
+        headers: Dict[str, str]
+    ) -> Tuple[str, Optional[int]]:
+        """
+        Resolve a download URL and check for byte-range support.
+
+        Args:
+            url: Download URL
+            headers: Request headers
+
+        Returns:
+            Tuple of (final URL after redirects, content length), where the
+            length is None if the server does not accept range requests
+        """
+        try:
+            response = _SESSION.head(url, headers=headers, allow_redirects=True, timeout=10)
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            return url, None
+
+        length = response.headers.get('Content-Length', '')
+        if response.headers.get('Accept-Ranges') != 'bytes' or not length.isdigit():
+            return url, None
+
+        return response.url, int(length)
+
+    def _download_ranges(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        size: int,
+        download_path: Path
+    ) -> None:
+        """
+        Download a file as parallel byte ranges.
+
+        Each worker writes its range at the matching file offset, so no
+        reassembly pass is needed. The SHA256 digest of the result is
+        logged once all ranges are in place.
+
+        Args:
+            url: Download URL supporting range requests
+            headers: Request headers
+            size: Total content length in bytes
+            download_path: Destination file
+
+        Raises:
+            IOError: If a range is incomplete or the file size is wrong
+        """
+        workers = self.max_download_threads
+        chunk_size = -(-size // workers)
+        ranges = [
+            (start, min(start + chunk_size, size) - 1)
+            for start in range(0, size, chunk_size)
+        ]
+
+        self.logger.info(f"Fetching {size} bytes in {len(ranges)} parallel ranges")
+
+        fd = os.open(download_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [
+                    executor.submit(self._fetch_range, _SESSION, url, headers, start, end, fd)
+                    for start, end in ranges
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            os.close(fd)
+
+        if download_path.stat().st_size != size:
+            raise IOError(f"Downloaded size mismatch for {download_path}")
+
+        self.logger.info(f"SHA256 {self._sha256(download_path)}  {download_path.name}")
+
+    def _fetch_range(
+        self,
+        session: requests.Session,
+        url: str,
+        headers: Dict[str, str],
+        start: int,
+        end: int,
+        fd: int
+    ) -> None:
+        """
+        Fetch bytes start..end (inclusive) and write them at their offset.
+
+        Args:
+            session: Shared HTTP session
+            url: Download URL
+            headers: Request headers
+            start: First byte offset
+            end: Last byte offset
+            fd: Open file descriptor of the destination file
+
+        Raises:
+            IOError: If the server ignores the range or the body is short
+        """
+        range_headers = dict(headers)
+        range_headers['Range'] = f"bytes={start}-{end}"
+
+        with session.get(url, headers=range_headers, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise IOError(f"Range request not honoured (HTTP {response.status_code})")
+
+            offset = start
+            for chunk in response.iter_content(chunk_size=65536):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+
+        if offset != end + 1:
+            raise IOError(f"Incomplete range {start}-{end}: got {offset - start} bytes")
+
+    @staticmethod
+    def _sha256(path: Path) -> str:
+        """Compute the SHA256 hex digest of a file."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
     def create_backup(self) -> Optional[Path]:
         """
         Create backup of current installation.
@@ -370,6 +653,19 @@ class OTAUpdater:
             self.logger.error(f"Error during rollback: {e}")
             return False
 
+    def get_release_notes(self, max_chars: int = 500) -> Tuple[str, bool]:
+        """
+        Get a preview of the latest release notes.
+
+        Args:
+            max_chars: Maximum number of characters to return
+
+        Returns:
+            Tuple of (notes preview, True if the notes were truncated)
+        """
+        body = (self._latest_release or {}).get('body') or ''
+        return body[:max_chars], len(body) > max_chars
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get current OTA status.
@@ -21,9 +21,23 @@ Version Manager for OTA Updates.
 """
 
 import re
+from functools import lru_cache
 from typing import Tuple
 from pathlib import Path
 
+_VERSION_PATTERN = re.compile(r'^(\d+)\.(\d+)\.(\d+)$')
+
+
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> Tuple[int, int, int]:
+    """Parse and cache a MAJOR.MINOR.PATCH version string."""
+    match = _VERSION_PATTERN.match(version)
+
+    if not match:
+        raise ValueError(f"Invalid version format: {version}")
+
+    return (int(match[1]), int(match[2]), int(match[3]))
+
 
 class VersionManager:
     """
@@ -46,7 +60,7 @@ class VersionManager:
     def __init__(self, version_file: str = "VERSION"):
         """Initialize version manager."""
         self.version_file = Path(version_file)
-        self._version_pattern = re.compile(r'^(\d+)\.(\d+)\.(\d+)$')
+        self._version_pattern = _VERSION_PATTERN
 
     def get_current_version(self) -> str:
         """
@@ -109,12 +123,7 @@ class VersionManager:
         Raises:
             ValueError: If version format is invalid
         """
-        match = self._version_pattern.match(version)
-
-        if not match:
-            raise ValueError(f"Invalid version format: {version}")
-
-        return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        return _parse_version(version)
 
     def compare_versions(self, version1: str, version2: str) -> int:
         """
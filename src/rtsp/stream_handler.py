@@ -25,6 +25,7 @@ RTSP Stream Handler with automatic reconnection.
 
 import cv2
 import time
+import queue
 import threading
 from typing import Optional, Callable
 import numpy as np
@@ -42,7 +43,8 @@ class RTSPStreamHandler:
         reconnect_delay: int = 5,
         max_reconnect_attempts: int = 10,
         frame_callback: Optional[Callable] = None,
-        logger_name: str = "RTSPStreamHandler"
+        logger_name: str = "RTSPStreamHandler",
+        frame_queue_size: int = 2
     ):
         """
         Initialize RTSP stream handler
@@ -53,6 +55,7 @@ class RTSPStreamHandler:
             max_reconnect_attempts: Maximum reconnection attempts (0 = infinite)
             frame_callback: Optional callback function for each frame
             logger_name: Logger name
+            frame_queue_size: Number of decoded frames kept for get_frame()
         """
         self.rtsp_url = rtsp_url
         self.reconnect_delay = reconnect_delay
@@ -69,6 +72,9 @@ class RTSPStreamHandler:
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
         
+        # Newest decoded frames; oldest is dropped when the consumer lags
+        self.frame_queue: queue.Queue = queue.Queue(maxsize=frame_queue_size)
+        
         # Stream statistics
         self.frame_count = 0
         self.error_count = 0
@@ -142,6 +148,36 @@ class RTSPStreamHandler:
             self._thread.join(timeout=5)
         
         self.disconnect()
+        
+        # Wake any consumer blocked in get_frame()
+        self._publish_frame(None)
+    
+    def get_frame(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Get the next frame decoded by the stream thread
+        
+        Args:
+            timeout: Maximum time to wait in seconds (None = wait forever)
+        
+        Returns:
+            Frame, or None on timeout or when the stream is stopped
+        """
+        try:
+            return self.frame_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+    
+    def _publish_frame(self, frame: Optional[np.ndarray]):
+        """Queue a frame for get_frame(), dropping the oldest if full"""
+        while True:
+            try:
+                self.frame_queue.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self.frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
     
     def read_frame(self) -> tuple[bool, Optional[np.ndarray]]:
         """
@@ -183,6 +219,8 @@ class RTSPStreamHandler:
             ret, frame = self.read_frame()
             
             if ret and frame is not None:
+                self._publish_frame(frame)
+                
                 # Call frame callback if provided
                 if self.frame_callback:
                     try:
@@ -194,9 +232,6 @@ class RTSPStreamHandler:
                 self.logger.warning("Frame read failed, triggering reconnection")
                 self.is_connected = False
                 self._cleanup_capture()
-            
-            # Small delay to prevent CPU overload
-            time.sleep(0.001)
     
     def _attempt_reconnect(self) -> bool:
         """
@@ -105,6 +105,40 @@ class ConfigLoader:
         
         return default
     
+    def section(self, name: str) -> Dict[str, Any]:
+        """
+        Get a whole configuration section in one lookup
+        
+        Values are resolved with the same precedence as get(): secrets
+        override the YAML file, and environment variables (e.g.
+        MOTION_DETECTION_ENABLED) override both for top-level keys.
+        
+        Args:
+            name: Section key (dot notation allowed)
+        
+        Returns:
+            New dictionary with the section contents (empty if missing)
+        
+        Examples:
+            >>> motion = ConfigLoader().section('motion_detection')
+            >>> motion.get('enabled')
+            True
+        """
+        merged: Dict[str, Any] = {}
+        
+        for source in (self.config, self.secrets):
+            value = self._get_nested(source, name)
+            if isinstance(value, dict):
+                merged.update(value)
+        
+        prefix = name.upper().replace('.', '_') + '_'
+        for k in merged:
+            env_value = os.getenv(prefix + str(k).upper())
+            if env_value is not None:
+                merged[k] = env_value
+        
+        return merged
+    
     def _get_nested(self, data: Dict, key: str) -> Optional[Any]:
         """
         Get nested dictionary value using dot notation
@@ -25,10 +25,16 @@ Voice Alert Player for audio notifications.
 
 import os
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 import pygame
 
+# Interval and limit for re-checking a channel still draining at end of sound
+PLAYBACK_END_RECHECK = 0.05
+PLAYBACK_END_MAX_RECHECKS = 20
+
 
 class VoiceAlertPlayer:
     """
@@ -68,6 +74,16 @@ class VoiceAlertPlayer:
         self._play_count = 0
         self._last_play_time = None
 
+        # Set whenever nothing is playing
+        self.playback_done = threading.Event()
+        self.playback_done.set()
+        self._end_timer = None
+        self._timer_lock = threading.Lock()
+
+        # Bumped for every new sound (and on stop), so end checks armed
+        # for an earlier sound can tell they are stale
+        self._playback_gen = 0
+
         self._initialize_pygame()
 
     def _validate_config(self) -> None:
@@ -120,17 +136,86 @@ class VoiceAlertPlayer:
             return False
 
         try:
-            self._sound.play()
+            with self._timer_lock:
+                self._playback_gen += 1
+                generation = self._playback_gen
+                self.playback_done.clear()
+            channel = self._sound.play()
+            self._schedule_playback_end(channel, float(self._sound.get_length()), generation)
             self._play_count += 1
-            import time
             self._last_play_time = time.time()
             self.logger.info(f"Playing voice alert for {event_type}")
             return True
 
         except Exception as e:
             self.logger.error(f"Failed to play alert: {e}")
+            self._finish_playback()
             return False
 
+    def _schedule_playback_end(
+        self,
+        channel,
+        delay: float,
+        generation: int,
+        rechecks: int = 0
+    ) -> None:
+        """
+        Arm a timer that fires when the current sound should have ended.
+
+        Args:
+            channel: pygame Channel the sound is playing on
+            delay: Seconds until the end check
+            generation: Playback generation the sound was started in
+            rechecks: Number of end checks already made for this sound
+        """
+        timer = threading.Timer(
+            delay, self._check_playback_end, args=(channel, generation, rechecks)
+        )
+        timer.daemon = True
+
+        with self._timer_lock:
+            if generation != self._playback_gen:
+                # A newer sound owns the end timer
+                return
+            if self._end_timer:
+                self._end_timer.cancel()
+            self._end_timer = timer
+
+        timer.start()
+
+    def _check_playback_end(self, channel, generation: int, rechecks: int) -> None:
+        """Set playback_done, or re-check shortly if the mixer is still draining."""
+        if (channel is not None and channel.get_busy()
+                and rechecks < PLAYBACK_END_MAX_RECHECKS):
+            self._schedule_playback_end(channel, PLAYBACK_END_RECHECK, generation, rechecks + 1)
+            return
+
+        with self._timer_lock:
+            if generation == self._playback_gen:
+                self._end_timer = None
+                self.playback_done.set()
+
+    def _finish_playback(self) -> None:
+        """Cancel the end-of-playback timer and mark playback as done."""
+        with self._timer_lock:
+            self._playback_gen += 1
+            if self._end_timer:
+                self._end_timer.cancel()
+                self._end_timer = None
+            self.playback_done.set()
+
+    def wait_playback_done(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the current alert has finished playing.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None = wait forever)
+
+        Returns:
+            True if playback finished, False on timeout
+        """
+        return self.playback_done.wait(timeout)
+
     def set_volume(self, volume: float) -> None:
         """
         Set playback volume.
@@ -191,6 +276,7 @@ class VoiceAlertPlayer:
         if self._initialized:
             pygame.mixer.stop()
             self.logger.info("Stopped audio playback")
+        self._finish_playback()
 
     def load_audio(self, audio_file: str) -> bool:
         """
@@ -223,6 +309,9 @@ class VoiceAlertPlayer:
 
     def cleanup(self) -> None:
         """Cleanup pygame resources."""
+        if hasattr(self, 'playback_done'):
+            self._finish_playback()
+
         if hasattr(self, '_initialized') and self._initialized:
             pygame.mixer.quit()
             self._initialized = False
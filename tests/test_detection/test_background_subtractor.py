@@ -13,7 +13,7 @@ Project: Raspberry Pi Smart Monitoring Kit
 import pytest
 import numpy as np
 import cv2
-from src.detection.background_subtractor import BackgroundSubtractor
+from src.detection.background_subtractor import BackgroundSubtractor, RunningAverageSubtractor
 
 
 class TestBackgroundSubtractor:
@@ -61,6 +61,103 @@ class TestBackgroundSubtractor:
         assert mask.shape == (480, 640)
         assert mask.dtype == np.uint8
     
+    def test_apply_downscale_gray(self):
+        """Test apply on a downscaled grayscale copy of the frame."""
+        subtractor = BackgroundSubtractor(downscale=2, gray=True)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        
+        mask = subtractor.apply(frame)
+        
+        assert mask.shape == (240, 320)
+        assert mask.dtype == np.uint8
+    
+    def test_downscale_detects_moving_object(self):
+        """Test detection still works on the reduced frames."""
+        subtractor = BackgroundSubtractor(downscale=2, gray=True)
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        
+        for _ in range(20):
+            subtractor.apply(bg)
+        
+        frame = bg.copy()
+        cv2.rectangle(frame, (100, 100), (200, 200), (255, 255, 255), -1)
+        mask = subtractor.apply(frame)
+        
+        # Rectangle lands at half the coordinates in the mask
+        assert np.count_nonzero(mask[50:100, 50:100]) > 0
+    
+    def test_skip_duplicates_reuses_mask(self):
+        """Test repeated frames return the cached mask without a model update."""
+        subtractor = BackgroundSubtractor(skip_duplicates=True)
+        frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+        
+        first = subtractor.apply(frame)
+        subtractor.subtractor = None  # Would fail if the model ran again
+        second = subtractor.apply(frame.copy())
+        
+        assert np.array_equal(first, second)
+        assert second is not first
+    
+    def test_skip_duplicates_force(self):
+        """Test force runs the model on a repeated frame."""
+        subtractor = BackgroundSubtractor(skip_duplicates=True)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        subtractor.apply(frame)
+        
+        calls = []
+        model = subtractor.subtractor
+        
+        class Spy:
+            def apply(self, img, learningRate=-1):
+                calls.append(img)
+                return model.apply(img, learningRate=learningRate)
+        
+        subtractor.subtractor = Spy()
+        subtractor.apply(frame)
+        subtractor.apply(frame, force=True)
+        
+        assert len(calls) == 1
+    
+    def test_skip_duplicates_detects_small_change(self):
+        """Test a single changed pixel is not treated as a duplicate."""
+        subtractor = BackgroundSubtractor(skip_duplicates=True)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        subtractor.apply(frame)
+        
+        changed = frame.copy()
+        changed[10, 10] = 255
+        
+        assert subtractor._fingerprint(changed) != subtractor._last_hash
+    
+    def test_use_opencl_falls_back_to_cpu(self):
+        """Test use_opencl still returns a host mask with or without a device."""
+        subtractor = BackgroundSubtractor(use_opencl=True)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        
+        mask = subtractor.apply(frame)
+        
+        assert subtractor.use_opencl == cv2.ocl.haveOpenCL()
+        assert isinstance(mask, np.ndarray)
+        assert mask.shape == (480, 640)
+    
+    def test_shadow_value(self):
+        """Test shadow_value is applied to the model and survives reset."""
+        subtractor = BackgroundSubtractor(shadow_value=0)
+        assert subtractor.subtractor.getShadowValue() == 0
+        
+        subtractor.reset()
+        assert subtractor.subtractor.getShadowValue() == 0
+    
+    def test_initialization_invalid_shadow_value(self):
+        """Test initialization with invalid shadow_value."""
+        with pytest.raises(ValueError, match="shadow_value"):
+            BackgroundSubtractor(shadow_value=300)
+    
+    def test_initialization_invalid_downscale(self):
+        """Test initialization with invalid downscale."""
+        with pytest.raises(ValueError, match="downscale"):
+            BackgroundSubtractor(downscale=0)
+    
     def test_apply_invalid_frame(self):
         """Test apply with invalid frame."""
         subtractor = BackgroundSubtractor()
@@ -159,3 +256,52 @@ class TestBackgroundSubtractor:
         mask = subtractor.apply(frame)
         assert mask is not None
 
+
+class TestRunningAverageSubtractor:
+    """Test cases for RunningAverageSubtractor class."""
+
+    def test_detects_new_object(self):
+        """Test an object absent from the background is foreground."""
+        subtractor = RunningAverageSubtractor()
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(10):
+            mask = subtractor.apply(bg)
+        assert cv2.countNonZero(mask) == 0
+
+        frame = bg.copy()
+        cv2.rectangle(frame, (100, 100), (200, 200), (255, 255, 255), -1)
+        mask = subtractor.apply(frame)
+
+        assert mask.shape == (480, 640)
+        assert mask.dtype == np.uint8
+        assert set(np.unique(mask)) == {0, 255}
+        assert cv2.countNonZero(mask) == 101 * 101
+
+    def test_static_object_fades_into_background(self):
+        """Test an object that stops moving is absorbed by the average."""
+        subtractor = RunningAverageSubtractor(alpha=0.1)
+        bg = np.zeros((240, 320), dtype=np.uint8)
+        subtractor.apply(bg)
+
+        frame = bg.copy()
+        cv2.rectangle(frame, (100, 100), (150, 150), 255, -1)
+        assert cv2.countNonZero(subtractor.apply(frame)) > 0
+
+        for _ in range(30):
+            mask = subtractor.apply(frame)
+        assert cv2.countNonZero(mask) == 0
+        assert subtractor.getBackgroundImage()[120, 120] > 200
+
+    def test_background_before_first_frame(self):
+        """Test getBackgroundImage before any frame is seen."""
+        assert RunningAverageSubtractor().getBackgroundImage() is None
+
+    def test_initialization_invalid_alpha(self):
+        """Test initialization with invalid alpha."""
+        with pytest.raises(ValueError, match="alpha"):
+            RunningAverageSubtractor(alpha=0)
+
+    def test_initialization_invalid_threshold(self):
+        """Test initialization with invalid threshold."""
+        with pytest.raises(ValueError, match="threshold"):
+            RunningAverageSubtractor(threshold=300)
@@ -77,12 +77,27 @@ class TestEventLogger:
         
         frame = np.zeros((480, 640, 3), dtype=np.uint8)
         event_id = logger.log_event("motion", frame=frame)
+        logger.flush()
         
         assert "snapshot" in logger.events[0]
         snapshot_path = logger.events[0]["snapshot"]
         assert os.path.exists(snapshot_path)
         assert snapshot_path.endswith(".jpg")
     
+    def test_close_writes_pending_snapshots(self, temp_dir):
+        """Test close() writes queued snapshots and stops the writer."""
+        snapshot_dir = os.path.join(temp_dir, "snapshots")
+        logger = EventLogger(log_dir=temp_dir, snapshot_dir=snapshot_dir)
+        
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+        for _ in range(3):
+            logger.log_event("motion", frame=frame)
+        logger.close()
+        
+        assert logger._io_thread is None
+        for event in logger.events:
+            assert os.path.exists(event["snapshot"])
+    
     def test_log_event_timestamp(self, temp_dir):
         """Test event timestamp."""
         logger = EventLogger(log_dir=temp_dir, save_snapshots=False)
@@ -198,12 +213,93 @@ class TestEventLogger:
         logger1 = EventLogger(log_dir=log_dir, save_snapshots=False)
         logger1.log_event("motion")
         logger1.log_event("fall")
+        logger1.flush()
 
         # Create new logger instance (should load existing events)
         logger2 = EventLogger(log_dir=log_dir, save_snapshots=False)
 
         assert len(logger2.events) == 2
 
+    def test_persistence_appends_lines(self, temp_dir):
+        """Test each event is appended to the log as one JSON line."""
+        logger = EventLogger(log_dir=temp_dir, save_snapshots=False)
+        logger.log_event("motion")
+        logger.log_event("fall")
+        logger.close()
+
+        with open(os.path.join(temp_dir, "motion_events.jsonl")) as f:
+            lines = [json.loads(line) for line in f]
+
+        assert [e["event_type"] for e in lines] == ["motion", "fall"]
+
+    def test_log_lines_batched_until_flush(self, temp_dir):
+        """Test log lines are buffered and written in one batch."""
+        logger = EventLogger(log_dir=temp_dir, save_snapshots=False)
+        log_file = os.path.join(temp_dir, "motion_events.jsonl")
+        logger.log_event("motion")
+        logger.log_event("fall")
+
+        assert os.path.getsize(log_file) == 0
+
+        logger.flush()
+        with open(log_file) as f:
+            assert len(f.readlines()) == 2
+        logger.close()
+
+    def test_log_lines_flushed_by_timer(self, temp_dir):
+        """Test pending log lines are written after LOG_FLUSH_INTERVAL."""
+        logger = EventLogger(log_dir=temp_dir, save_snapshots=False)
+        logger.LOG_FLUSH_INTERVAL = 0.05
+        logger.log_event("motion")
+
+        time.sleep(0.3)
+
+        with open(os.path.join(temp_dir, "motion_events.jsonl")) as f:
+            assert len(f.readlines()) == 1
+        logger.close()
+
+    def test_persistence_after_clear_by_type(self, temp_dir):
+        """Test clearing by type rewrites the log file."""
+        logger1 = EventLogger(log_dir=temp_dir, save_snapshots=False)
+        logger1.log_event("motion")
+        logger1.log_event("fall")
+        logger1.clear_events(event_type="motion")
+
+        logger2 = EventLogger(log_dir=temp_dir, save_snapshots=False)
+
+        assert [e["event_type"] for e in logger2.events] == ["fall"]
+
+    def test_load_keeps_newest_lines(self, temp_dir):
+        """Test loading a long log keeps only the newest max_events lines."""
+        with open(os.path.join(temp_dir, "motion_events.jsonl"), "w") as f:
+            for i in range(25):
+                f.write(json.dumps({"event_id": f"motion_{i}", "event_type": "motion",
+                                    "timestamp": float(i), "metadata": {}}) + "\n")
+            f.write('{"event_id": "cut')
+
+        logger = EventLogger(log_dir=temp_dir, save_snapshots=False, max_events=10)
+
+        assert [e["event_id"] for e in logger.events] == [f"motion_{i}" for i in range(16, 25)]
+        assert logger._file_events == 25
+
+    def test_torn_last_line_repaired_before_append(self, temp_dir):
+        """Test a partial last line does not swallow the next event."""
+        log_file = os.path.join(temp_dir, "motion_events.jsonl")
+        with open(log_file, "w") as f:
+            f.write(json.dumps({"event_id": "motion_0", "event_type": "motion",
+                                "timestamp": 0.0, "metadata": {}}) + "\n")
+            f.write('{"event_type":"mot')
+
+        logger1 = EventLogger(log_dir=temp_dir, save_snapshots=False)
+        logger1.log_event("fall")
+        logger1.close()
+
+        logger2 = EventLogger(log_dir=temp_dir, save_snapshots=False)
+
+        assert [e["event_type"] for e in logger2.events] == ["motion", "fall"]
+        with open(log_file) as f:
+            assert len(f.readlines()) == 2
+
     def test_max_events_limit(self, temp_dir):
         """Test maximum events limit."""
         logger = EventLogger(log_dir=temp_dir, save_snapshots=False, max_events=10)
@@ -215,6 +311,18 @@ class TestEventLogger:
         # Should keep only last 10 events
         assert len(logger.events) == 10
 
+    def test_max_events_limit_updates_type_counts(self, temp_dir):
+        """Test evicted events are dropped from per-type counts."""
+        logger = EventLogger(log_dir=temp_dir, save_snapshots=False, max_events=3)
+
+        logger.log_event("fall")
+        for _ in range(3):
+            logger.log_event("motion")
+
+        assert logger.get_event_count(event_type="fall") == 0
+        assert logger.get_event_count(event_type="motion") == 3
+        assert logger.get_events(event_type="fall") == []
+
     def test_events_sorted_newest_first(self, temp_dir):
         """Test events are returned newest first."""
         logger = EventLogger(log_dir=temp_dir, save_snapshots=False)
@@ -187,6 +187,109 @@ class TestFallDetector:
         assert state == PersonState.FALLEN
         assert detector.fall_count == 1
 
+    def test_proc_width_standing_bbox_in_frame_coordinates(self):
+        """Test downscaled detection reports boxes in full-frame pixels."""
+        full = FallDetector(min_person_area=1000)
+        detector = FallDetector(min_person_area=1000, proc_width=320)
+
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(20):
+            full.detect(bg)
+            detector.detect(bg)
+
+        frame = bg.copy()
+        cv2.rectangle(frame, (250, 100), (350, 400), (255, 255, 255), -1)
+
+        _, _, expected = full.detect(frame)
+        fall, state, bbox = detector.detect(frame)
+
+        assert state == PersonState.STANDING
+        x, y, w, h = bbox
+        assert x <= 250 and x + w >= 350
+        assert y <= 100 and y + h >= 400
+        assert x + w <= 640 and y + h <= 480
+        # Blur and dilation scale with proc_width, so the box is not inflated
+        for got, want in zip(bbox, expected):
+            assert abs(got - want) <= 3
+
+    def test_gray_standing_detection(self):
+        """Test the luma-only model detects a standing person."""
+        detector = FallDetector(min_person_area=1000, gray=True)
+
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(20):
+            detector.detect(bg)
+
+        frame = bg.copy()
+        cv2.rectangle(frame, (250, 100), (350, 400), (255, 255, 255), -1)
+
+        fall, state, bbox = detector.detect(frame)
+
+        assert state == PersonState.STANDING
+        x, y, w, h = bbox
+        assert x <= 250 and x + w >= 350
+
+    def test_mean_background_fall_detection(self):
+        """Test standing to lying fall is detected with the running-mean model."""
+        detector = FallDetector(
+            min_person_area=1000,
+            fall_velocity_threshold=0.2,
+            bg_method="MEAN"
+        )
+
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(20):
+            detector.detect(bg)
+
+        frame1 = bg.copy()
+        cv2.rectangle(frame1, (250, 100), (350, 400), (255, 255, 255), -1)
+        for _ in range(5):
+            fall, state, bbox = detector.detect(frame1)
+        assert state == PersonState.STANDING
+
+        frame2 = bg.copy()
+        cv2.rectangle(frame2, (100, 350), (400, 400), (255, 255, 255), -1)
+
+        fall, state, bbox = detector.detect(frame2)
+
+        assert fall == True
+        assert state == PersonState.FALLEN
+
+    def test_initialization_invalid_bg_method(self):
+        """Test initialization with unknown bg_method."""
+        with pytest.raises(ValueError, match="Unknown bg_method"):
+            FallDetector(bg_method="KNN")
+
+    def test_proc_width_fall_detection(self):
+        """Test standing to lying fall is detected on downscaled frames."""
+        detector = FallDetector(
+            min_person_area=1000,
+            fall_velocity_threshold=0.2,
+            proc_width=320
+        )
+
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(20):
+            detector.detect(bg)
+
+        frame1 = bg.copy()
+        cv2.rectangle(frame1, (250, 100), (350, 400), (255, 255, 255), -1)
+        for _ in range(5):
+            detector.detect(frame1)
+
+        frame2 = bg.copy()
+        cv2.rectangle(frame2, (100, 350), (400, 400), (255, 255, 255), -1)
+
+        fall, state, bbox = detector.detect(frame2)
+
+        assert fall == True
+        assert state == PersonState.FALLEN
+
+    def test_initialization_invalid_proc_width(self):
+        """Test initialization with invalid proc_width."""
+        with pytest.raises(ValueError, match="proc_width must be positive"):
+            FallDetector(proc_width=0)
+
     def test_fall_callback(self):
         """Test fall callback is called."""
         callback_called = False
@@ -279,6 +382,17 @@ class TestFallDetector:
 
         assert output is not None
 
+    def test_draw_detection_all_states(self):
+        """Test every state's label is drawn with its cached size."""
+        detector = FallDetector()
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        bbox = (100, 100, 200, 150)
+
+        for state in PersonState:
+            output = detector.draw_detection(frame, bbox, state)
+            # Label background fills the band just above the box
+            assert output[95, 102].any()
+
     def test_draw_detection_no_bbox(self):
         """Test drawing with no bounding box."""
         detector = FallDetector()
@@ -288,6 +402,18 @@ class TestFallDetector:
 
         assert np.array_equal(output, frame)
 
+    def test_draw_detection_inplace(self):
+        """Test in-place drawing annotates and returns the input frame."""
+        detector = FallDetector()
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        bbox = (100, 100, 50, 150)
+
+        expected = detector.draw_detection(frame, bbox, PersonState.STANDING)
+        output = detector.draw_detection(frame, bbox, PersonState.STANDING, inplace=True)
+
+        assert output is frame
+        assert np.array_equal(frame, expected)
+
     def test_get_stats(self):
         """Test getting fall detection statistics."""
         detector = FallDetector()
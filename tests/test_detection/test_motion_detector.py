@@ -176,6 +176,43 @@ class TestMotionDetector:
 
         assert output is not None
 
+    def test_draw_motion_matches_rectangle(self):
+        """Test batched box drawing matches per-box cv2.rectangle."""
+        detector = MotionDetector()
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        boxes = [(100, 100, 50, 50), (200, 150, 120, 80), (10, 300, 5, 40)]
+
+        output = detector.draw_motion(frame, boxes, thickness=3)
+
+        expected = frame.copy()
+        for (x, y, w, h) in boxes:
+            cv2.rectangle(expected, (x, y), (x + w, y + h), (0, 255, 0), 3)
+            cv2.putText(expected, f"Motion {w}x{h}", (x, y - 10),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 3)
+        assert np.array_equal(output, expected)
+
+    def test_draw_motion_no_boxes(self):
+        """Test drawing with no boxes returns an unchanged copy."""
+        detector = MotionDetector()
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        output = detector.draw_motion(frame, [])
+
+        assert output is not frame
+        assert np.array_equal(output, frame)
+
+    def test_draw_motion_inplace(self):
+        """Test in-place drawing annotates and returns the input frame."""
+        detector = MotionDetector()
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        boxes = [(100, 100, 50, 50)]
+
+        expected = detector.draw_motion(frame, boxes)
+        output = detector.draw_motion(frame, boxes, inplace=True)
+
+        assert output is frame
+        assert np.array_equal(frame, expected)
+
     def test_get_stats(self):
         """Test getting motion statistics."""
         detector = MotionDetector()
@@ -247,6 +284,118 @@ class TestMotionDetector:
         assert motion == True
         assert len(boxes) >= 2  # Should detect both objects
 
+    def test_proc_width_boxes_in_frame_coordinates(self):
+        """Test downscaled detection reports boxes in full-frame pixels."""
+        detector = MotionDetector(min_area=100, proc_width=320)
+
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(20):
+            detector.detect(bg)
+
+        frame = bg.copy()
+        cv2.rectangle(frame, (100, 100), (250, 250), (255, 255, 255), -1)
+
+        motion, boxes = detector.detect(frame)
+
+        assert motion == True
+        x, y, w, h = max(boxes, key=lambda b: b[2] * b[3])
+        assert x <= 100 and x + w >= 250
+        assert y <= 100 and y + h >= 250
+
+    def test_proc_width_box_matches_full_resolution(self):
+        """Test downscaled boxes match full-size boxes, dilation included."""
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame = bg.copy()
+        cv2.rectangle(frame, (200, 100), (299, 199), (255, 255, 255), -1)
+
+        boxes = []
+        for proc_width in (None, 320):
+            detector = MotionDetector(min_area=100, proc_width=proc_width)
+            for _ in range(20):
+                detector.detect(bg)
+            _, found = detector.detect(frame)
+            boxes.append(found[0])
+
+        full, small = boxes
+        assert all(abs(a - b) <= 2 for a, b in zip(full, small))
+
+    def test_proc_width_min_area_in_frame_pixels(self):
+        """Test min_area still filters in full-frame pixels when downscaled."""
+        detector = MotionDetector(min_area=5000, proc_width=320)
+
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(20):
+            detector.detect(bg)
+
+        frame = bg.copy()
+        cv2.rectangle(frame, (100, 100), (120, 120), (255, 255, 255), -1)
+
+        motion, boxes = detector.detect(frame)
+
+        assert motion == False
+
+    def test_gray_matches_color_boxes(self):
+        """Test the luma-only model finds the same box as the color model."""
+        color = MotionDetector(min_area=100)
+        gray = MotionDetector(min_area=100, gray=True)
+
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(20):
+            color.detect(bg)
+            gray.detect(bg)
+
+        frame = bg.copy()
+        cv2.rectangle(frame, (100, 100), (250, 250), (255, 255, 255), -1)
+
+        assert gray.detect(frame) == color.detect(frame)
+
+    def test_gate_pixels_detects_change(self):
+        """Test the quick-reject gate lets changing frames through."""
+        detector = MotionDetector(min_area=100, gate_pixels=50)
+
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(20):
+            detector.detect(bg)
+
+        frame = bg.copy()
+        cv2.rectangle(frame, (100, 100), (200, 200), (255, 255, 255), -1)
+
+        motion, boxes = detector.detect(frame)
+
+        assert motion == True
+        assert len(boxes) > 0
+
+    def test_gate_pixels_skips_unchanged_frames(self):
+        """Test frames that match the previous one skip the background model."""
+        detector = MotionDetector(min_area=100, gate_pixels=50)
+
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        for _ in range(20):
+            detector.detect(bg)
+
+        frame = bg.copy()
+        cv2.rectangle(frame, (100, 100), (200, 200), (255, 255, 255), -1)
+        motion, _ = detector.detect(frame)
+        assert motion == True
+
+        # Without the gate the background model still flags the square
+        motion, boxes = detector.detect(frame)
+
+        assert motion == False
+        assert boxes == []
+        assert detector.get_stats()["motion_detected"] == False
+        assert detector.total_frames == 22
+
+    def test_initialization_invalid_gate_pixels(self):
+        """Test initialization with invalid gate_pixels."""
+        with pytest.raises(ValueError, match="gate_pixels"):
+            MotionDetector(gate_pixels=-1)
+
+    def test_initialization_invalid_proc_width(self):
+        """Test initialization with invalid proc_width."""
+        with pytest.raises(ValueError, match="proc_width must be positive"):
+            MotionDetector(proc_width=0)
+
     def test_pause_detection(self):
         """Test pausing motion detection."""
         detector = MotionDetector()
@@ -0,0 +1,141 @@
+"""
+Unit tests for PipelinedDetector.
+
+Test suite for running detector stages on separate threads,
+including result ordering and error propagation.
+
+Author: A.R. Ansari
+Email: ansarirahim1@gmail.com
+LinkedIn: https://www.linkedin.com/in/abdul-raheem-ansari-a6871320/
+Project: Raspberry Pi Smart Monitoring Kit
+"""
+
+import pytest
+import numpy as np
+import cv2
+from src.detection.motion_detector import MotionDetector
+from src.detection.fall_detector import FallDetector, PersonState
+from src.detection.pipeline import PipelinedDetector, detect_many
+
+
+def make_frames():
+    """Background frames followed by a moving square."""
+    bg = np.zeros((480, 640, 3), dtype=np.uint8)
+    frames = [bg] * 20
+    for x in range(50, 300, 50):
+        frame = bg.copy()
+        cv2.rectangle(frame, (x, 100), (x + 100, 200), (255, 255, 255), -1)
+        frames.append(frame)
+    return frames
+
+
+class TestPipelinedDetector:
+    """Test cases for PipelinedDetector class."""
+
+    def test_matches_serial_detection(self):
+        """Test pipelined results equal detect() on the same frames."""
+        frames = make_frames()
+        serial = MotionDetector(min_area=100)
+        expected = [serial.detect(frame) for frame in frames]
+
+        with PipelinedDetector(MotionDetector(min_area=100)) as pipeline:
+            for frame in frames:
+                pipeline.submit(frame)
+            results = [pipeline.get(timeout=5) for _ in frames]
+
+        assert [r[0] for r in results] == list(range(len(frames)))
+        assert [r[2] for r in results] == expected
+
+    def test_fall_detection(self):
+        """Test a standing to lying fall is detected through the pipeline."""
+        detector = FallDetector(min_person_area=1000, fall_velocity_threshold=0.2)
+        bg = np.zeros((480, 640, 3), dtype=np.uint8)
+        standing = bg.copy()
+        cv2.rectangle(standing, (250, 100), (350, 400), (255, 255, 255), -1)
+        lying = bg.copy()
+        cv2.rectangle(lying, (100, 350), (400, 400), (255, 255, 255), -1)
+        frames = [bg] * 20 + [standing] * 5 + [lying]
+
+        with PipelinedDetector(detector) as pipeline:
+            for frame in frames:
+                pipeline.submit(frame)
+            results = [pipeline.get(timeout=5)[2] for _ in frames]
+
+        fall, state, bbox = results[-1]
+        assert fall == True
+        assert state == PersonState.FALLEN
+        assert detector.fall_count == 1
+
+    def test_callback_error_raised_from_get(self):
+        """Test a failing frame raises from get() without stopping the pipeline."""
+        def callback(frame, boxes):
+            raise RuntimeError("callback failed")
+
+        frames = make_frames()
+        with PipelinedDetector(MotionDetector(min_area=100, motion_callback=callback)) as pipeline:
+            for frame in frames:
+                pipeline.submit(frame)
+
+            errors = 0
+            for _ in frames:
+                try:
+                    pipeline.get(timeout=5)
+                except RuntimeError as e:
+                    assert str(e) == "callback failed"
+                    errors += 1
+
+        # Every moving-square frame failed, and each still produced an entry
+        assert errors >= 5
+
+    def test_paused_detector(self):
+        """Test a paused detector yields the no-detection result."""
+        detector = MotionDetector()
+        detector.pause()
+
+        with PipelinedDetector(detector) as pipeline:
+            pipeline.submit(np.zeros((480, 640, 3), dtype=np.uint8))
+            _, _, result = pipeline.get(timeout=5)
+
+        assert result == (False, [])
+        assert detector.total_frames == 0
+
+    def test_submit_invalid_frame(self):
+        """Test submit with invalid frame."""
+        with PipelinedDetector(MotionDetector()) as pipeline:
+            with pytest.raises(ValueError, match="Invalid frame"):
+                pipeline.submit(None)
+
+    def test_initialization_invalid_queue_size(self):
+        """Test initialization with invalid queue_size."""
+        with pytest.raises(ValueError, match="queue_size"):
+            PipelinedDetector(MotionDetector(), queue_size=0)
+
+
+class TestDetectMany:
+    """Test cases for detect_many."""
+
+    def test_matches_serial_detection(self):
+        """Test concurrent per-camera detection equals serial detect()."""
+        frames = make_frames()
+        shifted = [np.roll(frame, 100, axis=0) for frame in frames]
+        serial = [MotionDetector(min_area=100), MotionDetector(min_area=100)]
+        concurrent = [MotionDetector(min_area=100), MotionDetector(min_area=100)]
+
+        for a, b in zip(frames, shifted):
+            expected = [serial[0].detect(a), serial[1].detect(b)]
+            assert detect_many(concurrent, [a, b]) == expected
+
+    def test_repeated_detector(self):
+        """Test a detector may not be run on two frames at once."""
+        detector = MotionDetector()
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        with pytest.raises(ValueError, match="only appear once"):
+            detect_many([detector, detector], [frame, frame])
+
+    def test_length_mismatch(self):
+        """Test detectors and frames must pair up."""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        with pytest.raises(ValueError, match="same length"):
+            detect_many([MotionDetector()], [frame, frame])
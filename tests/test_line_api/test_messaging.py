@@ -237,6 +237,30 @@ class TestLINEMessenger(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(mock_api.push_message.call_count, 2)
 
+    @patch('src.line_api.messaging.MessagingApi')
+    def test_send_alert_rate_limited(self, mock_messaging_api):
+        """Test 429 responses set the rate limit flag"""
+        error = Exception("Too Many Requests")
+        error.status = 429
+        error.headers = {"Retry-After": "1.5"}
+        mock_api = Mock()
+        mock_api.push_message.side_effect = [error, None]
+        mock_messaging_api.return_value = mock_api
+
+        messenger = LINEMessenger(
+            channel_access_token=self.token,
+            user_id=self.user_id,
+            send_snapshots=False,
+            max_retries=0
+        )
+
+        self.assertFalse(messenger.send_alert("motion"))
+        self.assertTrue(messenger.rate_limited)
+        self.assertEqual(messenger.retry_after, 1.5)
+
+        self.assertTrue(messenger.send_alert("motion"))
+        self.assertFalse(messenger.rate_limited)
+
     @patch('src.line_api.messaging.MessagingApi')
     def test_format_message(self, mock_messaging_api):
         """Test message formatting"""
@@ -11,8 +11,11 @@ import pytest
 import hmac
 import hashlib
 import json
+import socket
+import urllib.error
+import urllib.request
 from unittest.mock import Mock, patch, MagicMock
-from src.line_api.webhook import WebhookServer
+from src.line_api.webhook import WebhookServer, AIOHTTP_AVAILABLE
 
 
 class TestWebhookServer:
@@ -155,3 +158,58 @@ class TestWebhookServer:
         webhook_server.stop()
         assert not webhook_server.running
 
+    @pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not installed")
+    def test_start_async_server(self):
+        """Test aiohttp server handles health and webhook requests."""
+        server = WebhookServer(
+            channel_access_token="test_token",
+            channel_secret="test_secret",
+            host="127.0.0.1",
+            port=5002
+        )
+        server.start_async()
+        
+        try:
+            assert server.is_running()
+            
+            with urllib.request.urlopen("http://127.0.0.1:5002/health", timeout=5) as response:
+                assert json.loads(response.read())["status"] == "ok"
+            
+            req = urllib.request.Request(
+                "http://127.0.0.1:5002/webhook",
+                data=b"test",
+                headers={"X-Line-Signature": "invalid_signature"}
+            )
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(req, timeout=5)
+            assert exc_info.value.code == 400
+        finally:
+            server.stop()
+        
+        assert not server.is_running()
+        assert not server.server_thread.is_alive()
+
+    @pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not installed")
+    def test_start_async_port_in_use(self):
+        """Test a failed async start leaves the server stopped and cleaned up."""
+        blocker = socket.socket()
+        blocker.bind(("127.0.0.1", 0))
+        blocker.listen()
+        port = blocker.getsockname()[1]
+
+        server = WebhookServer(
+            channel_access_token="test_token",
+            channel_secret="test_secret",
+            host="127.0.0.1",
+            port=port
+        )
+        try:
+            server.start_async()
+
+            assert not server.is_running()
+            assert server._loop is None
+            assert server._runner is None
+            assert not server.server_thread.is_alive()
+        finally:
+            blocker.close()
+
@@ -46,7 +46,8 @@ class TestOTAUpdater:
             'auto_update': False,
             'backup_enabled': True,
             'backup_path': str(temp_dirs['backup_dir']),
-            'max_backups': 3
+            'max_backups': 3,
+            'release_cache_dir': str(temp_dirs['root'] / 'cache')
         }
     
     @pytest.fixture
@@ -84,7 +85,7 @@ class TestOTAUpdater:
         assert updater._running is True
         updater.stop()
     
-    @patch('src.ota.updater.requests.get')
+    @patch('src.ota.updater._SESSION.get')
     def test_get_latest_release_success(self, mock_get, updater):
         """Test getting latest release successfully."""
         mock_response = Mock()
@@ -101,7 +102,7 @@ class TestOTAUpdater:
         assert release['tag_name'] == 'v2.0.0'
         mock_get.assert_called_once()
     
-    @patch('src.ota.updater.requests.get')
+    @patch('src.ota.updater._SESSION.get')
     def test_get_latest_release_error(self, mock_get, updater):
         """Test getting latest release with error."""
         import requests
@@ -111,6 +112,39 @@ class TestOTAUpdater:
 
         assert release is None
     
+    @patch('src.ota.updater._SESSION.get')
+    def test_get_cached_release_fresh(self, mock_get, updater):
+        """Test fresh cache entry is served without a request."""
+        mock_response = Mock(status_code=200, headers={'ETag': '"abc"'})
+        mock_response.json.return_value = {'tag_name': 'v2.0.0'}
+        mock_get.return_value = mock_response
+
+        first = updater._get_cached_release()
+        second = updater._get_cached_release()
+
+        assert first == second == {'tag_name': 'v2.0.0'}
+        mock_get.assert_called_once()
+
+        updater._get_cached_release(force=True)
+        assert mock_get.call_count == 2
+
+    @patch('src.ota.updater._SESSION.get')
+    def test_get_cached_release_not_modified(self, mock_get, updater):
+        """Test stale cache entry is revalidated with its ETag."""
+        updater._save_release_cache({
+            'etag': '"abc"',
+            'last_modified': None,
+            'payload': {'tag_name': 'v2.0.0'},
+            'fetched_at': 0
+        })
+        mock_get.return_value = Mock(status_code=304)
+
+        release = updater._get_cached_release()
+
+        assert release == {'tag_name': 'v2.0.0'}
+        assert mock_get.call_args[1]['headers']['If-None-Match'] == '"abc"'
+        assert updater._load_release_cache()['fetched_at'] > 0
+
     @patch('src.ota.updater.OTAUpdater._get_latest_release')
     def test_check_for_updates_available(self, mock_get_release, updater):
         """Test checking for updates when update is available."""
@@ -147,10 +181,12 @@ class TestOTAUpdater:
         
         assert result is False
     
-    @patch('src.ota.updater.requests.get')
+    @patch('src.ota.updater._SESSION.head')
+    @patch('src.ota.updater._SESSION.get')
     @patch('builtins.open', new_callable=MagicMock)
-    def test_download_update_success(self, mock_open, mock_get, updater):
+    def test_download_update_success(self, mock_open, mock_get, mock_head, updater):
         """Test downloading update successfully."""
+        mock_head.return_value = Mock(headers={})
         updater._latest_release = {
             'tarball_url': 'https://example.com/tarball'
         }
@@ -169,6 +205,39 @@ class TestOTAUpdater:
         assert download_path is not None
         assert download_path.name == 'update_2.0.0.tar.gz'
     
+    @patch('src.ota.updater.MIN_PARALLEL_DOWNLOAD_SIZE', 0)
+    @patch('src.ota.updater._SESSION.get')
+    @patch('src.ota.updater._SESSION.head')
+    def test_download_update_ranges(self, mock_head, mock_get, updater):
+        """Test downloading update as parallel byte ranges."""
+        payload = bytes(range(256)) * 40
+        updater._latest_release = {'tarball_url': 'https://example.com/tarball'}
+        updater._latest_version = 'ranges-test'
+
+        mock_head.return_value = Mock(
+            url='https://example.com/tarball',
+            headers={'Accept-Ranges': 'bytes', 'Content-Length': str(len(payload))}
+        )
+
+        def ranged_get(url, headers, **kwargs):
+            start, end = map(int, headers['Range'][len('bytes='):].split('-'))
+            response = MagicMock(status_code=206)
+            response.__enter__.return_value = response
+            response.iter_content.return_value = [payload[start:end + 1]]
+            return response
+
+        mock_get.side_effect = ranged_get
+
+        download_path = updater.download_update()
+
+        try:
+            assert download_path is not None
+            assert download_path.read_bytes() == payload
+            assert mock_get.call_count == updater.max_download_threads
+        finally:
+            if download_path:
+                download_path.unlink()
+
     def test_download_update_no_release(self, updater):
         """Test downloading update with no release data."""
         updater._latest_release = None
@@ -225,6 +294,28 @@ class TestOTAUpdater:
 
         assert result is True
 
+    def test_track_rate_limit(self, updater):
+        """Test low rate limit defers the next check until reset."""
+        updater._track_rate_limit(Mock(headers={
+            'X-RateLimit-Remaining': '50', 'X-RateLimit-Reset': '2000000000'
+        }))
+        assert updater._rate_limit_reset == 0.0
+
+        updater._track_rate_limit(Mock(headers={
+            'X-RateLimit-Remaining': '3', 'X-RateLimit-Reset': '2000000000'
+        }))
+        assert updater._rate_limit_reset == 2000000000.0
+
+    def test_get_release_notes(self, updater):
+        """Test release notes preview."""
+        assert updater.get_release_notes() == ('', False)
+
+        updater._latest_release = {'body': 'x' * 600}
+        notes, truncated = updater.get_release_notes(max_chars=500)
+
+        assert len(notes) == 500
+        assert truncated is True
+
     def test_get_status(self, updater):
         """Test getting OTA status."""
         status = updater.get_status()
@@ -63,6 +63,25 @@ class TestConfigLoader:
         loader = ConfigLoader(str(config_file))
         assert loader.get("level1.level2.level3") == "deep_value"
     
+    def test_section(self, tmp_path, monkeypatch):
+        """Test getting a whole configuration section"""
+        config_file = tmp_path / "config.yaml"
+        config_data = {
+            "motion_detection": {"enabled": True, "sensitivity": 0.5}
+        }
+        
+        with open(config_file, 'w') as f:
+            yaml.dump(config_data, f)
+        
+        loader = ConfigLoader(str(config_file))
+        section = loader.section("motion_detection")
+        
+        assert section == {"enabled": True, "sensitivity": 0.5}
+        assert loader.section("missing") == {}
+        
+        monkeypatch.setenv("MOTION_DETECTION_SENSITIVITY", "0.9")
+        assert loader.section("motion_detection")["sensitivity"] == "0.9"
+    
     def test_get_default_value(self, tmp_path):
         """Test getting default value for missing key"""
         config_file = tmp_path / "config.yaml"
@@ -240,6 +240,69 @@ class TestVoiceAlertPlayer(unittest.TestCase):
 
         mock_pygame.mixer.stop.assert_called_once()
 
+    @patch('src.voice.alert_player.pygame')
+    @patch('src.voice.alert_player.os.path.exists')
+    def test_wait_playback_done(self, mock_exists, mock_pygame):
+        """Test waiting for playback to finish"""
+        mock_exists.return_value = True
+        mock_sound = MagicMock()
+        mock_sound.get_length.return_value = 0.05
+        mock_sound.play.return_value.get_busy.return_value = False
+        mock_pygame.mixer.Sound.return_value = mock_sound
+        mock_pygame.mixer.init.return_value = None
+
+        player = VoiceAlertPlayer(self.config)
+        self.assertTrue(player.play_alert('fall'))
+        self.assertFalse(player.playback_done.is_set())
+
+        self.assertTrue(player.wait_playback_done(timeout=2))
+
+    @patch('src.voice.alert_player.pygame')
+    @patch('src.voice.alert_player.os.path.exists')
+    def test_stop_sets_playback_done(self, mock_exists, mock_pygame):
+        """Test stopping playback releases waiters"""
+        mock_exists.return_value = True
+        mock_sound = MagicMock()
+        mock_sound.get_length.return_value = 60.0
+        mock_pygame.mixer.Sound.return_value = mock_sound
+        mock_pygame.mixer.init.return_value = None
+
+        player = VoiceAlertPlayer(self.config)
+        player.play_alert('fall')
+        player.stop()
+
+        self.assertTrue(player.wait_playback_done(timeout=0))
+
+    @patch('src.voice.alert_player.pygame')
+    @patch('src.voice.alert_player.os.path.exists')
+    def test_stale_end_check_ignored(self, mock_exists, mock_pygame):
+        """Test an end check for an earlier sound leaves the new one playing"""
+        mock_exists.return_value = True
+        mock_sound = MagicMock()
+        mock_sound.get_length.return_value = 60.0
+        mock_pygame.mixer.Sound.return_value = mock_sound
+        mock_pygame.mixer.init.return_value = None
+
+        player = VoiceAlertPlayer(self.config)
+        player.play_alert('fall')
+        first_generation = player._playback_gen
+        player.play_alert('fall')
+        current_timer = player._end_timer
+
+        # The first sound's timer fires late, with its channel now idle
+        idle_channel = MagicMock()
+        idle_channel.get_busy.return_value = False
+        player._check_playback_end(idle_channel, first_generation, 0)
+
+        # ...or re-arms while its channel still looks busy
+        busy_channel = MagicMock()
+        busy_channel.get_busy.return_value = True
+        player._check_playback_end(busy_channel, first_generation, 0)
+
+        self.assertFalse(player.playback_done.is_set())
+        self.assertIs(player._end_timer, current_timer)
+        player.stop()
+
     @patch('src.voice.alert_player.pygame')
     @patch('src.voice.alert_player.os.path.exists')
     def test_load_audio(self, mock_exists, mock_pygame):